@@ -0,0 +1,62 @@
+"""
+Benchmark de la classification tag_gc: ligne à ligne (apply) vs batch.
+
+Usage:
+    python -m benchmarks.bench_classification --rows 100000
+"""
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from src.utils.classification import classify_tag_gc, classify_tag_gc_batch
+
+
+SNIPPETS = [
+    "Génie civil et structures", "Ponts et ouvrages d'art", "Architecture et design",
+    "Hydraulique, traitement des eaux", "Minergie et développement durable",
+    "Stages EPFL et HEIG-VD", "Conseil immobilier", "Bureau d'études béton armé",
+    "Tiefbau und Wasserbau", "Géotechnique, fondations, talus", ""
+]
+
+
+def make_frame(rows: int, seed: int = 42) -> pd.DataFrame:
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        'specialites': [', '.join(rng.sample(SNIPPETS, 3)) if rng.random() < 0.9 else None
+                        for _ in range(rows)],
+        'company_name': [f"Bureau {rng.choice(['Alpes', 'Léman', 'Jura'])} {i} SA" for i in range(rows)]
+    })
+
+
+def classify_row_wise(df: pd.DataFrame) -> pd.Series:
+    def classify_row(row):
+        specialites = str(row.get('specialites', '')) if pd.notna(row.get('specialites')) else ''
+        company_name = str(row.get('company_name', '')) if pd.notna(row.get('company_name')) else ''
+        return classify_tag_gc(specialites, company_name)
+    return df.apply(classify_row, axis=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark classification")
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+
+    start = time.perf_counter()
+    row_wise = classify_row_wise(df)
+    row_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = classify_tag_gc_batch(df['specialites'], df['company_name'])
+    batch_time = time.perf_counter() - start
+
+    print(f"lignes: {args.rows}")
+    print(f"apply: {row_time:.2f}s  batch: {batch_time:.2f}s  (x{row_time / batch_time:.1f})")
+    print(f"identique: {(row_wise.to_numpy() == batch).all()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark de l'extraction de contacts: scans séparés (ancienne version) vs scan unique.
+
+Usage:
+    python -m benchmarks.bench_contacts --mb 1,4,16
+"""
+import argparse
+import random
+import re
+import time
+
+from src.crawler.html_extractor import extract_page
+from src.utils.regex_patterns import EMAIL_PATTERN, PHONE_CH_PATTERN, clean_email, extract_contacts
+
+
+BLOCKS = [
+    "<p>Notre bureau réalise des ouvrages d'art et des infrastructures depuis 1985.</p>",
+    "<div class=\"card\"><h3>Projet {i}</h3><p>Pont sur la Broye, 2019-2021, 1'250'000 CHF</p></div>",
+    "<p>Contact: <a href=\"mailto:info{i}@bureau-{i}.ch\">info{i}@bureau-{i}.ch</a></p>",
+    "<p>Tél. +41 21 {a} {b} {c} - Fax 021 {a} {b} {c}</p>",
+    "<p>Écrivez à secretariat{i} [at] ingenieurs-{i}.ch</p>",
+    "<script>var data = {{\"id\": {i}, \"ref\": \"00{a}{b}{c}{i}\"}};</script>",
+]
+
+
+def make_html(megabytes: float, seed: int = 42) -> str:
+    """
+    Page HTML synthétique de la taille demandée (contacts dispersés).
+    """
+    rng = random.Random(seed)
+    target = int(megabytes * 1024 * 1024)
+    parts, size, i = ["<html><body>"], 0, 0
+    while size < target:
+        block = rng.choice(BLOCKS).format(i=i % 500, a=rng.randrange(100, 1000),
+                                          b=rng.randrange(10, 100), c=rng.randrange(10, 100))
+        parts.append(block)
+        size += len(block)
+        i += 1
+    parts.append("</body></html>")
+    return '\n'.join(parts)
+
+
+def legacy_extract(text: str) -> dict:
+    """
+    Ancienne extraction: findall par type, nettoyage par match, dédup par liste.
+    """
+    emails = []
+    for match in EMAIL_PATTERN.findall(text):
+        cleaned = clean_email(match[0])
+        if cleaned and cleaned not in emails:
+            emails.append(cleaned)
+
+    phones = []
+    for match in PHONE_CH_PATTERN.findall(text):
+        # L'ancienne version recevait des tuples et ne produisait aucun téléphone
+        phone = f"+41 {' '.join(match)}"
+        phone = re.sub(r'[^\d+]', '', phone)
+        found = PHONE_CH_PATTERN.search(phone)
+        if found:
+            phone = f"+41 {found.group(1)} {found.group(2)} {found.group(3)} {found.group(4)}"
+        if phone not in phones:
+            phones.append(phone)
+    return {'emails': emails, 'phones': phones}
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark extraction de contacts")
+    parser.add_argument('--mb', type=str, default="1,4,16", help="Tailles des pages en Mo (default: 1,4,16)")
+    args = parser.parse_args()
+
+    print(f"{'Mo':>5} {'emails':>7} {'tél.':>6} {'legacy (s)':>11} {'scan (s)':>9} {'bytes (s)':>10} "
+          f"{'extract_page (s)':>17}")
+    for megabytes in [float(m) for m in args.mb.split(',')]:
+        html = make_html(megabytes)
+        legacy, legacy_time = timed(legacy_extract, html)
+        result, scan_time = timed(extract_contacts, html)
+        _, bytes_time = timed(extract_contacts, html.encode('utf-8'))
+        _, page_time = timed(extract_page, html)
+        print(f"{megabytes:>5g} {len(result['emails']):>7} {len(result['phones']):>6} {legacy_time:>11.2f} "
+              f"{scan_time:>9.2f} {bytes_time:>10.2f} {page_time:>17.2f}")
+
+
+if __name__ == '__main__':
+    main()
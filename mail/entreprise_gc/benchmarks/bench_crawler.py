@@ -0,0 +1,79 @@
+"""
+Benchmark de SiteEnricher sur une ferme de sites simulée (aucun réseau).
+
+Usage:
+    python -m benchmarks.bench_crawler --sites 200 --concurrency 50
+    python -m benchmarks.bench_crawler --sites 100 --error-rate 0.3 --latency 0.05,0.5
+"""
+import argparse
+import logging
+import time
+
+from src.crawler import SiteEnricher
+from src.utils.http_client import HttpClientPool
+from src.utils.retry_policy import RetryPolicy
+
+from .web_farm import WebFarm
+
+
+def run_crawl(farm: WebFarm, concurrency: int = 50, parse_workers: int = 0) -> dict:
+    """
+    Enrichit tous les sites de la ferme et mesure le débit.
+
+    Le rate limit et les attentes entre retries sont désactivés: seuls la
+    latence simulée et le coût du crawler sont mesurés.
+    """
+    farm.requests = 0
+    http = HttpClientPool(transport=farm.transport(), async_transport=farm.async_transport())
+    enricher = SiteEnricher(http=http, rate_limit=0, parse_workers=parse_workers)
+    enricher.retry_policy = RetryPolicy(max_attempts=enricher.max_retries, min_wait=0, max_wait=0)
+    items = [(url, None) for url in farm.urls()]
+
+    start = time.perf_counter()
+    if concurrency > 1:
+        results = enricher.enrich_many(items, concurrency=concurrency)
+    else:
+        results = []
+        for url, email in items:
+            try:
+                results.append(enricher.enrich_site(url, email))
+            except Exception as e:
+                results.append(e)
+    elapsed = time.perf_counter() - start
+    http.close()
+
+    found = sum(1 for r in results if isinstance(r, dict) and '@' in str(r.get('email') or ''))
+    return {
+        'sites': len(items),
+        'seconds': round(elapsed, 3),
+        'sites_per_s': round(len(items) / elapsed, 1) if elapsed else None,
+        'emails_found': found,
+        'requests': farm.requests,
+        'retries': enricher.retry_policy.retries,
+        'dead_domains': len(enricher.retry_policy.dead_domains)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark crawler (ferme simulée)")
+    parser.add_argument('--sites', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--parse-workers', type=int, default=0)
+    parser.add_argument('--latency', type=str, default="0.02,0.2",
+                        help="Latence min,max par requête en secondes (default: 0.02,0.2)")
+    parser.add_argument('--error-rate', type=float, default=0.1)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    low, high = (float(v) for v in args.latency.split(','))
+    farm = WebFarm.generate(args.sites, latency=(low, high), error_rate=args.error_rate)
+    stats = run_crawl(farm, args.concurrency, args.parse_workers)
+
+    print(f"sites: {stats['sites']}  concurrence: {args.concurrency}")
+    print(f"{stats['seconds']:.2f}s ({stats['sites_per_s']} sites/s), {stats['requests']} requêtes, "
+          f"{stats['retries']} retries, {stats['dead_domains']} domaines morts")
+    print(f"emails trouvés: {stats['emails_found']}")
+
+
+if __name__ == '__main__':
+    main()
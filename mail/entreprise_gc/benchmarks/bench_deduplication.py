@@ -0,0 +1,123 @@
+"""
+Benchmark de deduplicate_dataframe: ancienne version O(n²) vs index de hachage.
+
+Usage:
+    python -m benchmarks.bench_deduplication
+    python -m benchmarks.bench_deduplication --sizes 1000,10000,100000 --legacy-max 2000
+"""
+import argparse
+import time
+
+import pandas as pd
+from tldextract import extract as tld_extract
+
+from src.utils.deduplication import deduplicate_dataframe
+from src.utils.normalizers import extract_main_words, normalize_company_name
+
+from .synthetic import make_companies
+
+
+def legacy_deduplicate_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Version d'origine (iterrows imbriqués), conservée pour comparaison.
+    """
+    if df.empty:
+        return df
+
+    df = df.copy()
+    df['_name_normalized'] = df['company_name'].apply(normalize_company_name)
+    df['_main_words'] = df['company_name'].apply(extract_main_words)
+
+    def get_domain(row):
+        if pd.notna(row.get('site_web')) and row['site_web']:
+            try:
+                result = tld_extract(row['site_web'])
+                return result.registered_domain or result.domain
+            except:
+                pass
+        return None
+
+    df['_domain'] = df.apply(get_domain, axis=1)
+
+    def richness_score(row):
+        score = 0
+        for col in ['email', 'telephone', 'site_web', 'specialites', 'ville', 'canton']:
+            if pd.notna(row.get(col)) and row[col]:
+                score += 1
+        if pd.notna(row.get('email')) and row['email']:
+            from src.utils.regex_patterns import is_webmail
+            if not is_webmail(row['email']):
+                score += 2
+            elif 'formulaire' not in row['email'].lower():
+                score += 1
+        if pd.notna(row.get('email')) and row['email']:
+            generic = ['info@', 'contact@', 'office@', 'bureau@', 'info@']
+            if any(row['email'].lower().startswith(g) for g in generic):
+                score += 1
+        return score
+
+    df['_richness'] = df.apply(richness_score, axis=1)
+
+    keep_indices = []
+    used_indices = set()
+    for idx, row in df.iterrows():
+        if idx in used_indices:
+            continue
+        duplicates = [idx]
+        if pd.notna(row['_domain']) and row['_domain']:
+            for other_idx, other_row in df.iterrows():
+                if other_idx != idx and other_idx not in used_indices:
+                    if other_row['_domain'] == row['_domain']:
+                        duplicates.append(other_idx)
+        if len(duplicates) == 1:
+            for other_idx, other_row in df.iterrows():
+                if other_idx != idx and other_idx not in used_indices:
+                    if (other_row['_name_normalized'] == row['_name_normalized'] and
+                        pd.notna(other_row['ville']) and pd.notna(row['ville']) and
+                        other_row['ville'].strip().lower() == row['ville'].strip().lower()):
+                        duplicates.append(other_idx)
+        if len(duplicates) == 1:
+            for other_idx, other_row in df.iterrows():
+                if other_idx != idx and other_idx not in used_indices:
+                    if (other_row['_name_normalized'] == row['_name_normalized'] or
+                        (other_row['_main_words'] == row['_main_words'] and row['_main_words'])):
+                        duplicates.append(other_idx)
+        best_idx = max(duplicates, key=lambda i: df.loc[i, '_richness']) if len(duplicates) > 1 else idx
+        keep_indices.append(best_idx)
+        used_indices.update(duplicates)
+
+    result = df.loc[keep_indices].copy()
+    result = result.drop(columns=['_name_normalized', '_main_words', '_domain', '_richness'], errors='ignore')
+    return result.reset_index(drop=True)
+
+
+def timed(func, df):
+    start = time.perf_counter()
+    result = func(df)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark déduplication")
+    parser.add_argument('--sizes', type=str, default="1000,10000,100000",
+                        help="Tailles à tester (default: 1000,10000,100000)")
+    parser.add_argument('--legacy-max', type=int, default=2000,
+                        help="Taille max pour l'ancienne version, quadratique (default: 2000)")
+    args = parser.parse_args()
+
+    print(f"{'lignes':>8} {'sortie':>8} {'index (s)':>10} {'legacy (s)':>11} {'identique':>10}")
+    for size in [int(s) for s in args.sizes.split(',')]:
+        df = make_companies(size)
+        new_result, new_time = timed(deduplicate_dataframe, df)
+
+        legacy_time, same = '-', '-'
+        if size <= args.legacy_max:
+            legacy_result, elapsed = timed(legacy_deduplicate_dataframe, df)
+            legacy_time = f"{elapsed:.2f}"
+            same = str(new_result.equals(legacy_result))
+
+        print(f"{size:>8} {len(new_result):>8} {new_time:>10.2f} {legacy_time:>11} {same:>10}")
+
+
+if __name__ == '__main__':
+    main()
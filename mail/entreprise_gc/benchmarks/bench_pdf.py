@@ -0,0 +1,96 @@
+"""
+Benchmark du parseur SIA Vaud: extraction séquentielle, par processus et depuis le cache.
+
+Le PDF synthétique (annuaire de membres, plusieurs entrées par page) est
+écrit sans dépendance: objets PDF, police Helvetica standard.
+
+Usage:
+    python -m benchmarks.bench_pdf --pages 300 --workers 4
+"""
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from src.sources.sia_pdf_vaud import parse_sia_pdf_vaud
+
+from .synthetic import CITIES, FAMILY_NAMES, LEGAL_FORMS, strip_accents
+
+
+def _escape(line: str) -> bytes:
+    text = line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+    return text.encode('cp1252', errors='replace')
+
+
+def write_pdf(path: Path, pages: List[List[str]]) -> Path:
+    """
+    Écrit un PDF minimal: une ligne de texte par entrée de pages[i].
+    """
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"]
+    kids = []
+    for lines in pages:
+        stream = b"BT /F1 10 Tf 14 TL 50 800 Td " + b" T* ".join(
+            b"(" + _escape(line) + b") Tj" for line in lines) + b" ET"
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects))
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [" + b" ".join(kids) + b"] /Count %d >>" % len(kids)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    Path(path).write_bytes(bytes(out))
+    return Path(path)
+
+
+def make_directory_pdf(path: Path, n_pages: int, per_page: int = 8, seed: int = 42) -> Path:
+    """
+    Annuaire synthétique de n_pages pages (per_page membres par page).
+    """
+    rng = random.Random(seed)
+    pages = []
+    for page in range(n_pages):
+        lines = []
+        for entry in range(per_page):
+            i = page * per_page + entry
+            name = f"{rng.choice(FAMILY_NAMES)} Ingénieurs {i} {rng.choice(LEGAL_FORMS)}".strip()
+            slug = strip_accents(name.split()[0]).lower()
+            lines += [name, f"Rue du Lac {i % 90 + 1}, {rng.choice(CITIES['VD'])} Vaud",
+                      f"Tél. +41 21 {rng.randrange(100, 1000)} {rng.randrange(10, 100)} "
+                      f"{rng.randrange(10, 100)}",
+                      f"info@{slug}-{i}.ch", f"https://www.{slug}-{i}.ch"]
+        pages.append(lines)
+    return write_pdf(path, pages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parseur PDF SIA Vaud")
+    parser.add_argument('--pages', type=int, default=300)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = make_directory_pdf(Path(tmp) / 'sia.pdf', args.pages)
+        cache_dir = Path(tmp) / 'cache'
+        for label, options in (("séquentiel", {}),
+                               (f"{args.workers} processus", {'workers': args.workers}),
+                               (f"{args.workers} processus + cache (1er run)",
+                                {'workers': args.workers, 'cache_dir': cache_dir}),
+                               ("cache (re-run)", {'cache_dir': cache_dir})):
+            start = time.perf_counter()
+            df = parse_sia_pdf_vaud(str(pdf_path), **options)
+            print(f"{label:<36} {time.perf_counter() - start:>7.2f}s  {len(df)} entrées")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+"""
+Suite de benchmarks et fichier de référence (baseline.json).
+
+Mesure déduplication, classification et normalisation sur les jeux
+synthétiques, l'extraction de contacts sur une page HTML de plusieurs Mo et
+le crawler sur la ferme simulée. Les résultats sont écrits
+en JSON (--write) ou comparés à la référence (--compare): une mesure plus
+lente que la référence au-delà de la tolérance fait échouer la commande.
+
+Usage:
+    python -m benchmarks.run_baseline --write
+    python -m benchmarks.run_baseline --compare --tolerance 0.25
+    python -m benchmarks.run_baseline --sizes 1000,10000,100000,1000000 --write
+"""
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+from .synthetic import make_companies
+
+
+BASELINE_PATH = Path(__file__).parent / 'baseline.json'
+
+
+def _best_of(func: Callable, repeat: int) -> float:
+    """
+    Meilleur temps sur repeat exécutions (réduit le bruit de la machine).
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _measure(rows: int, func: Callable, repeat: int) -> dict:
+    seconds = _best_of(func, repeat)
+    return {'rows': rows, 'seconds': round(seconds, 4),
+            'rows_per_s': round(rows / seconds, 1) if seconds else None}
+
+
+def bench_frames(sizes, repeat: int) -> Dict[str, dict]:
+    """
+    Étapes DataFrame: normalisation, déduplication, classification.
+    """
+    from src.pipeline import add_classifications, normalize_dataframe
+    from src.utils.deduplication import deduplicate_dataframe
+
+    results = {}
+    for size in sizes:
+        df = make_companies(size)
+        normalized = normalize_dataframe(df)
+        results[f"normalize/{size}"] = _measure(size, lambda: normalize_dataframe(df), repeat)
+        results[f"deduplicate/{size}"] = _measure(size, lambda: deduplicate_dataframe(normalized), repeat)
+        results[f"classify/{size}"] = _measure(size, lambda: add_classifications(normalized), repeat)
+    return results
+
+
+def bench_contacts(megabytes: float, repeat: int) -> Dict[str, dict]:
+    """
+    Extraction de contacts sur une page HTML synthétique de plusieurs Mo.
+    """
+    from src.crawler.html_extractor import extract_page
+    from src.utils.regex_patterns import extract_contacts
+
+    from .bench_contacts import make_html
+
+    html = make_html(megabytes)
+    size = len(html.encode('utf-8'))
+    results = {}
+    for name, func in ((f"contacts/{megabytes:g}MB", extract_contacts),
+                       (f"extract_page/{megabytes:g}MB", extract_page)):
+        seconds = _best_of(lambda: func(html), repeat)
+        results[name] = {'bytes': size, 'seconds': round(seconds, 4),
+                         'mb_per_s': round(size / 1024 / 1024 / seconds, 2) if seconds else None}
+    return results
+
+
+def bench_crawl(sites: int, concurrency: int) -> Dict[str, dict]:
+    """
+    Crawler sur la ferme simulée (latence fixe pour des mesures stables).
+    """
+    from .bench_crawler import run_crawl
+    from .web_farm import WebFarm
+
+    farm = WebFarm.generate(sites, latency=(0.02, 0.02), error_rate=0.1)
+    stats = run_crawl(farm, concurrency=concurrency)
+    return {f"crawl/{sites}x{concurrency}": {
+        'rows': stats['sites'], 'seconds': stats['seconds'], 'rows_per_s': stats['sites_per_s'],
+        'requests': stats['requests'], 'emails_found': stats['emails_found']
+    }}
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, cwd=Path(__file__).parent).stdout.strip()
+    except OSError:
+        return ''
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> bool:
+    """
+    Affiche le ratio temps/référence de chaque mesure; False si régression.
+    """
+    ok = True
+    print(f"{'mesure':<28} {'réf (s)':>9} {'actuel (s)':>10} {'ratio':>7}")
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference or not reference.get('seconds'):
+            print(f"{name:<28} {'-':>9} {result['seconds']:>10.3f} {'nouveau':>7}")
+            continue
+        ratio = result['seconds'] / reference['seconds']
+        flag = ''
+        if ratio > 1 + tolerance:
+            flag, ok = '  RÉGRESSION', False
+        print(f"{name:<28} {reference['seconds']:>9.3f} {result['seconds']:>10.3f} {ratio:>7.2f}{flag}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de benchmarks et baseline")
+    parser.add_argument('--sizes', type=str, default="1000,10000,100000",
+                        help="Tailles des jeux synthétiques (default: 1000,10000,100000)")
+    parser.add_argument('--crawl-sites', type=int, default=200,
+                        help="Sites de la ferme simulée, 0 = pas de benchmark crawler (default: 200)")
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--html-mb', type=float, default=4,
+                        help="Taille de la page du benchmark de contacts, 0 = ignoré (default: 4)")
+    parser.add_argument('--repeat', type=int, default=3, help="Exécutions par mesure (meilleur temps)")
+    parser.add_argument('--baseline', type=str, default=str(BASELINE_PATH))
+    parser.add_argument('--write', action='store_true', help="Écrire les résultats comme référence")
+    parser.add_argument('--compare', action='store_true', help="Comparer à la référence")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Ralentissement toléré avant régression (default: 0.25 = +25%%)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    sizes = [int(s) for s in args.sizes.split(',')]
+    results = bench_frames(sizes, args.repeat)
+    if args.html_mb:
+        results.update(bench_contacts(args.html_mb, args.repeat))
+    if args.crawl_sites:
+        results.update(bench_crawl(args.crawl_sites, args.concurrency))
+
+    baseline_path = Path(args.baseline)
+    ok = True
+    if args.compare:
+        if not baseline_path.exists():
+            print(f"Pas de référence: {baseline_path} (lancer avec --write)")
+            return 1
+        baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+        ok = compare(results, baseline['results'], args.tolerance)
+    else:
+        for name, result in results.items():
+            rate = (f"{result['rows_per_s'] or 0:>12.0f} lignes/s" if 'rows_per_s' in result
+                    else f"{result['mb_per_s'] or 0:>12.2f} Mo/s")
+            print(f"{name:<28} {result['seconds']:>9.3f}s {rate}")
+
+    if args.write:
+        baseline_path.write_text(json.dumps({
+            'meta': {
+                'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'commit': _git_commit(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'repeat': args.repeat
+            },
+            'results': results
+        }, indent=2) + '\n', encoding='utf-8')
+        print(f"Référence écrite: {baseline_path}")
+
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Jeux de données synthétiques d'entreprises suisses pour les benchmarks.
+
+Noms réalistes (formes juridiques, accents, noms de famille, régions),
+coordonnées cohérentes avec le nom et doublons variés: forme juridique
+ajoutée ou traduite, accents/casse perdus, site avec ou sans www, champs
+manquants. Déterministe pour une graine donnée.
+"""
+import random
+import unicodedata
+from typing import Optional
+
+import pandas as pd
+
+
+FAMILY_NAMES = ['Müller', 'Meier', 'Schmid', 'Keller', 'Weber', 'Favre', 'Rochat', 'Gerber',
+                'Perrin', 'Bühler', 'Zürcher', 'Dubois', 'Rossier', 'Bonvin', 'Crettenand',
+                'Jaccard', 'Python', 'Pittet', 'Vuilleumier', 'Gächter', 'Frésard', 'Chèvre']
+ACTIVITIES = ['Ingénieurs civils', 'Génie civil', 'Bureau d\'ingénieurs', 'Structures',
+              'Ingenieurbüro', 'Bauingenieure', 'Géotechnique', 'Hydraulique', 'Ponts et chaussées',
+              'Géomètres', 'Études techniques', 'Tiefbau', 'Architecture', 'Conseils en énergie']
+REGIONS = ['Léman', 'Alpes', 'Jura', 'Rhône', 'Sarine', 'Chablais', 'Gruyère', 'Riviera',
+           'Lavaux', 'Broye', 'Entremont', 'Val-de-Travers']
+LEGAL_FORMS = ['SA', 'Sàrl', 'AG', 'GmbH', 'Sagl', 'SA', 'Sàrl', '']
+# Variantes de forme juridique rencontrées d'une source à l'autre
+LEGAL_VARIANTS = {'SA': 'AG', 'AG': 'SA', 'Sàrl': 'GmbH', 'GmbH': 'Sàrl', 'Sagl': 'Sàrl', '': 'SA'}
+CITIES = {
+    'VD': ['Lausanne', 'Yverdon-les-Bains', 'Nyon', 'Morges', 'Montreux', 'Vevey'],
+    'GE': ['Genève', 'Carouge', 'Meyrin', 'Vernier'],
+    'VS': ['Sion', 'Martigny', 'Monthey', 'Sierre', 'Brig'],
+    'FR': ['Fribourg', 'Bulle', 'Morat', 'Düdingen'],
+    'NE': ['Neuchâtel', 'La Chaux-de-Fonds', 'Le Locle'],
+    'JU': ['Delémont', 'Porrentruy', 'Saignelégier'],
+}
+CANTON_AREA = {'VD': '21', 'GE': '22', 'VS': '27', 'FR': '26', 'NE': '32', 'JU': '32'}
+SPECIALITES = ['Génie civil', 'Structures', 'Ponts', 'Béton armé', 'Hydraulique', 'Routes',
+               'Géotechnique', 'Architecture', 'Expertises', 'Tiefbau', 'Minergie', 'Assainissement']
+
+
+def strip_accents(text: str) -> str:
+    return unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode()
+
+
+def _slug(text: str) -> str:
+    return '-'.join(strip_accents(text).lower().replace('\'', ' ').split())
+
+
+def _company(rng: random.Random, i: int) -> dict:
+    canton = rng.choice(list(CITIES))
+    pattern = rng.randrange(3)
+    if pattern == 0:
+        base = f"{rng.choice(FAMILY_NAMES)} {rng.choice(ACTIVITIES)}"
+    elif pattern == 1:
+        base = f"{rng.choice(FAMILY_NAMES)} & {rng.choice(FAMILY_NAMES)} {rng.choice(ACTIVITIES)}"
+    else:
+        base = f"{rng.choice(ACTIVITIES)} {rng.choice(REGIONS)}"
+    # Suffixe numérique: noms uniques hors doublons volontaires
+    base = f"{base} {i}"
+    form = rng.choice(LEGAL_FORMS)
+    domain = f"{_slug(base)}.ch"
+    has_site = rng.random() < 0.8
+    return {
+        'company_name': f"{base} {form}".strip(),
+        'canton': canton,
+        'ville': rng.choice(CITIES[canton]),
+        'site_web': f"https://www.{domain}" if has_site else None,
+        'email': f"{rng.choice(['info', 'contact', 'bureau'])}@{domain}" if has_site and rng.random() < 0.5 else None,
+        'telephone': (f"+41 {CANTON_AREA[canton]} {rng.randrange(100, 1000)} "
+                      f"{rng.randrange(10, 100)} {rng.randrange(10, 100)}") if rng.random() < 0.6 else None,
+        'specialites': ', '.join(rng.sample(SPECIALITES, 3)) if rng.random() < 0.7 else None,
+        'source': rng.choice(['suisse.ing', 'sia_vaud']),
+    }
+
+
+def _duplicate(rng: random.Random, original: dict) -> dict:
+    row = dict(original)
+    variant = rng.randrange(5)
+    name = row['company_name']
+    if variant == 0:
+        # Forme juridique traduite ou ajoutée
+        parts = name.rsplit(' ', 1)
+        if len(parts) == 2 and parts[1] in LEGAL_VARIANTS:
+            row['company_name'] = f"{parts[0]} {LEGAL_VARIANTS[parts[1]]}".strip()
+        else:
+            row['company_name'] = f"{name} SA"
+    elif variant == 1:
+        # Accents et casse perdus (saisie d'une autre source)
+        row['company_name'] = strip_accents(name).upper()
+    elif variant == 2:
+        row['site_web'] = row['site_web'].replace('https://www.', 'http://') + '/' if row['site_web'] else None
+    elif variant == 3:
+        row['site_web'] = None
+        row['email'] = None
+    else:
+        row['telephone'] = None
+        row['specialites'] = None
+    row['source'] = 'suisse.ing' if original['source'] == 'sia_vaud' else 'sia_vaud'
+    return row
+
+
+def make_companies(n: int, duplicate_rate: float = 0.2, seed: int = 42,
+                   cantons: Optional[list] = None) -> pd.DataFrame:
+    """
+    Génère n fiches d'entreprises dont une part sont des doublons.
+
+    Args:
+        n: Nombre de lignes (1k à 1M)
+        duplicate_rate: Part des lignes qui dupliquent une fiche précédente
+        seed: Graine (jeu reproductible)
+        cantons: Cantons conservés (None = tous)
+
+    Returns:
+        DataFrame au schéma des sources (company_name, canton, ville, site_web,
+        email, telephone, specialites, source)
+    """
+    rng = random.Random(seed)
+    rows = []
+    originals = []
+    while len(rows) < n:
+        if originals and rng.random() < duplicate_rate:
+            rows.append(_duplicate(rng, rng.choice(originals)))
+            continue
+        row = _company(rng, len(rows))
+        if cantons and row['canton'] not in cantons:
+            row['canton'] = rng.choice(cantons)
+            row['ville'] = rng.choice(CITIES[row['canton']])
+        originals.append(row)
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+__all__ = ['make_companies', 'strip_accents']
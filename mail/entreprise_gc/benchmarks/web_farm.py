@@ -0,0 +1,178 @@
+"""
+Ferme de sites web simulée pour les benchmarks du crawler.
+
+Les sites sont servis par httpx.MockTransport (aucun réseau): pages
+d'accueil, pages de contact, robots.txt/sitemap optionnels, latence et taux
+d'erreur configurables. Le handler async attend avec asyncio.sleep pour que
+la latence se recouvre comme sur le réseau.
+"""
+import asyncio
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+
+HOME_TEMPLATE = """<html><head><title>{name}</title></head><body>
+<nav>{nav}</nav>
+<h1>{name}</h1>
+<section class="services"><h2>Prestations</h2><p>Génie civil, structures, ponts</p></section>
+{filler}
+{contact}
+</body></html>"""
+
+CONTACT_TEMPLATE = """<html><body><h1>Contact</h1>
+<p>{name}<br>Rue du Lac 12, 1000 Lausanne</p>
+<p>Tél. +41 21 123 45 67 - <a href="mailto:{email}">{email}</a></p>
+</body></html>"""
+
+FILLER = "<p>Notre bureau réalise des projets d'infrastructure depuis 1985.</p>\n"
+
+
+class SiteProfile:
+    """
+    Comportement d'un site simulé.
+    """
+
+    def __init__(self, domain: str, email_on: Optional[str] = 'home', contact_path: str = '/contact',
+                 failure: Optional[str] = None, latency: float = 0.0, page_kb: int = 20,
+                 robots: bool = False):
+        """
+        Args:
+            domain: Domaine (ex: bureau-1.ch)
+            email_on: 'home', 'linked' (page liée), 'probe' (page non liée) ou None
+            contact_path: Chemin de la page de contact
+            failure: None, 'dns' (domaine inexistant), 'timeout', 'server' (503) ou 'not_found'
+            latency: Latence par requête (secondes)
+            page_kb: Taille approximative de la page d'accueil (Ko)
+            robots: Servir un robots.txt (sinon 404)
+        """
+        self.domain = domain
+        self.email_on = email_on
+        self.contact_path = contact_path
+        self.failure = failure
+        self.latency = latency
+        self.page_kb = page_kb
+        self.robots = robots
+
+    @property
+    def url(self) -> str:
+        return f"https://www.{self.domain}"
+
+    @property
+    def email(self) -> str:
+        return f"info@{self.domain}"
+
+
+class WebFarm:
+    """
+    Ensemble de sites simulés et compteurs de requêtes servies.
+    """
+
+    def __init__(self, sites: Dict[str, SiteProfile]):
+        self.sites = sites
+        self.requests = 0
+        self.bytes_served = 0
+        self.by_status = {}
+
+    @classmethod
+    def generate(cls, n_sites: int, latency: Tuple[float, float] = (0.02, 0.2),
+                 error_rate: float = 0.1, page_kb: int = 20, robots_rate: float = 0.3,
+                 seed: int = 42) -> 'WebFarm':
+        """
+        Génère n_sites profils variés.
+
+        Args:
+            n_sites: Nombre de sites
+            latency: Latence min/max par requête (secondes)
+            error_rate: Part des sites en échec (DNS, timeout, 503, 404)
+            page_kb: Taille moyenne des pages d'accueil (Ko)
+            robots_rate: Part des sites servant un robots.txt
+            seed: Graine (ferme reproductible)
+        """
+        rng = random.Random(seed)
+        sites = {}
+        for i in range(n_sites):
+            domain = f"bureau-{i}.ch"
+            sites[domain] = SiteProfile(
+                domain=domain,
+                email_on=rng.choices(['home', 'linked', 'probe', None], weights=[5, 3, 1, 1])[0],
+                contact_path=rng.choice(['/contact', '/kontakt', '/impressum', '/fr/contact']),
+                failure=(rng.choice(['dns', 'timeout', 'server', 'not_found'])
+                         if rng.random() < error_rate else None),
+                latency=rng.uniform(*latency),
+                page_kb=max(1, int(rng.gauss(page_kb, page_kb / 3))),
+                robots=rng.random() < robots_rate
+            )
+        return cls(sites)
+
+    def urls(self) -> List[str]:
+        return [site.url for site in self.sites.values()]
+
+    def _site(self, request: httpx.Request) -> Optional[SiteProfile]:
+        return self.sites.get(request.url.host.removeprefix('www.'))
+
+    def _respond(self, request: httpx.Request, site: Optional[SiteProfile]) -> httpx.Response:
+        if site is None or site.failure == 'dns':
+            raise httpx.ConnectError("[Errno -2] Name or service not known", request=request)
+        if site.failure == 'timeout':
+            raise httpx.ReadTimeout("simulated timeout", request=request)
+        if site.failure == 'server':
+            return self._html(503, "<h1>Service Unavailable</h1>", headers={'Retry-After': '0'})
+        if site.failure == 'not_found':
+            return self._html(404, "<h1>Not Found</h1>")
+
+        path = request.url.path.rstrip('/') or '/'
+        if path == '/robots.txt':
+            if not site.robots:
+                return self._html(404, "")
+            return httpx.Response(200, headers={'Content-Type': 'text/plain'},
+                                  text="User-agent: *\nDisallow: /admin\n")
+        if path == '/':
+            nav = f'<a href="{site.contact_path}">Contact</a>' if site.email_on == 'linked' else ''
+            contact = f'<footer><a href="mailto:{site.email}">{site.email}</a></footer>' \
+                if site.email_on == 'home' else ''
+            filler = FILLER * max(1, site.page_kb * 1024 // len(FILLER.encode()))
+            return self._html(200, HOME_TEMPLATE.format(name=site.domain, nav=nav, filler=filler,
+                                                        contact=contact))
+        if path == site.contact_path and site.email_on in ('linked', 'probe'):
+            return self._html(200, CONTACT_TEMPLATE.format(name=site.domain, email=site.email))
+        return self._html(404, "<h1>Not Found</h1>")
+
+    def _html(self, status: int, body: str, headers: Optional[dict] = None) -> httpx.Response:
+        return httpx.Response(status, headers={'Content-Type': 'text/html; charset=utf-8', **(headers or {})},
+                              text=body)
+
+    def _count(self, response: httpx.Response) -> httpx.Response:
+        self.requests += 1
+        self.bytes_served += len(response.content)
+        self.by_status[response.status_code] = self.by_status.get(response.status_code, 0) + 1
+        return response
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        site = self._site(request)
+        if site is not None and site.latency:
+            time.sleep(site.latency)
+        return self._count(self._respond(request, site))
+
+    async def ahandle(self, request: httpx.Request) -> httpx.Response:
+        site = self._site(request)
+        if site is not None and site.latency:
+            await asyncio.sleep(site.latency)
+        return self._count(self._respond(request, site))
+
+    def transport(self) -> httpx.MockTransport:
+        """
+        Transport sync (HttpClientPool(transport=...)).
+        """
+        return httpx.MockTransport(self.handle)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """
+        Transport async (HttpClientPool(async_transport=...)).
+        """
+        return httpx.MockTransport(self.ahandle)
+
+
+__all__ = ['SiteProfile', 'WebFarm']
@@ -0,0 +1,167 @@
+"""
+Stockage compact des entreprises: enregistrements à slots et table en colonnes.
+
+Les scrapers produisent des Company (sans __dict__ par instance), la table
+les range colonne par colonne dans un DataFrame dont les colonnes à faible
+cardinalité (canton, ville, source_url, tag_gc) sont catégorielles: chaque
+valeur distincte est stockée une fois, les lignes ne portent qu'un code
+entier. Les tranches (slice, batches) sont des vues: pas de copie entre
+étapes tant qu'aucune colonne n'est modifiée (copy-on-write pandas).
+"""
+from typing import Iterable, Iterator, List, Optional, Union
+
+import pandas as pd
+
+
+# Colonnes produites par les sources
+SOURCE_COLUMNS = ('company_name', 'canton', 'ville', 'site_web', 'email', 'telephone', 'source_url')
+
+# Colonnes codées par dictionnaire (peu de valeurs distinctes)
+CATEGORICAL_COLUMNS = ('canton', 'ville', 'source_url', 'tag_gc')
+
+
+class Company:
+    """
+    Entreprise extraite par un scraper (champs absents = None).
+    """
+
+    __slots__ = SOURCE_COLUMNS
+
+    def __init__(self, company_name: Optional[str] = None, canton: Optional[str] = None,
+                 ville: Optional[str] = None, site_web: Optional[str] = None,
+                 email: Optional[str] = None, telephone: Optional[str] = None,
+                 source_url: Optional[str] = None):
+        self.company_name = company_name
+        self.canton = canton
+        self.ville = ville
+        self.site_web = site_web
+        self.email = email
+        self.telephone = telephone
+        self.source_url = source_url
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in SOURCE_COLUMNS
+                           if getattr(self, name) is not None)
+        return f"Company({fields})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Company):
+            return NotImplemented
+        return self.as_tuple() == other.as_tuple()
+
+    def as_tuple(self) -> tuple:
+        return tuple(getattr(self, name) for name in SOURCE_COLUMNS)
+
+
+def encode_categoricals(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Code en catégories les colonnes de CATEGORICAL_COLUMNS présentes (en place).
+    """
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    return df
+
+
+def set_value(df: pd.DataFrame, idx, col: str, value) -> None:
+    """
+    df.at[idx, col] = value, en ajoutant la catégorie si la colonne est catégorielle.
+    """
+    dtype = df[col].dtype if col in df.columns else None
+    if isinstance(dtype, pd.CategoricalDtype) and value is not None and value not in dtype.categories:
+        df[col] = df[col].cat.add_categories([value])
+    df.at[idx, col] = value
+
+
+class CompanyTable:
+    """
+    Table d'entreprises en colonnes, catégorielles pour canton/ville/source_url/tag_gc.
+
+    La table enveloppe un DataFrame (attribut frame) que les étapes du
+    pipeline continuent de recevoir; elle ne sert qu'à le construire
+    sans passer par des dicts et à le découper sans copie.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = encode_categoricals(frame)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Company]) -> 'CompanyTable':
+        """
+        Construit la table colonne par colonne depuis des Company.
+        """
+        records = list(records)
+        columns = {name: [getattr(record, name) for record in records] for name in SOURCE_COLUMNS}
+        return cls(pd.DataFrame(columns, columns=list(SOURCE_COLUMNS), dtype=object))
+
+    @classmethod
+    def empty(cls) -> 'CompanyTable':
+        return cls.from_records([])
+
+    @classmethod
+    def concat(cls, parts: List[Union['CompanyTable', pd.DataFrame]]) -> 'CompanyTable':
+        """
+        Concatène des tables en conservant les colonnes catégorielles.
+
+        pd.concat retombe sur des objets quand les catégories diffèrent:
+        les catégories sont d'abord unifiées.
+        """
+        frames = [part.frame if isinstance(part, CompanyTable) else part for part in parts]
+        if not frames:
+            return cls.empty()
+        for col in CATEGORICAL_COLUMNS:
+            present = [frame for frame in frames if col in frame.columns]
+            if not present:
+                continue
+            categories = pd.Index([])
+            for frame in present:
+                values = frame[col]
+                uniques = (values.cat.categories if isinstance(values.dtype, pd.CategoricalDtype)
+                           else pd.Index(values.dropna().unique()))
+                categories = categories.append(uniques.difference(categories))
+            dtype = pd.CategoricalDtype(categories)
+            frames = [frame.assign(**{col: frame[col].astype(dtype)}) if col in frame.columns else frame
+                      for frame in frames]
+        return cls(pd.concat(frames, ignore_index=True))
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def slice(self, start: int, stop: Optional[int] = None) -> 'CompanyTable':
+        """
+        Lignes [start, stop) sans copie des données.
+        """
+        return CompanyTable(self.frame.iloc[start:stop])
+
+    def batches(self, size: int) -> Iterator['CompanyTable']:
+        """
+        Tranches successives d'au plus size lignes.
+        """
+        for start in range(0, len(self.frame), size):
+            yield self.slice(start, start + size)
+
+    def records(self) -> Iterator[Company]:
+        """
+        Relit la table sous forme de Company (colonnes de SOURCE_COLUMNS).
+        """
+        columns = [self.frame[name] if name in self.frame.columns else [None] * len(self.frame)
+                   for name in SOURCE_COLUMNS]
+        for values in zip(*columns):
+            yield Company(*(None if pd.isna(value) else value for value in values))
+
+    def memory_usage(self) -> int:
+        """
+        Octets occupés par la table (chaînes comprises).
+        """
+        return int(self.frame.memory_usage(index=True, deep=True).sum())
+
+
+def companies_frame(records: Iterable[Company]) -> pd.DataFrame:
+    """
+    DataFrame d'entreprises aux colonnes SOURCE_COLUMNS (vide si aucun enregistrement).
+    """
+    return CompanyTable.from_records(records).frame
+
+
+__all__ = ['CATEGORICAL_COLUMNS', 'Company', 'CompanyTable', 'SOURCE_COLUMNS',
+           'companies_frame', 'encode_categoricals', 'set_value']
@@ -1,4 +1,43 @@
 """
 Configuration pour le pipeline.
 """
+import json
+import os
+from pathlib import Path
+from typing import Optional
 
+
+CONFIG_DIR = Path(__file__).parent
+
+# Identifiants du compte de service Google (non versionné)
+SERVICE_ACCOUNT_PATH = CONFIG_DIR / 'service_account.json'
+
+# Feuille cible (non versionné, voir sheets.example.json)
+SHEETS_CONFIG_PATH = CONFIG_DIR / 'sheets.json'
+
+
+def load_sheets_config(path: Optional[Path] = None) -> dict:
+    """
+    Feuille Google Sheets cible: spreadsheet_id et worksheet.
+
+    Les variables d'environnement GC_SPREADSHEET_ID et GC_WORKSHEET
+    remplacent les valeurs du fichier.
+
+    Args:
+        path: Fichier JSON (default: src/config/sheets.json, optionnel)
+
+    Returns:
+        Dict avec spreadsheet_id (None si non configuré) et worksheet
+    """
+    path = Path(path) if path else SHEETS_CONFIG_PATH
+    config = {'spreadsheet_id': None, 'worksheet': 'Companies'}
+    if path.exists():
+        config.update(json.loads(path.read_text(encoding='utf-8')))
+    if os.environ.get('GC_SPREADSHEET_ID'):
+        config['spreadsheet_id'] = os.environ['GC_SPREADSHEET_ID']
+    if os.environ.get('GC_WORKSHEET'):
+        config['worksheet'] = os.environ['GC_WORKSHEET']
+    return config
+
+
+__all__ = ['CONFIG_DIR', 'SERVICE_ACCOUNT_PATH', 'SHEETS_CONFIG_PATH', 'load_sheets_config']
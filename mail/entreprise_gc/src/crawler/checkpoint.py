@@ -0,0 +1,151 @@
+"""
+Points de reprise d'un run d'enrichissement.
+
+Les résultats sont ajoutés par paquets à un fichier JSONL (un résultat par
+ligne) et un manifeste JSON, réécrit de façon atomique, décrit l'état du run.
+Un run interrompu est repris avec son identifiant (--resume RUN_ID): les
+sites déjà enrichis ne sont pas re-crawlés. Le dossier d'un run terminé
+avec succès est supprimé (plus rien à reprendre).
+"""
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+STATUS_RUNNING = 'running'
+
+
+def new_run_id() -> str:
+    """
+    Identifiant de run horodaté (ex: 20240131-142501).
+    """
+    return time.strftime('%Y%m%d-%H%M%S')
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class CrawlCheckpoint:
+    """
+    Journal des résultats d'enrichissement d'un run, repris si le run existe.
+    """
+
+    def __init__(self, directory: Path, run_id: Optional[str] = None, every: int = 50,
+                 resume: bool = False):
+        """
+        Args:
+            directory: Dossier des checkpoints (un sous-dossier par run)
+            run_id: Identifiant du run (None = nouveau run)
+            every: Nombre de résultats entre deux écritures
+            resume: Si True, le run doit déjà exister (--resume)
+
+        Raises:
+            FileNotFoundError: resume demandé pour un run inconnu
+        """
+        self.run_id = run_id or new_run_id()
+        self.every = max(1, every)
+        self.path = Path(directory) / self.run_id
+        if resume and not self.path.is_dir():
+            raise FileNotFoundError(f"Run inconnu: {self.run_id} (aucun checkpoint dans {directory})")
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.results_path = self.path / 'results.jsonl'
+        self.manifest_path = self.path / 'manifest.json'
+
+        self.manifest = self._load_manifest()
+        self.done = self._load_results()
+        self._pending = []
+
+    def _load_manifest(self) -> dict:
+        if self.manifest_path.exists():
+            manifest = json.loads(self.manifest_path.read_text(encoding='utf-8'))
+            manifest['resumed_at'] = time.time()
+            return manifest
+        return {'run_id': self.run_id, 'created_at': time.time(), 'status': STATUS_RUNNING,
+                'completed': 0}
+
+    def _load_results(self) -> dict:
+        """
+        Résultats déjà enregistrés (clé -> résultat); une dernière ligne
+        tronquée par une interruption est retirée du fichier, pour que les
+        prochains ajouts commencent sur une ligne propre.
+        """
+        done = {}
+        if not self.results_path.exists():
+            return done
+        with open(self.results_path, 'rb+') as f:
+            data = f.read()
+            if data and not data.endswith(b'\n'):
+                logger.warning(f"Checkpoint {self.run_id}: dernière ligne incomplète retirée")
+                f.truncate(data.rfind(b'\n') + 1)
+        with open(self.results_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Checkpoint {self.run_id}: ligne incomplète ignorée")
+                    continue
+                done[record['key']] = record['result']
+        if done:
+            logger.info(f"Checkpoint {self.run_id}: {len(done)} sites déjà enrichis")
+        return done
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Résultat enregistré pour une clé (ou None).
+        """
+        return self.done.get(key)
+
+    def record(self, key: str, site_web: Optional[str], enriched) -> None:
+        """
+        Enregistre un résultat (dict d'enrich_site); les exceptions ne sont
+        pas enregistrées pour que le site soit retenté à la reprise.
+        """
+        if isinstance(enriched, Exception):
+            return
+        self.done[key] = enriched
+        self._pending.append({'key': key, 'site_web': site_web, 'result': enriched})
+        if len(self._pending) >= self.every:
+            self.flush()
+
+    def flush(self, status: str = STATUS_RUNNING) -> None:
+        """
+        Écrit les résultats en attente puis le manifeste.
+        """
+        if self._pending:
+            lines = ''.join(json.dumps(record, ensure_ascii=False, default=str) + '\n'
+                            for record in self._pending)
+            with open(self.results_path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            self._pending = []
+
+        self.manifest.update({'status': status, 'completed': len(self.done), 'updated_at': time.time()})
+        _write_atomic(self.manifest_path,
+                      json.dumps(self.manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+
+    def close(self, completed: bool = False) -> None:
+        """
+        Écrit les résultats en attente; si le run est terminé, supprime son dossier.
+        """
+        if not completed:
+            self.flush()
+            return
+        self._pending = []
+        shutil.rmtree(self.path, ignore_errors=True)
+        logger.info(f"Checkpoint {self.run_id}: run terminé, dossier supprimé")
+
+
+__all__ = ['CrawlCheckpoint', 'new_run_id']
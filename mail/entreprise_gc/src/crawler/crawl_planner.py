@@ -0,0 +1,235 @@
+"""
+Planification du crawl par site: robots.txt et sitemap.xml.
+
+Chaque hôte (schéma + hôte: www.x.ch et shop.x.ch sont deux sites) sert son
+propre robots.txt, lu une fois par site (règles Disallow, Crawl-delay,
+sitemaps déclarés). Les sitemaps (y compris index et .xml.gz) sont parsés en
+flux: seuls les meilleurs candidats contact/prestations sont conservés.
+"""
+import heapq
+import logging
+import zlib
+from typing import Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+
+from lxml import etree
+
+from ..utils.http_client import USER_AGENT
+from .html_extractor import contact_link_score
+
+logger = logging.getLogger(__name__)
+
+
+# Termes signalant une page de prestations (chemin) -> poids
+SERVICE_PATH_TERMS = {
+    'prestations': 3, 'services': 3, 'leistungen': 3, 'dienstleistungen': 3,
+    'competences': 2, 'kompetenzen': 2, 'expertise': 2, 'savoir-faire': 2,
+    'domaines': 1, 'activites': 1, 'taetigkeiten': 1, 'angebot': 1
+}
+
+
+def site_key(url: str) -> str:
+    """
+    Site d'une URL (schéma + hôte, ex: https://www.example.ch).
+    """
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+
+def robots_url(url: str) -> str:
+    """
+    URL du robots.txt du site d'une URL.
+    """
+    return f"{site_key(url)}/robots.txt"
+
+
+def service_path_score(url: str) -> int:
+    """
+    Score d'une URL comme page de prestations (0 = pas un candidat).
+    """
+    path = urlparse(url).path.lower()
+    return max((weight for term, weight in SERVICE_PATH_TERMS.items() if term in path), default=0)
+
+
+def _decompressed(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Décompresse à la volée un flux gzip (sitemap.xml.gz), sinon le laisse passer.
+    """
+    decompressor = None
+    for chunk in chunks:
+        if decompressor is None:
+            if chunk[:2] == b'\x1f\x8b':
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            else:
+                decompressor = False
+        yield decompressor.decompress(chunk) if decompressor else chunk
+    if decompressor:
+        yield decompressor.flush()
+
+
+def parse_sitemap(chunks: Iterable[bytes], max_urls: int = 50000) -> Iterator[Tuple[str, str]]:
+    """
+    Parse un sitemap ou un index de sitemaps en flux.
+
+    Les éléments sont libérés au fur et à mesure: la mémoire ne dépend pas
+    de la taille du fichier.
+
+    Args:
+        chunks: Morceaux (bytes) du document, éventuellement gzippé
+        max_urls: Nombre max d'entrées lues
+
+    Yields:
+        ('url', loc) pour une page, ('sitemap', loc) pour un sitemap enfant
+    """
+    parser = etree.XMLPullParser(events=('end',), recover=True, resolve_entities=False,
+                                 no_network=True)
+    count = 0
+    try:
+        for chunk in _decompressed(chunks):
+            parser.feed(chunk)
+            for _, element in parser.read_events():
+                tag = etree.QName(element).localname if isinstance(element.tag, str) else ''
+                if tag not in ('url', 'sitemap'):
+                    continue
+                loc = next((child.text for child in element
+                            if isinstance(child.tag, str) and etree.QName(child).localname == 'loc'), None)
+                element.clear()
+                parent = element.getparent()
+                if parent is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
+                if loc and loc.strip():
+                    yield tag, loc.strip()
+                    count += 1
+                    if count >= max_urls:
+                        return
+        parser.close()
+    except (etree.XMLSyntaxError, zlib.error) as e:
+        logger.debug(f"Sitemap illisible: {e}")
+
+
+class CrawlPlanner:
+    """
+    État par site (schéma + hôte, voir site_key): règles robots.txt et pages
+    candidates issues des sitemaps.
+    """
+
+    def __init__(self, user_agent: str = USER_AGENT, max_crawl_delay: float = 30,
+                 max_sitemaps: int = 3, max_sitemap_urls: int = 50000, top_k: int = 3):
+        """
+        Args:
+            user_agent: User-Agent dont les règles robots.txt s'appliquent
+            max_crawl_delay: Plafond appliqué à Crawl-delay (secondes)
+            max_sitemaps: Sitemaps (index compris) lus au maximum par site
+            max_sitemap_urls: Entrées lues au maximum par sitemap
+            top_k: Candidats conservés par type de page
+        """
+        self.user_agent = user_agent
+        self.max_crawl_delay = max_crawl_delay
+        self.max_sitemaps = max_sitemaps
+        self.max_sitemap_urls = max_sitemap_urls
+        self.top_k = top_k
+        self._robots = {}
+        self._sitemaps = {}
+
+    # robots.txt
+
+    def has_robots(self, site: str) -> bool:
+        return site in self._robots
+
+    def set_robots(self, site: str, text: Optional[str]) -> None:
+        """
+        Enregistre le robots.txt d'un site (None = absent, tout est permis).
+        """
+        if text is None:
+            self._robots[site] = None
+            return
+        parser = RobotFileParser()
+        parser.parse(text.splitlines())
+        self._robots[site] = parser
+
+    def can_fetch(self, site: str, url: str) -> bool:
+        parser = self._robots.get(site)
+        return parser is None or parser.can_fetch(self.user_agent, url)
+
+    def crawl_delay(self, site: str) -> float:
+        """
+        Crawl-delay du site (0 si absent), plafonné à max_crawl_delay.
+        """
+        parser = self._robots.get(site)
+        if parser is None:
+            return 0.0
+        try:
+            delay = parser.crawl_delay(self.user_agent)
+        except (TypeError, ValueError):
+            delay = None
+        return min(float(delay), self.max_crawl_delay) if delay else 0.0
+
+    def sitemap_urls(self, site: str, base_url: str) -> List[str]:
+        """
+        Sitemaps déclarés dans robots.txt, sinon /sitemap.xml.
+        """
+        parser = self._robots.get(site)
+        declared = parser.site_maps() if parser is not None else None
+        return list(declared) if declared else [urljoin(base_url, '/sitemap.xml')]
+
+    # sitemap.xml
+
+    def has_sitemap(self, site: str) -> bool:
+        return site in self._sitemaps
+
+    def start_sitemap(self, site: str) -> None:
+        self._sitemaps.setdefault(site, {'contact': [], 'services': []})
+
+    def add_sitemap(self, site: str, chunks: Iterable[bytes]) -> List[str]:
+        """
+        Lit un sitemap et conserve les meilleures pages contact/prestations.
+
+        Args:
+            site: Site (site_key)
+            chunks: Contenu du sitemap (morceaux de bytes)
+
+        Returns:
+            Sitemaps enfants (si index)
+        """
+        self.start_sitemap(site)
+        plan = self._sitemaps[site]
+        children = []
+        for position, (kind, loc) in enumerate(parse_sitemap(chunks, self.max_sitemap_urls)):
+            if kind == 'sitemap':
+                children.append(loc)
+                continue
+            if not self.can_fetch(site_key(loc), loc):
+                continue
+            for name, score in (('contact', contact_link_score(loc)), ('services', service_path_score(loc))):
+                if not score:
+                    continue
+                # Tas borné: (score, -position) -> meilleurs scores, puis premiers vus
+                entry = (score, -position, loc)
+                if len(plan[name]) < self.top_k:
+                    heapq.heappush(plan[name], entry)
+                else:
+                    heapq.heappushpop(plan[name], entry)
+        return children
+
+    def _ranked(self, site: str, name: str) -> List[str]:
+        plan = self._sitemaps.get(site)
+        if not plan:
+            return []
+        return [loc for _, _, loc in sorted(plan[name], reverse=True)]
+
+    def contact_urls(self, site: str) -> List[str]:
+        """
+        Pages de contact trouvées dans les sitemaps, meilleures d'abord.
+        """
+        return self._ranked(site, 'contact')
+
+    def service_urls(self, site: str) -> List[str]:
+        """
+        Pages de prestations trouvées dans les sitemaps, meilleures d'abord.
+        """
+        return self._ranked(site, 'services')
+
+
+__all__ = ['CrawlPlanner', 'parse_sitemap', 'robots_url', 'service_path_score', 'site_key']
@@ -0,0 +1,246 @@
+"""
+Extraction des données de contact d'une page HTML en un seul parcours lxml.
+
+Le document est parsé une fois; un seul parcours de l'arbre (iterwalk)
+collecte le texte visible, les liens mailto:/tel:, les attributs contenant
+un email, le texte des sections spécialités et les liens <a href> (avec leur
+texte, pour la découverte des pages de contact). Le contenu des balises
+<script>/<style> n'est pas du texte visible (seuls les emails des scripts,
+p.ex. JSON-LD, sont conservés).
+"""
+import re
+import time
+from typing import List, Optional, Tuple
+from urllib.parse import urljoin, urldefrag, urlparse
+
+from lxml import etree
+from lxml import html as lxml_html
+
+from ..utils.regex_patterns import scan_contacts
+
+
+# Balises dont le contenu n'est pas du texte visible
+SKIPPED_TAGS = frozenset({'script', 'style', 'noscript', 'template'})
+
+# Sections spécialités: id/classe exacts, sous-chaîne de classe
+SPECIALTY_IDS = frozenset({'services', 'prestations'})
+SPECIALTY_CLASSES = frozenset({'services', 'prestations'})
+SPECIALTY_CLASS_SUBSTRINGS = ('speciality',)
+SPECIALTY_SECTION_SUBSTRINGS = ('service',)
+
+MAX_SPECIALITES_LENGTH = 2000
+
+# Termes signalant une page de contact (texte du lien ou chemin) -> poids
+CONTACT_LINK_TERMS = {
+    'contact': 5, 'kontakt': 5, 'contatti': 5, 'nous-contacter': 5,
+    'impressum': 4, 'imprint': 4, 'mentions': 4, 'legal': 3, 'légales': 3,
+    'adresse': 2, 'address': 2, 'anfahrt': 2, 'coordonnées': 2,
+    'about': 1, 'a-propos': 1, 'à propos': 1, 'equipe': 1, 'équipe': 1, 'team': 1,
+    'ueber-uns': 1, 'über uns': 1, 'qui-sommes-nous': 1, 'qui sommes-nous': 1
+}
+
+# Liens jamais suivis (fichiers)
+SKIPPED_LINK_EXTENSIONS = ('.pdf', '.jpg', '.jpeg', '.png', '.gif', '.svg', '.zip', '.doc', '.docx')
+
+_CONTACT_TERMS_PATTERN = re.compile('|'.join(
+    re.escape(term) for term in sorted(CONTACT_LINK_TERMS, key=len, reverse=True)
+))
+
+_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+
+def _is_specialty_section(element) -> bool:
+    """
+    Équivalent de '#services, #prestations, .services, .prestations,
+    section[class*="service"], [class*="speciality"]'.
+    """
+    if element.get('id') in SPECIALTY_IDS:
+        return True
+    classes = element.get('class')
+    if not classes:
+        return False
+    if SPECIALTY_CLASSES.intersection(classes.split()):
+        return True
+    if element.tag == 'section' and any(s in classes for s in SPECIALTY_SECTION_SUBSTRINGS):
+        return True
+    return any(s in classes for s in SPECIALTY_CLASS_SUBSTRINGS)
+
+
+def _may_contain_email(value: str) -> bool:
+    return '@' in value or '(at)' in value or '[at]' in value
+
+
+def _empty_extraction(parse_time: float = 0.0) -> dict:
+    return {'emails': [], 'phones': [], 'specialites': '', 'links': [], 'parse_time': parse_time}
+
+
+def extract_page(content: str, base_url: Optional[str] = None) -> dict:
+    """
+    Parse une page et extrait emails, téléphones et spécialités.
+
+    Args:
+        content: Contenu HTML
+        base_url: URL de la page (informative)
+
+    Returns:
+        Dict avec emails, phones, specialites, links [(href, texte)] et parse_time (secondes)
+    """
+    start = time.perf_counter()
+    if not content or not content.strip():
+        return _empty_extraction()
+
+    try:
+        root = lxml_html.fromstring(content.encode('utf-8', 'surrogatepass'), parser=_PARSER)
+    except (etree.ParserError, ValueError):
+        return _empty_extraction(time.perf_counter() - start)
+
+    texts = []            # Texte visible
+    raw = []              # Emails hors texte visible (mailto, attributs, commentaires, scripts)
+    tel_links = []
+    sections = []         # Texte des sections spécialités
+    section_root = None
+    section_texts = None
+    links = []            # (href, texte du lien)
+    link_root = None
+    link_texts = None
+
+    def add_text(value):
+        if value:
+            value = value.strip()
+            if value:
+                texts.append(value)
+                if section_texts is not None:
+                    section_texts.append(value)
+                if link_texts is not None:
+                    link_texts.append(value)
+
+    walker = etree.iterwalk(root, events=('start', 'end', 'comment', 'pi'))
+    for event, element in walker:
+        if event == 'start':
+            tag = element.tag if isinstance(element.tag, str) else ''
+
+            for name, value in element.items():
+                if name == 'href':
+                    lowered = value[:7].lower()
+                    if lowered.startswith('mailto:'):
+                        raw.append(value[7:])
+                        continue
+                    if lowered.startswith('tel:'):
+                        tel_links.append(value[4:])
+                        continue
+                if _may_contain_email(value):
+                    raw.append(value)
+
+            if tag in SKIPPED_TAGS:
+                # Le texte des scripts n'est pas visible, mais peut contenir un email (JSON-LD)
+                if tag == 'script' and element.text and _may_contain_email(element.text):
+                    raw.append(element.text)
+                walker.skip_subtree()
+                continue
+
+            if section_root is None and _is_specialty_section(element):
+                section_root = element
+                section_texts = []
+            if tag == 'a' and link_root is None:
+                href = element.get('href')
+                if href and not href[:7].lower().startswith(('mailto:', 'tel:', 'javascript')):
+                    link_root = element
+                    link_texts = [element.get('title', '')]
+            add_text(element.text)
+
+        elif event == 'end':
+            if element is section_root:
+                sections.append(' '.join(section_texts))
+                section_root = section_texts = None
+            if element is link_root:
+                links.append((element.get('href').strip(), ' '.join(link_texts).strip()))
+                link_root = link_texts = None
+            add_text(element.tail)
+
+        else:
+            # Commentaire / instruction: pas du texte visible, mais peut cacher un email
+            if element.text and _may_contain_email(element.text):
+                raw.append(element.text)
+            add_text(element.tail)
+
+    # Un seul scan: texte visible, puis emails hors texte, puis liens tel:
+    # (\x00 empêche un match de chevaucher deux blocs). Les téléphones des
+    # attributs/scripts sont ignorés, comme les emails des liens tel:.
+    text = ' '.join(texts)
+    raw_start = len(text) + 1
+    tel_start = raw_start + len(' '.join(raw)) + 1
+    buffer = '\x00'.join((text, ' '.join(raw), ' '.join(tel_links)))
+
+    emails, phones = {}, {}
+    for hit in scan_contacts(buffer):
+        if hit.kind == 'email':
+            if hit.start < tel_start:
+                emails.setdefault(hit.value, None)
+        elif hit.start < raw_start or hit.start >= tel_start:
+            phones.setdefault(hit.value, None)
+    emails, phones = list(emails), list(phones)
+
+    specialites = ''.join(' ' + section for section in sections)[:MAX_SPECIALITES_LENGTH].strip()
+
+    return {
+        'emails': emails,
+        'phones': phones,
+        'specialites': specialites,
+        'links': links,
+        'parse_time': time.perf_counter() - start
+    }
+
+
+def _same_site(host: str, base_host: str) -> bool:
+    host = host.lower().removeprefix('www.')
+    base_host = base_host.lower().removeprefix('www.')
+    return host == base_host or host.endswith('.' + base_host) or base_host.endswith('.' + host)
+
+
+def contact_link_score(href: str, text: str = '') -> int:
+    """
+    Score d'un lien comme page de contact (0 = pas un candidat).
+
+    Les termes de CONTACT_LINK_TERMS sont cherchés dans le texte du lien et
+    dans le chemin; le meilleur poids de chacun est additionné.
+    """
+    path = urlparse(href).path.lower()
+    score = 0
+    for source in (text.lower(), path):
+        weights = [CONTACT_LINK_TERMS[m.group(0)] for m in _CONTACT_TERMS_PATTERN.finditer(source)]
+        if weights:
+            score += max(weights)
+    return score
+
+
+def rank_contact_links(links: List[Tuple[str, str]], base_url: str, top_k: int = 3) -> List[str]:
+    """
+    Classe les liens d'une page par probabilité de mener au contact.
+
+    Args:
+        links: Liens (href, texte) extraits par extract_page
+        base_url: URL de la page
+        top_k: Nombre max d'URLs retournées
+
+    Returns:
+        URLs absolues du même site, meilleures d'abord (ordre du document à score égal)
+    """
+    base = urlparse(base_url)
+    base_key = urldefrag(base_url)[0].rstrip('/')
+    scored = {}
+    for position, (href, text) in enumerate(links):
+        url = urldefrag(urljoin(base_url, href))[0]
+        parsed = urlparse(url)
+        if parsed.scheme not in ('http', 'https') or not _same_site(parsed.netloc, base.netloc):
+            continue
+        if parsed.path.lower().endswith(SKIPPED_LINK_EXTENSIONS) or url.rstrip('/') == base_key:
+            continue
+        score = contact_link_score(url, text)
+        if score and (url not in scored or scored[url][0] < -score):
+            scored[url] = (-score, scored.get(url, (0, position))[1])
+
+    ranked = sorted(scored.items(), key=lambda item: item[1])
+    return [url for url, _ in ranked[:top_k]]
+
+
+__all__ = ['extract_page', 'rank_contact_links', 'contact_link_score']
@@ -1,24 +1,35 @@
 """
 Module de crawling et enrichissement de sites web.
 """
+import asyncio
 import logging
 import re
 import time
 import pandas as pd
-from typing import Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
 import httpx
-from bs4 import BeautifulSoup
-from tenacity import retry, stop_after_attempt, wait_exponential
 
-from ..utils import extract_emails, extract_phones, normalize_url
+from ..company_table import set_value
+from ..utils import normalize_url
+from ..utils.domains import url_domain
+from ..utils.http_client import HTML_CONTENT_TYPES, HttpClientPool, USER_AGENT
+from ..utils.retry_policy import RetryPolicy
+from .crawl_planner import CrawlPlanner, robots_url, site_key
+from .html_extractor import extract_page, rank_contact_links
 
 logger = logging.getLogger(__name__)
 
 
-# User agent personnalisé
-USER_AGENT = "Mozilla/5.0 (compatible; GC-Romandie-Bot/1.0; +https://github.com/example/gc-romandie)"
+# Types de ressources (budget d'octets et Content-Type différents)
+FETCH_PAGE = 'page'
+FETCH_ROBOTS = 'robots'
+FETCH_SITEMAP = 'sitemap'
+
+# Taille max lue d'un robots.txt (limite usuelle des moteurs)
+ROBOTS_MAX_BYTES = 500 * 1024
 
 
 class SiteEnricher:
@@ -26,17 +37,48 @@ class SiteEnricher:
     Classe pour enrichir des fiches d'entreprises en crawlant leurs sites web.
     """
     
-    def __init__(self, timeout: int = 12, max_retries: int = 3, rate_limit: float = 1.0):
+    def __init__(self, timeout: int = 12, max_retries: int = 3, rate_limit: float = 1.0,
+                 http: Optional[HttpClientPool] = None, parse_workers: int = 0,
+                 parse_queue_size: Optional[int] = None, max_contact_links: int = 3,
+                 planner: Optional[CrawlPlanner] = None, use_robots: bool = True,
+                 max_page_bytes: int = 512 * 1024, max_sitemap_bytes: int = 10 * 1024 * 1024):
         """
         Args:
             timeout: Timeout par requête (secondes)
             max_retries: Nombre max de tentatives
             rate_limit: Délai entre requêtes (secondes)
+            http: Pool HTTP partagé (None = pool dédié)
+            parse_workers: Processus de parsing pour enrich_many (0 = parsing dans la boucle)
+            parse_queue_size: Pages en attente de parsing max avant de suspendre
+                              les fetchs (default: 2 x parse_workers)
+            max_contact_links: Liens de contact de la page d'accueil suivis au maximum
+            planner: Planificateur robots.txt/sitemap partagé (None = planificateur dédié)
+            use_robots: Si False, ignorer robots.txt et les sitemaps
+            max_page_bytes: Octets lus au maximum par page HTML (le reste est ignoré)
+            max_sitemap_bytes: Octets lus au maximum par sitemap
         """
         self.timeout = timeout
+        self.http = http or HttpClientPool(timeout=timeout)
         self.max_retries = max_retries
+        self.retry_policy = RetryPolicy(max_attempts=max_retries)
         self.rate_limit = rate_limit
         self.last_request_time = {}
+        self._domain_locks = {}
+        # Temps de parsing cumulés (compteurs, pas de liste: l'enricher peut
+        # durer tout un run en streaming)
+        self.pages_parsed = 0
+        self.parse_seconds = 0.0
+        self.parse_max_seconds = 0.0
+        self.max_contact_links = max_contact_links
+        self.max_page_bytes = max_page_bytes
+        self.max_sitemap_bytes = max_sitemap_bytes
+        self.planner = (planner or CrawlPlanner(top_k=max_contact_links)) if use_robots else None
+        # Domaine (rate limit) -> sites dont le robots.txt a été lu
+        self._domain_sites = {}
+        self.parse_workers = parse_workers
+        self.parse_queue_size = parse_queue_size or 2 * parse_workers
+        self._parse_pool = None
+        self._parse_queue = None
         
         # Pages à scanner pour infos de contact
         self.contact_paths = [
@@ -59,32 +101,88 @@ class SiteEnricher:
             '/projects'
         ]
     
+    def _rate_limit_for(self, domain: str) -> float:
+        """
+        Délai entre requêtes d'un domaine: rate_limit, ou Crawl-delay s'il est plus long.
+        """
+        if self.planner is None:
+            return self.rate_limit
+        # Crawl-delay le plus long des sites (hôtes) du domaine
+        delays = [self.planner.crawl_delay(site) for site in self._domain_sites.get(domain, ())]
+        return max([self.rate_limit] + delays)
+    
     def _wait_rate_limit(self, domain: str):
         """
         Attend pour respecter le rate limit par domaine.
         """
+        delay = self._rate_limit_for(domain)
         if domain in self.last_request_time:
             elapsed = time.time() - self.last_request_time[domain]
-            if elapsed < self.rate_limit:
-                time.sleep(self.rate_limit - elapsed)
+            if elapsed < delay:
+                time.sleep(delay - elapsed)
         
         self.last_request_time[domain] = time.time()
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    def _fetch_url(self, url: str) -> Optional[httpx.Response]:
+    async def _wait_rate_limit_async(self, domain: str):
+        """
+        Variante asynchrone de _wait_rate_limit.
+        
+        Un verrou par domaine sérialise les requêtes vers un même domaine
+        sans bloquer les tâches qui crawlent d'autres domaines.
+        """
+        lock = self._domain_locks.get(domain)
+        if lock is None:
+            lock = self._domain_locks[domain] = asyncio.Lock()
+        
+        async with lock:
+            delay = self._rate_limit_for(domain)
+            if domain in self.last_request_time:
+                elapsed = time.time() - self.last_request_time[domain]
+                if elapsed < delay:
+                    await asyncio.sleep(delay - elapsed)
+            
+            self.last_request_time[domain] = time.time()
+    
+    def _fetch_limits(self, kind: str) -> dict:
         """
-        Récupère une URL avec retry.
+        Budget d'octets et types de contenu acceptés selon le type de ressource.
+        """
+        if kind == FETCH_SITEMAP:
+            return {'max_bytes': self.max_sitemap_bytes, 'content_types': None}
+        if kind == FETCH_ROBOTS:
+            return {'max_bytes': ROBOTS_MAX_BYTES, 'content_types': None}
+        return {'max_bytes': self.max_page_bytes, 'content_types': HTML_CONTENT_TYPES}
+    
+    def _get(self, url: str, kind: str = FETCH_PAGE) -> httpx.Response:
+        response = self.http.get(url, timeout=self.timeout, **self._fetch_limits(kind))
+        response.raise_for_status()
+        return response
+    
+    async def _aget(self, url: str, kind: str = FETCH_PAGE) -> httpx.Response:
+        response = await self.http.aget(url, timeout=self.timeout, **self._fetch_limits(kind))
+        response.raise_for_status()
+        return response
+    
+    def _fetch_url(self, url: str, kind: str = FETCH_PAGE) -> Optional[httpx.Response]:
+        """
+        Récupère une URL avec retry des seuls échecs transitoires.
+        
+        Le corps est lu en flux, dans la limite du budget du type de ressource
+        (FETCH_PAGE: HTML seulement, max_page_bytes).
         """
         try:
-            with httpx.Client(timeout=self.timeout, follow_redirects=True, verify=True) as client:
-                response = client.get(url, headers={
-                    'User-Agent': USER_AGENT,
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'fr-FR,fr;q=0.9,en;q=0.8',
-                    'Accept-Encoding': 'gzip, deflate, br'
-                })
-                response.raise_for_status()
-                return response
+            return self.retry_policy.call(lambda u: self._get(u, kind), url, domain=self._get_domain(url))
+        except (httpx.TimeoutException, httpx.RequestError, httpx.HTTPStatusError) as e:
+            logger.warning(f"Erreur fetch {url}: {e}")
+            raise
+    
+    async def _fetch_url_async(self, url: str, kind: str = FETCH_PAGE) -> Optional[httpx.Response]:
+        """
+        Variante asynchrone de _fetch_url (client du pool partagé).
+        """
+        try:
+            return await self.retry_policy.acall(lambda u: self._aget(u, kind), url,
+                                                 domain=self._get_domain(url))
         except (httpx.TimeoutException, httpx.RequestError, httpx.HTTPStatusError) as e:
             logger.warning(f"Erreur fetch {url}: {e}")
             raise
@@ -98,77 +196,83 @@ class SiteEnricher:
             base_url: URL de base pour liens relatifs
             
         Returns:
-            Dict avec emails, phones, specialites
+            Dict avec emails, phones, specialites, parse_time
         """
-        soup = BeautifulSoup(html, 'lxml')
-        
-        # Extraire tout le texte
-        text = soup.get_text(separator=' ', strip=True)
-        
-        # Emails
-        emails = extract_emails(text)
-        emails.extend(extract_emails(html))  # Aussi dans HTML brut (obfuscation)
-        
-        # Téléphones
-        phones = extract_phones(text)
+        parsed = extract_page(html, base_url)
+        self._record_parse_time(base_url, parsed['parse_time'])
+        return parsed
+    
+    async def _parse_html_async(self, html: str, base_url: str) -> dict:
+        """
+        Parse dans le pool de processus si actif, sinon dans la boucle.
         
-        # Spécialités: chercher sur certaines pages
-        specialites = ""
-        try:
-            # Choisir sections pertinentes
-            selectors = ['#services', '#prestations', '.services', '.prestations',
-                        'section[class*="service"]', '[class*="speciality"]']
-            
-            for selector in selectors:
-                elements = soup.select(selector)
-                for elem in elements:
-                    specialites += " " + elem.get_text(separator=' ', strip=True)
-            
-            # Limiter longueur
-            specialites = specialites[:2000].strip()
-        except:
-            pass
+        La page est déposée dans la file bornée des parse workers: quand elle
+        est pleine, le site attend (put) avant de passer à son prochain fetch.
+        """
+        if self._parse_queue is None:
+            return self._parse_html(html, base_url)
         
+        result = asyncio.get_running_loop().create_future()
+        await self._parse_queue.put((html, base_url, result))
+        parsed = await result
+        self._record_parse_time(base_url, parsed['parse_time'])
+        return parsed
+    
+    async def _parse_worker(self) -> None:
+        """
+        Consomme la file de parsing: une page à la fois dans le pool de processus.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            html, base_url, result = await self._parse_queue.get()
+            try:
+                parsed = await loop.run_in_executor(self._parse_pool, extract_page, html, base_url)
+            except Exception as e:
+                if not result.done():
+                    result.set_exception(e)
+            else:
+                if not result.done():
+                    result.set_result(parsed)
+            finally:
+                self._parse_queue.task_done()
+    
+    def _record_parse_time(self, url: str, seconds: float) -> None:
+        self.pages_parsed += 1
+        self.parse_seconds += seconds
+        self.parse_max_seconds = max(self.parse_max_seconds, seconds)
+        logger.debug(f"Parse {url}: {seconds * 1000:.1f} ms")
+    
+    def parse_stats(self) -> dict:
+        """
+        Statistiques de temps de parsing par page.
+        """
+        pages = self.pages_parsed
         return {
-            'emails': list(set(emails)),  # Dédupliquer
-            'phones': list(set(phones)),
-            'specialites': specialites
+            'pages_parsed': pages,
+            'parse_seconds': self.parse_seconds,
+            'parse_mean_ms': 1000 * self.parse_seconds / pages if pages else 0.0,
+            'parse_max_ms': 1000 * self.parse_max_seconds
         }
     
-    def enrich_site(self, site_web: str, existing_email: Optional[str] = None) -> dict:
+    def _get_domain(self, url: str) -> str:
         """
-        Enrichit une fiche avec les infos du site web.
-        
-        Args:
-            site_web: URL du site
-            existing_email: Email existant (pour ne pas crawler si présent)
-            
-        Returns:
-            Dict avec emails, phones, specialites, source_url
+        Détermine le domaine utilisé pour le rate limit.
         """
-        if not site_web:
-            return {}
-        
-        # Normaliser URL
-        url = normalize_url(site_web)
-        if not url:
-            return {}
-        
-        # Si déjà un email valide, skip crawl si court
-        if existing_email and existing_email != "formulaire":
-            return {'source_url': url}
-        
-        # Déterminer domaine pour rate limit
-        try:
-            from tldextract import extract as tld_extract
-            result = tld_extract(url)
-            domain = result.registered_domain or result.domain
-        except:
-            domain = urlparse(url).netloc
+        return url_domain(url)
+    
+    def _enrich_steps(self, url: str, existing_email: Optional[str] = None):
+        """
+        Logique d'enrichissement d'un site, indépendante du mode d'exécution.
         
-        # Rate limit
-        self._wait_rate_limit(domain)
+        Générateur qui produit des étapes ('fetch', url[, type]) ou ('parse', html, base_url)
+        et reçoit en retour la réponse HTTP ou le dict parsé. Les erreurs de fetch
+        sont renvoyées dans le générateur via throw(). Le dict résultat est la
+        valeur de retour du générateur.
         
+        Args:
+            url: URL normalisée du site
+            existing_email: Email existant
+        """
         result = {
             'emails': [],
             'phones': [],
@@ -177,27 +281,64 @@ class SiteEnricher:
             'errors': []
         }
         
+        domain = self._get_domain(url)
+        site = site_key(url)
+        
+        # robots.txt (une fois par site: chaque hôte sert le sien)
+        if self.planner is not None and not self.planner.has_robots(site):
+            self._domain_sites.setdefault(domain, set()).add(site)
+            try:
+                response = yield ('fetch', robots_url(url), FETCH_ROBOTS)
+                self.planner.set_robots(site, response.text if response else None)
+            except Exception:
+                self.planner.set_robots(site, None)
+        
+        if not self._allowed(url):
+            result['errors'].append("Homepage: interdit par robots.txt")
+            result['email'] = "formulaire"
+            return result
+        
         # Essayer page d'accueil
+        links = []
+        fetched = {url}
         try:
-            response = self._fetch_url(url)
+            response = yield ('fetch', url)
             if response:
-                parsed = self._parse_html(response.text, url)
+                parsed = yield ('parse', response.text, url)
                 result['emails'].extend(parsed['emails'])
                 result['phones'].extend(parsed['phones'])
                 result['specialites'] = parsed['specialites']
+                links = parsed.get('links', [])
         except Exception as e:
             result['errors'].append(f"Homepage: {str(e)}")
         
-        # Essayer pages de contact si pas d'email trouvé
-        if not result['emails'] and not existing_email:
-            for path in self.contact_paths[:8]:  # Limiter à 8 essais
+        # Essayer pages de contact si pas d'email trouvé: pages du sitemap et
+        # liens de la page d'accueil les mieux classés, sinon chemins usuels
+        # (sondage à l'aveugle)
+        if not result['emails'] and not existing_email and not self.retry_policy.is_dead(domain):
+            contact_urls = []
+            if self.planner is not None:
+                yield from self._sitemap_steps(site, url)
+                contact_urls.extend(self.planner.contact_urls(site))
+            for contact_url in rank_contact_links(links, url, top_k=self.max_contact_links):
+                if contact_url not in contact_urls:
+                    contact_urls.append(contact_url)
+            contact_urls = [u for u in contact_urls if self._allowed(u)][:self.max_contact_links]
+            
+            if contact_urls:
+                candidates = [(urlparse(contact_url).path or '/', contact_url)
+                              for contact_url in contact_urls]
+            else:
+                candidates = [(path, urljoin(url, path)) for path in self.contact_paths[:8]  # Limiter à 8 essais
+                              if self._allowed(urljoin(url, path))]
+            
+            for path, contact_url in candidates:
                 try:
-                    contact_url = urljoin(url, path)
-                    self._wait_rate_limit(domain)
-                    response = self._fetch_url(contact_url)
+                    fetched.add(contact_url)
+                    response = yield ('fetch', contact_url)
                     
                     if response and response.url != url:  # Vérifier redirect
-                        parsed = self._parse_html(response.text, contact_url)
+                        parsed = yield ('parse', response.text, contact_url)
                         result['emails'].extend(parsed['emails'])
                         result['phones'].extend(parsed['phones'])
                         if not result['specialites']:
@@ -209,8 +350,25 @@ class SiteEnricher:
                             break
                 except Exception as e:
                     result['errors'].append(f"{path}: {str(e)}")
+                    if self.retry_policy.is_dead(domain):
+                        break
                     continue
         
+        # Spécialités: page de prestations du sitemap (si déjà lu)
+        if (not result['specialites'] and self.planner is not None
+                and self.planner.has_sitemap(site) and not self.retry_policy.is_dead(domain)):
+            for service_url in self.planner.service_urls(site)[:1]:
+                if service_url in fetched:
+                    continue
+                try:
+                    response = yield ('fetch', service_url)
+                    if response:
+                        parsed = yield ('parse', response.text, service_url)
+                        result['specialites'] = parsed['specialites']
+                        result['phones'].extend(parsed['phones'])
+                except Exception as e:
+                    result['errors'].append(f"{urlparse(service_url).path}: {str(e)}")
+        
         # Nettoyer et dédupliquer emails
         if result['emails']:
             # Prioriser emails génériques
@@ -234,6 +392,200 @@ class SiteEnricher:
         
         return result
     
+    def _allowed(self, url: str) -> bool:
+        return self.planner is None or self.planner.can_fetch(site_key(url), url)
+    
+    def _sitemap_steps(self, site: str, url: str):
+        """
+        Étapes de lecture des sitemaps d'un site (une fois par site).
+        
+        Les index de sitemaps sont suivis en largeur, dans la limite de
+        planner.max_sitemaps fichiers.
+        """
+        if self.planner.has_sitemap(site):
+            return
+        self.planner.start_sitemap(site)
+        
+        queue = self.planner.sitemap_urls(site, url)
+        seen = set()
+        while queue and len(seen) < self.planner.max_sitemaps:
+            sitemap_url = queue.pop(0)
+            if sitemap_url in seen or not self._allowed(sitemap_url):
+                continue
+            seen.add(sitemap_url)
+            try:
+                response = yield ('fetch', sitemap_url, FETCH_SITEMAP)
+            except Exception as e:
+                logger.debug(f"Sitemap {sitemap_url}: {e}")
+                continue
+            if response:
+                queue.extend(self.planner.add_sitemap(site, response.iter_bytes(65536)))
+    
+    def _prepare_site(self, site_web: str, existing_email: Optional[str]) -> Tuple[Optional[str], Optional[dict]]:
+        """
+        Normalise l'URL et court-circuite les cas sans crawl.
+        
+        Returns:
+            Tuple (url, résultat immédiat). Si le résultat est non None, pas de crawl.
+        """
+        if not site_web:
+            return None, {}
+        
+        # Normaliser URL
+        url = normalize_url(site_web)
+        if not url:
+            return None, {}
+        
+        # Si déjà un email valide, skip crawl si court
+        if existing_email and existing_email != "formulaire":
+            return url, {'source_url': url}
+        
+        return url, None
+    
+    def enrich_site(self, site_web: str, existing_email: Optional[str] = None) -> dict:
+        """
+        Enrichit une fiche avec les infos du site web.
+        
+        Args:
+            site_web: URL du site
+            existing_email: Email existant (pour ne pas crawler si présent)
+            
+        Returns:
+            Dict avec emails, phones, specialites, source_url
+        """
+        url, early = self._prepare_site(site_web, existing_email)
+        if early is not None:
+            return early
+        
+        domain = self._get_domain(url)
+        steps = self._enrich_steps(url, existing_email)
+        
+        try:
+            step = next(steps)
+            while True:
+                try:
+                    if step[0] == 'fetch':
+                        if not self.http.is_cached(step[1]) and not self.retry_policy.is_dead(domain):
+                            self._wait_rate_limit(domain)
+                        value = self._fetch_url(*step[1:])
+                    else:
+                        value = self._parse_html(step[1], step[2])
+                except Exception as e:
+                    step = steps.throw(e)
+                else:
+                    step = steps.send(value)
+        except StopIteration as stop:
+            return stop.value
+    
+    async def enrich_site_async(self, site_web: str, existing_email: Optional[str] = None) -> dict:
+        """
+        Variante asynchrone de enrich_site.
+        
+        Args:
+            site_web: URL du site
+            existing_email: Email existant
+            
+        Returns:
+            Dict avec emails, phones, specialites, source_url
+        """
+        url, early = self._prepare_site(site_web, existing_email)
+        if early is not None:
+            return early
+        
+        domain = self._get_domain(url)
+        steps = self._enrich_steps(url, existing_email)
+        
+        try:
+            step = next(steps)
+            while True:
+                try:
+                    if step[0] == 'fetch':
+                        if not self.http.is_cached(step[1]) and not self.retry_policy.is_dead(domain):
+                            await self._wait_rate_limit_async(domain)
+                        value = await self._fetch_url_async(*step[1:])
+                    else:
+                        value = await self._parse_html_async(step[1], step[2])
+                except Exception as e:
+                    step = steps.throw(e)
+                else:
+                    step = steps.send(value)
+        except StopIteration as stop:
+            return stop.value
+    
+    async def enrich_many_async(self, items: Iterable[Tuple[str, Optional[str]]],
+                                concurrency: int = 10,
+                                on_result: Optional[Callable[[int, object], None]] = None) -> list:
+        """
+        Enrichit plusieurs sites en parallèle.
+        
+        Le rate limit reste appliqué par domaine: seules les requêtes vers des
+        domaines différents s'exécutent en parallèle. Si parse_workers > 0, le
+        parsing HTML est une étape séparée: les fetchs déposent les pages dans
+        une asyncio.Queue bornée (parse_queue_size), vidée par parse_workers
+        tâches qui parsent dans un ProcessPoolExecutor. File pleine, un site
+        attend avant son prochain fetch: au plus parse_queue_size pages en
+        file, parse_workers en cours de parsing et une par site bloqué.
+        
+        Args:
+            items: Itérable de tuples (site_web, existing_email)
+            concurrency: Nombre max de sites crawlés simultanément
+            on_result: Appelé avec (position, résultat ou exception) dès qu'un site est terminé
+            
+        Returns:
+            Liste de résultats dans l'ordre des items (dict, ou exception si échec)
+        """
+        from tqdm import tqdm
+        
+        items = list(items)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        # Verrous liés à la boucle courante (enricher réutilisé d'un asyncio.run à l'autre)
+        self._domain_locks = {}
+        parse_tasks = []
+        if self.parse_workers > 0:
+            self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+            self._parse_queue = asyncio.Queue(maxsize=max(1, self.parse_queue_size))
+            parse_tasks = [asyncio.create_task(self._parse_worker())
+                           for _ in range(self.parse_workers)]
+        progress = tqdm(total=len(items), desc="Crawl")
+        
+        async def worker(position, site_web, existing_email):
+            async with semaphore:
+                try:
+                    result = await self.enrich_site_async(site_web, existing_email)
+                except Exception as e:
+                    result = e
+                finally:
+                    progress.update(1)
+            if on_result is not None:
+                on_result(position, result)
+            return result
+        
+        try:
+            return await asyncio.gather(
+                *(worker(position, site_web, email) for position, (site_web, email) in enumerate(items)),
+                return_exceptions=True
+            )
+        finally:
+            progress.close()
+            for task in parse_tasks:
+                task.cancel()
+            await asyncio.gather(*parse_tasks, return_exceptions=True)
+            await self.http.aclose()
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(cancel_futures=True)
+                self._parse_pool = self._parse_queue = None
+            stats = self.parse_stats()
+            if stats['pages_parsed']:
+                logger.info(f"Parsing: {stats['pages_parsed']} pages, {stats['parse_seconds']:.2f}s "
+                            f"(moy. {stats['parse_mean_ms']:.1f} ms, max {stats['parse_max_ms']:.1f} ms)")
+    
+    def enrich_many(self, items: Iterable[Tuple[str, Optional[str]]], concurrency: int = 10,
+                    on_result: Optional[Callable[[int, object], None]] = None) -> list:
+        """
+        Point d'entrée synchrone pour enrich_many_async.
+        """
+        return asyncio.run(self.enrich_many_async(items, concurrency, on_result))
+    
     def enrich_dataframe(self, df, max_items: Optional[int] = None) -> list:
         """
         Enrichit un DataFrame d'entreprises.
@@ -270,7 +622,7 @@ class SiteEnricher:
                 if enriched.get('specialites'):
                     df.at[idx, 'specialites'] = enriched['specialites']
                 if enriched.get('source_url'):
-                    df.at[idx, 'source_url'] = enriched['source_url']
+                    set_value(df, idx, 'source_url', enriched['source_url'])
                 if enriched.get('errors'):
                     all_errors.append({
                         'url': site_web,
@@ -298,6 +650,7 @@ def enrich_single_site(site_web: str, existing_email: Optional[str] = None) -> d
     Returns:
         Dict avec données enrichies
     """
-    enricher = SiteEnricher()
-    return enricher.enrich_site(site_web, existing_email)
+    with HttpClientPool() as http:
+        enricher = SiteEnricher(http=http)
+        return enricher.enrich_site(site_web, existing_email)
 
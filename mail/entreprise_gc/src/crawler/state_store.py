@@ -0,0 +1,146 @@
+"""
+État persistant de l'enrichissement par entreprise (SQLite).
+
+Permet les runs incrémentaux: seules les entrées jamais crawlées, en échec
+ou plus anciennes que max_age sont re-crawlées.
+"""
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+from ..utils import normalize_company_name, normalize_url
+from ..utils.domains import url_domain
+
+logger = logging.getLogger(__name__)
+
+
+STATUS_OK = 'ok'
+STATUS_FAILED = 'failed'
+
+
+def company_key(site_web: Optional[str], company_name: Optional[str] = None) -> Optional[str]:
+    """
+    Clé d'état d'une entreprise: domaine du site, sinon nom normalisé.
+
+    Args:
+        site_web: URL du site
+        company_name: Nom de l'entreprise
+
+    Returns:
+        Clé ou None si rien d'exploitable
+    """
+    url = normalize_url(site_web) if isinstance(site_web, str) else None
+    if url:
+        domain = url_domain(url)
+        if domain:
+            return f"domain:{domain.lower()}"
+
+    if isinstance(company_name, str):
+        name = normalize_company_name(company_name)
+        if name:
+            return f"name:{name}"
+
+    return None
+
+
+class EnrichmentStateStore:
+    """
+    Stocke, par entreprise, la date et le résultat du dernier enrichissement.
+    """
+
+    def __init__(self, path: Path, max_age: float = 30 * 24 * 3600):
+        """
+        Args:
+            path: Fichier SQLite
+            max_age: Âge max (secondes) d'un enrichissement réussi avant re-crawl
+        """
+        self.path = Path(path)
+        self.max_age = max_age
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS enrichment_state (
+                key TEXT PRIMARY KEY,
+                site_web TEXT,
+                enriched_at REAL NOT NULL,
+                status TEXT NOT NULL,
+                result TEXT,
+                errors TEXT
+            )
+        """)
+        self.conn.commit()
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Retourne l'état enregistré pour une clé (ou None).
+        """
+        row = self.conn.execute(
+            "SELECT site_web, enriched_at, status, result, errors FROM enrichment_state WHERE key = ?",
+            (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            'key': key,
+            'site_web': row[0],
+            'enriched_at': row[1],
+            'status': row[2],
+            'result': json.loads(row[3]) if row[3] else {},
+            'errors': json.loads(row[4]) if row[4] else []
+        }
+
+    def is_fresh(self, state: Optional[dict]) -> bool:
+        """
+        True si l'état est un succès plus récent que max_age.
+        """
+        return (state is not None and state['status'] == STATUS_OK and
+                time.time() - state['enriched_at'] < self.max_age)
+
+    def record(self, key: str, site_web: Optional[str], enriched) -> None:
+        """
+        Enregistre le résultat d'enrich_site (dict) ou l'exception levée.
+
+        Un enrichissement est en échec s'il a levé une exception, ou s'il n'a
+        trouvé aucun email et rencontré des erreurs.
+        """
+        if isinstance(enriched, Exception):
+            status, result, errors = STATUS_FAILED, {}, [str(enriched)]
+        else:
+            result = dict(enriched)
+            errors = result.pop('errors', None) or []
+            email_found = result.get('email') not in (None, 'formulaire')
+            status = STATUS_FAILED if errors and not email_found else STATUS_OK
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO enrichment_state (key, site_web, enriched_at, status, result, errors) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, site_web, time.time(), status, json.dumps(result, ensure_ascii=False),
+             json.dumps(errors, ensure_ascii=False))
+        )
+
+    def commit(self) -> None:
+        self.conn.commit()
+
+    def counts(self) -> dict:
+        """
+        Nombre d'entrées par statut.
+        """
+        return dict(self.conn.execute(
+            "SELECT status, COUNT(*) FROM enrichment_state GROUP BY status"
+        ).fetchall())
+
+    def close(self) -> None:
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+__all__ = ['EnrichmentStateStore', 'company_key']
@@ -0,0 +1,277 @@
+"""
+Export des entreprises: CSV, Parquet et JSONL.
+
+Les colonnes finales sont sélectionnées une seule fois (vue, sans copie)
+puis chaque format est écrit dans un fichier temporaire du même dossier,
+renommé à la fin (os.replace): un lecteur ne voit jamais de fichier
+partiel et une erreur laisse l'export précédent intact. Le mode streaming
+(AppendExport) écrit au contraire directement dans la sortie, lot par lot.
+
+Parquet nécessite pyarrow (optionnel): colonnes typées (catégories en
+dictionnaire), compression zstd ou snappy, statistiques par row group,
+partitionnement optionnel par canton (un dossier canton=XX par valeur).
+"""
+import logging
+import os
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+# Colonnes finales, dans l'ordre d'export
+EXPORT_COLUMNS = ['company_name', 'canton', 'ville', 'site_web', 'email', 'telephone',
+                  'specialites', 'source_url', 'notes', 'tag_gc']
+
+# Format -> extension du fichier de sortie
+FORMATS = {'csv': '.csv', 'parquet': '.parquet', 'jsonl': '.jsonl'}
+
+# Formats pouvant être écrits lot par lot (mode streaming)
+APPENDABLE_FORMATS = ('csv', 'jsonl')
+
+PARQUET_COMPRESSIONS = ('zstd', 'snappy')
+
+# Lignes par row group Parquet (statistiques min/max par groupe)
+ROW_GROUP_SIZE = 50_000
+
+# Lignes sérialisées à la fois en JSONL
+JSONL_CHUNK_SIZE = 10_000
+
+
+def export_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Colonnes finales présentes, dans l'ordre d'EXPORT_COLUMNS.
+    """
+    return df[[col for col in EXPORT_COLUMNS if col in df.columns]]
+
+
+def parse_formats(value: str) -> List[str]:
+    """
+    Formats d'une option --format (ex: 'csv,parquet').
+
+    Raises:
+        ValueError: Format inconnu
+    """
+    formats = [fmt.strip().lower() for fmt in value.split(',') if fmt.strip()]
+    unknown = [fmt for fmt in formats if fmt not in FORMATS]
+    if unknown:
+        raise ValueError(f"Format(s) inconnu(s): {', '.join(unknown)} "
+                         f"(disponibles: {', '.join(FORMATS)})")
+    return list(dict.fromkeys(formats)) or ['csv']
+
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def format_path(output_path: Path, fmt: str) -> Path:
+    """
+    Chemin de sortie d'un format (extension remplacée).
+    """
+    return Path(output_path).with_suffix(FORMATS[fmt])
+
+
+def _temporary(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def _publish(tmp: Path, path: Path) -> None:
+    """
+    Remplace path par tmp (fichier ou dossier).
+    """
+    if path.is_dir() or (tmp.is_dir() and path.exists()):
+        # os.replace ne remplace pas un dossier: l'ancien est écarté d'abord
+        old = path.with_name(f".{path.name}.{os.getpid()}.old")
+        _remove(old)
+        path.rename(old)
+        tmp.rename(path)
+        _remove(old)
+    else:
+        os.replace(tmp, path)
+
+
+@contextmanager
+def atomic_path(path: Path, directory: bool = False) -> Iterator[Path]:
+    """
+    Chemin temporaire renommé en path à la sortie du bloc (supprimé en cas d'erreur).
+
+    Args:
+        path: Destination finale
+        directory: Si True, le temporaire est un dossier (Parquet partitionné)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _temporary(path)
+    _remove(tmp)
+    if directory:
+        tmp.mkdir()
+    try:
+        yield tmp
+    except BaseException:
+        _remove(tmp)
+        raise
+    _publish(tmp, path)
+
+
+def write_csv(df: pd.DataFrame, path: Path, append: bool = False) -> Path:
+    """
+    Écrit df en CSV (remplacement atomique, ou ajout avec en-tête si le fichier est vide).
+    """
+    path = Path(path)
+    if append:
+        header = not path.exists() or path.stat().st_size == 0
+        df.to_csv(path, mode='a', header=header, index=False, encoding='utf-8')
+        return path
+    with atomic_path(path) as tmp:
+        df.to_csv(tmp, index=False, encoding='utf-8')
+    return path
+
+
+def _jsonl_chunks(df: pd.DataFrame, chunk_size: int) -> Iterator[str]:
+    for start in range(0, len(df), chunk_size):
+        text = df.iloc[start:start + chunk_size].to_json(orient='records', lines=True,
+                                                         force_ascii=False)
+        yield text if text.endswith('\n') else text + '\n'
+
+
+def write_jsonl(df: pd.DataFrame, path: Path, append: bool = False,
+                chunk_size: int = JSONL_CHUNK_SIZE) -> Path:
+    """
+    Écrit df en JSON Lines (un objet par entreprise), par tranches de chunk_size lignes.
+    """
+    path = Path(path)
+    if append:
+        with open(path, 'a', encoding='utf-8') as f:
+            f.writelines(_jsonl_chunks(df, chunk_size))
+        return path
+    with atomic_path(path) as tmp:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.writelines(_jsonl_chunks(df, chunk_size))
+    return path
+
+
+def write_parquet(df: pd.DataFrame, path: Path, compression: str = 'zstd',
+                  partition_by: Optional[Sequence[str]] = None,
+                  row_group_size: int = ROW_GROUP_SIZE) -> Path:
+    """
+    Écrit df en Parquet (pyarrow).
+
+    Args:
+        df: DataFrame à écrire
+        path: Fichier de sortie (dossier si partition_by)
+        compression: 'zstd' ou 'snappy'
+        partition_by: Colonnes de partitionnement (ex: ['canton'])
+        row_group_size: Lignes par row group (fichier non partitionné)
+
+    Raises:
+        ImportError: pyarrow non installé
+    """
+    if not parquet_available():
+        raise ImportError("pyarrow requis pour l'export Parquet (pip install pyarrow)")
+    if compression not in PARQUET_COMPRESSIONS:
+        raise ValueError(f"Compression Parquet inconnue: {compression}")
+    path = Path(path)
+    if partition_by:
+        with atomic_path(path, directory=True) as tmp:
+            df.to_parquet(tmp, engine='pyarrow', compression=compression, index=False,
+                          partition_cols=list(partition_by))
+        return path
+    with atomic_path(path) as tmp:
+        df.to_parquet(tmp, engine='pyarrow', compression=compression, index=False,
+                      row_group_size=row_group_size, write_statistics=True)
+    return path
+
+
+def export_dataframe(df: pd.DataFrame, output_path: Path, formats: Iterable[str] = ('csv',),
+                     compression: str = 'zstd',
+                     partition_by: Optional[Sequence[str]] = None) -> List[Path]:
+    """
+    Exporte df dans chaque format demandé, depuis une seule sélection de colonnes.
+
+    Args:
+        df: DataFrame final
+        output_path: Chemin de sortie (l'extension est remplacée selon le format)
+        formats: Formats parmi FORMATS
+        compression: Compression Parquet
+        partition_by: Partitionnement Parquet (ex: ['canton'])
+
+    Returns:
+        Chemins écrits
+    """
+    df = export_columns(df)
+    paths = []
+    for fmt in formats:
+        path = format_path(output_path, fmt)
+        if fmt == 'csv':
+            write_csv(df, path)
+        elif fmt == 'jsonl':
+            write_jsonl(df, path)
+        elif fmt == 'parquet':
+            write_parquet(df, path, compression=compression, partition_by=partition_by)
+        else:
+            raise ValueError(f"Format inconnu: {fmt}")
+        paths.append(path)
+    return paths
+
+
+def read_export(path: Path) -> pd.DataFrame:
+    """
+    Relit un export (format déduit de l'extension).
+    """
+    path = Path(path)
+    if path.suffix == '.parquet':
+        return pd.read_parquet(path)
+    if path.suffix == '.jsonl':
+        return pd.read_json(path, lines=True)
+    return pd.read_csv(path)
+
+
+class AppendExport:
+    """
+    Export lot par lot (mode streaming).
+
+    Les lots sont ajoutés directement aux fichiers de sortie, vidés à la
+    création: les lignes déjà écrites restent disponibles pendant le run et
+    après une interruption. Chaque lot est aligné sur EXPORT_COLUMNS (colonnes
+    absentes vides), pour que toutes les lignes suivent l'en-tête du premier.
+    """
+
+    def __init__(self, output_path: Path, formats: Iterable[str] = ('csv',)):
+        formats = list(formats)
+        unsupported = [fmt for fmt in formats if fmt not in APPENDABLE_FORMATS]
+        if unsupported:
+            raise ValueError(f"Format(s) non disponibles par lots: {', '.join(unsupported)}")
+        self.paths = {fmt: format_path(output_path, fmt) for fmt in formats}
+        for path in self.paths.values():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b'')
+        self.rows = 0
+
+    def write(self, df: pd.DataFrame) -> None:
+        df = df.reindex(columns=EXPORT_COLUMNS)
+        for fmt, path in self.paths.items():
+            if fmt == 'csv':
+                write_csv(df, path, append=True)
+            else:
+                write_jsonl(df, path, append=True)
+        self.rows += len(df)
+
+
+__all__ = ['APPENDABLE_FORMATS', 'AppendExport', 'EXPORT_COLUMNS', 'FORMATS', 'atomic_path',
+           'export_columns', 'export_dataframe', 'format_path', 'parquet_available',
+           'parse_formats', 'read_export', 'write_csv', 'write_jsonl', 'write_parquet']
@@ -5,25 +5,41 @@ import argparse
 import logging
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 
 import pandas as pd
 from tqdm import tqdm
 
+from .utils.http_cache import ResponseCache
+from .utils.http_client import HttpClientPool
+from .utils.instrumentation import RunReport, current_report, instrumented_stage, measure
+
 logger = logging.getLogger(__name__)
 
 
-def load_sources(cantons: List[str], max_per_canton: Optional[int] = None) -> pd.DataFrame:
+def _pdf_cache_dir(pdf_path: Path) -> Path:
+    """
+    Cache des textes de PDF (data/intermediate/pdf_text_cache).
+    """
+    return pdf_path.parent.parent / 'intermediate' / 'pdf_text_cache'
+
+
+@instrumented_stage('load_sources')
+def load_sources(cantons: List[str], max_per_canton: Optional[int] = None,
+                 http: Optional[HttpClientPool] = None, pdf_workers: int = 0) -> pd.DataFrame:
     """
     Charge toutes les sources de données.
     
     Args:
         cantons: Liste de codes cantons à charger
         max_per_canton: Limite d'entreprises par canton (None = illimité)
+        http: Pool HTTP partagé (optionnel)
+        pdf_workers: Processus d'extraction du PDF SIA Vaud (0 = séquentiel)
         
     Returns:
         DataFrame agrégé de toutes les sources
     """
+    from .company_table import CompanyTable
     from .sources import sia_pdf_vaud, suisse_ing, local_annuaire
     
     logger.info(f"Chargement sources pour cantons: {', '.join(cantons)}")
@@ -32,7 +48,7 @@ def load_sources(cantons: List[str], max_per_canton: Optional[int] = None) -> pd
     
     # Source 1: Suisse.ing
     try:
-        df_suisse = suisse_ing.load_suisse_ing(cantons=cantons)
+        df_suisse = suisse_ing.load_suisse_ing(cantons=cantons, http=http)
         if not df_suisse.empty:
             logger.info(f"Suisse.ing: {len(df_suisse)} entreprises")
             all_dfs.append(df_suisse)
@@ -44,7 +60,8 @@ def load_sources(cantons: List[str], max_per_canton: Optional[int] = None) -> pd
         sia_path = Path(__file__).parent.parent.parent / 'data' / 'raw' / 'sia_vaud.pdf'
         if sia_path.exists():
             try:
-                df_sia = sia_pdf_vaud.load_sia_pdf_vaud(str(sia_path))
+                df_sia = sia_pdf_vaud.load_sia_pdf_vaud(str(sia_path), workers=pdf_workers,
+                                                        cache_dir=_pdf_cache_dir(sia_path))
                 if not df_sia.empty:
                     logger.info(f"SIA Vaud: {len(df_sia)} entreprises")
                     all_dfs.append(df_sia)
@@ -53,14 +70,14 @@ def load_sources(cantons: List[str], max_per_canton: Optional[int] = None) -> pd
     
     # TODO: Ajouter autres sources (annuaires locaux, etc.)
     
-    # Concaténer tous les DataFrames
+    # Concaténer tous les DataFrames (catégories unifiées)
     if all_dfs:
-        df_raw = pd.concat(all_dfs, ignore_index=True)
+        df_raw = CompanyTable.concat(all_dfs).frame
         logger.info(f"Total brut: {len(df_raw)} entreprises")
         
         # Limiter si max_per_canton
         if max_per_canton:
-            df_raw = df_raw.groupby('canton').head(max_per_canton).reset_index(drop=True)
+            df_raw = df_raw.groupby('canton', observed=True).head(max_per_canton).reset_index(drop=True)
             logger.info(f"Après limite: {len(df_raw)} entreprises")
     else:
         df_raw = pd.DataFrame(columns=['company_name', 'canton', 'ville', 'site_web', 
@@ -70,6 +87,67 @@ def load_sources(cantons: List[str], max_per_canton: Optional[int] = None) -> pd
     return df_raw
 
 
+def iter_source_batches(cantons: List[str], max_per_canton: Optional[int] = None,
+                        http: Optional[HttpClientPool] = None,
+                        batch_size: int = 500, pdf_workers: int = 0) -> Iterator[pd.DataFrame]:
+    """
+    Charge les sources par lots (mode streaming).
+    
+    Mêmes sources que load_sources, mais sans concaténation: chaque lot est
+    produit dès qu'il est disponible.
+    
+    Args:
+        cantons: Liste de codes cantons à charger
+        max_per_canton: Limite d'entreprises par canton (None = illimité)
+        http: Pool HTTP partagé (optionnel)
+        batch_size: Nombre max d'entreprises par lot
+        pdf_workers: Processus d'extraction du PDF SIA Vaud (0 = séquentiel)
+        
+    Yields:
+        DataFrames d'entreprises
+    """
+    from .sources import sia_pdf_vaud, suisse_ing
+    
+    logger.info(f"Chargement sources (streaming) pour cantons: {', '.join(cantons)}")
+    
+    per_canton = {}
+    
+    def limited(df):
+        if not max_per_canton or df.empty:
+            return df
+        keep = []
+        for canton in df['canton']:
+            count = per_canton.get(canton, 0)
+            keep.append(count < max_per_canton)
+            per_canton[canton] = count + 1
+        return df[keep].reset_index(drop=True)
+    
+    # Source 1: Suisse.ing
+    try:
+        for batch in suisse_ing.iter_suisse_ing(cantons=cantons, http=http, batch_size=batch_size):
+            batch = limited(batch)
+            if not batch.empty:
+                yield batch
+    except Exception as e:
+        logger.error(f"Erreur chargement Suisse.ing: {e}")
+    
+    # Source 2: SIA PDF Vaud (si canton VD)
+    if 'VD' in cantons:
+        sia_path = Path(__file__).parent.parent.parent / 'data' / 'raw' / 'sia_vaud.pdf'
+        if sia_path.exists():
+            try:
+                df_sia = sia_pdf_vaud.load_sia_pdf_vaud(str(sia_path), workers=pdf_workers,
+                                                        cache_dir=_pdf_cache_dir(sia_path))
+            except Exception as e:
+                logger.error(f"Erreur chargement SIA Vaud: {e}")
+                df_sia = pd.DataFrame()
+            for start in range(0, len(df_sia), batch_size):
+                batch = limited(df_sia.iloc[start:start + batch_size].reset_index(drop=True))
+                if not batch.empty:
+                    yield batch
+
+
+@instrumented_stage('normalize')
 def normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """
     Normalise un DataFrame d'entreprises.
@@ -80,38 +158,76 @@ def normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame normalisé
     """
-    from .utils import normalize_company_name, normalize_url, normalize_text
+    from .utils.normalizers import normalize_texts, normalize_urls
     
     logger.info("Normalisation des données...")
     
-    df = df.copy()
+    # Copie superficielle: les colonnes normalisées remplacent celles d'origine
+    df = df.copy(deep=False)
     
     # Normaliser noms
     if 'company_name' in df.columns:
-        df['company_name'] = df['company_name'].apply(
-            lambda x: normalize_text(str(x)) if pd.notna(x) else None
-        )
+        df['company_name'] = normalize_texts(df['company_name'])
     
     # Normaliser URLs
     if 'site_web' in df.columns:
-        df['site_web'] = df['site_web'].apply(normalize_url)
+        df['site_web'] = normalize_urls(df['site_web'])
     
     # Normaliser colonnes texte
     text_cols = ['ville', 'specialites', 'notes', 'telephone']
     for col in text_cols:
         if col in df.columns:
-            df[col] = df[col].apply(lambda x: normalize_text(str(x)) if pd.notna(x) else None)
+            df[col] = normalize_texts(df[col])
     
     return df
 
 
-def crawl_and_enrich(df: pd.DataFrame, no_crawl: bool = False) -> pd.DataFrame:
+def _apply_enrichment(df: pd.DataFrame, idx, enriched: dict) -> None:
+    """
+    Reporte le résultat d'enrich_site sur une ligne du DataFrame.
+    """
+    if 'email' in enriched:
+        df.at[idx, 'email'] = enriched['email']
+    if enriched.get('phones'):
+        df.at[idx, 'telephone'] = enriched['phones'][0]
+    if enriched.get('specialites'):
+        df.at[idx, 'specialites'] = enriched['specialites']
+
+
+def new_site_enricher(http: Optional[HttpClientPool] = None, concurrency: int = 1,
+                      parse_workers: int = 0, max_page_bytes: int = 512 * 1024):
+    """
+    SiteEnricher configuré comme dans crawl_and_enrich (options identiques).
+    """
+    from .crawler import SiteEnricher
+    
+    return SiteEnricher(http=http, parse_workers=parse_workers if concurrency > 1 else 0,
+                        max_page_bytes=max_page_bytes)
+
+
+@instrumented_stage('crawl')
+def crawl_and_enrich(df: pd.DataFrame, no_crawl: bool = False, concurrency: int = 1,
+                     http: Optional[HttpClientPool] = None,
+                     state_store=None, incremental: bool = False,
+                     parse_workers: int = 0, max_page_bytes: int = 512 * 1024,
+                     checkpoint=None, enricher=None) -> pd.DataFrame:
     """
     Enrichit les entreprises en crawlant leurs sites web.
     
     Args:
         df: DataFrame d'entreprises
         no_crawl: Si True, ne pas crawler
+        concurrency: Nombre de sites crawlés en parallèle (1 = séquentiel)
+        http: Pool HTTP partagé (optionnel)
+        state_store: EnrichmentStateStore où enregistrer les résultats (optionnel)
+        incremental: Si True, réutiliser les résultats récents du state_store
+                     et ne re-crawler que les entrées périmées ou en échec
+        parse_workers: Processus dédiés au parsing HTML (mode asynchrone uniquement)
+        max_page_bytes: Octets lus au maximum par page HTML
+        checkpoint: CrawlCheckpoint du run (optionnel): les sites déjà enrichis
+                    sont repris, les nouveaux résultats y sont enregistrés
+        enricher: SiteEnricher partagé entre appels (None = nouvel enricher):
+                  domaines morts, robots.txt et rate limit sont conservés
         
     Returns:
         DataFrame enrichi
@@ -120,55 +236,137 @@ def crawl_and_enrich(df: pd.DataFrame, no_crawl: bool = False) -> pd.DataFrame:
         logger.info("Mode --no-crawl activé, skip enrichissement")
         return df
     
-    from .crawler import SiteEnricher
+    from .crawler.state_store import company_key
     
     logger.info("Enrichissement via crawl...")
     
-    enricher = SiteEnricher()
+    if enricher is None:
+        enricher = new_site_enricher(http, concurrency, parse_workers, max_page_bytes)
     
     # Filtrer lignes avec site web et sans email valide
     to_enrich = df[
         df['site_web'].notna() & 
         (df['email'].isna() | (df['email'] == 'formulaire'))
-    ].copy()
+    ]
     
     if to_enrich.empty:
         logger.info("Aucune entreprise à enrichir")
         return df
     
+    # Clés d'état (domaine ou nom normalisé)
+    keys = {}
+    if state_store is not None or checkpoint is not None:
+        for idx, row in to_enrich.iterrows():
+            keys[idx] = company_key(row['site_web'], row.get('company_name'))
+    
+    # Reprise: résultats déjà enregistrés par le checkpoint du run
+    if checkpoint is not None:
+        resumed = []
+        for idx in to_enrich.index:
+            enriched = checkpoint.get(keys[idx]) if keys[idx] else None
+            if enriched is not None:
+                _apply_enrichment(df, idx, enriched)
+                resumed.append(idx)
+        if resumed:
+            to_enrich = to_enrich.drop(index=resumed)
+            logger.info(f"Reprise run {checkpoint.run_id}: {len(resumed)} entreprises déjà enrichies, "
+                        f"{len(to_enrich)} restantes")
+        if to_enrich.empty:
+            return df
+    
+    # Mode incrémental: réutiliser les résultats récents
+    if incremental and state_store is not None:
+        reused = []
+        for idx in to_enrich.index:
+            state = state_store.get(keys[idx]) if keys[idx] else None
+            if state_store.is_fresh(state):
+                _apply_enrichment(df, idx, state['result'])
+                reused.append(idx)
+        to_enrich = to_enrich.drop(index=reused)
+        logger.info(f"Mode incrémental: {len(reused)} entreprises à jour, "
+                    f"{len(to_enrich)} à re-crawler")
+        
+        if to_enrich.empty:
+            return df
+    
     logger.info(f"Enrichissement de {len(to_enrich)} entreprises...")
     
+    # Compteurs de retry avant cet appel (enricher partagé entre lots)
+    retry_stats = enricher.retry_policy.stats()
+    domain_retries = dict(enricher.retry_policy.domain_retries)
+    
     all_errors = []
-    for idx, row in tqdm(to_enrich.iterrows(), total=len(to_enrich), desc="Crawl"):
-        try:
-            existing_email = row.get('email')
-            enriched = enricher.enrich_site(row['site_web'], existing_email)
-            
-            # Mettre à jour
-            if 'email' in enriched:
-                df.at[idx, 'email'] = enriched['email']
-            if enriched.get('phones'):
-                df.at[idx, 'telephone'] = enriched['phones'][0]
-            if enriched.get('specialites'):
-                df.at[idx, 'specialites'] = enriched['specialites']
-            if enriched.get('errors'):
-                all_errors.append({
-                    'url': row['site_web'],
-                    'errors': enriched['errors']
-                })
-        except Exception as e:
-            logger.error(f"Erreur enrichissement: {e}")
+    
+    def handle_result(idx, row, enriched):
+        if state_store is not None and keys.get(idx):
+            state_store.record(keys[idx], row['site_web'], enriched)
+        if checkpoint is not None and keys.get(idx):
+            checkpoint.record(keys[idx], row['site_web'], enriched)
+        
+        if isinstance(enriched, Exception):
+            logger.error(f"Erreur enrichissement: {enriched}")
             all_errors.append({
                 'url': row.get('site_web', 'unknown'),
-                'errors': [str(e)]
+                'errors': [str(enriched)]
+            })
+            return
+        
+        _apply_enrichment(df, idx, enriched)
+        if enriched.get('errors'):
+            all_errors.append({
+                'url': row['site_web'],
+                'errors': enriched['errors']
             })
     
+    if concurrency > 1:
+        logger.info(f"Mode asynchrone: {concurrency} sites en parallèle"
+                    + (f", parsing sur {parse_workers} processus" if parse_workers > 0 else ""))
+        rows = list(to_enrich.iterrows())
+        items = [(row['site_web'], row.get('email')) for _, row in rows]
+        
+        # Résultats traités dès qu'un site est terminé (checkpoint au fil de l'eau)
+        try:
+            enricher.enrich_many(items, concurrency=concurrency,
+                                 on_result=lambda position, enriched: handle_result(*rows[position], enriched))
+        finally:
+            if checkpoint is not None:
+                checkpoint.flush()
+    else:
+        try:
+            for idx, row in tqdm(to_enrich.iterrows(), total=len(to_enrich), desc="Crawl"):
+                try:
+                    existing_email = row.get('email')
+                    enriched = enricher.enrich_site(row['site_web'], existing_email)
+                except Exception as e:
+                    enriched = e
+                
+                # Mettre à jour
+                handle_result(idx, row, enriched)
+        finally:
+            if checkpoint is not None:
+                checkpoint.flush()
+    
+    if state_store is not None:
+        state_store.commit()
+    
+    enricher.retry_policy.log_stats()
+    
+    report = current_report()
+    if report is not None:
+        report.add_counts('crawl', {'sites': len(to_enrich), 'errors': len(all_errors),
+                                    **{key: value - retry_stats[key]
+                                       for key, value in enricher.retry_policy.stats().items()}})
+        report.add_domain_stats({domain: {'retries': retries - domain_retries.get(domain, 0)}
+                                 for domain, retries in enricher.retry_policy.domain_retries.items()
+                                 if retries != domain_retries.get(domain, 0)})
+    
     if all_errors:
         logger.warning(f"{len(all_errors)} erreurs d'enrichissement enregistrées")
     
     return df
 
 
+@instrumented_stage('classify')
 def add_classifications(df: pd.DataFrame) -> pd.DataFrame:
     """
     Ajoute les classifications tag_gc.
@@ -179,16 +377,16 @@ def add_classifications(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame avec tag_gc
     """
-    from .utils import classify_tag_gc
+    from .utils import classify_tag_gc_batch
     
     logger.info("Classification tag_gc...")
     
-    def classify_row(row):
-        specialites = str(row.get('specialites', '')) if pd.notna(row.get('specialites')) else ''
-        company_name = str(row.get('company_name', '')) if pd.notna(row.get('company_name')) else ''
-        return classify_tag_gc(specialites, company_name)
-    
-    df['tag_gc'] = df.apply(classify_row, axis=1)
+    empty = pd.Series([None] * len(df), index=df.index)
+    # Catégories fixes (0-4): codes sur un octet, identiques d'un lot à l'autre
+    df['tag_gc'] = pd.Categorical(classify_tag_gc_batch(
+        df['specialites'] if 'specialites' in df.columns else empty,
+        df['company_name'] if 'company_name' in df.columns else empty
+    ), categories=range(5))
     
     # Stats
     tag_counts = df['tag_gc'].value_counts()
@@ -197,55 +395,115 @@ def add_classifications(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def export_csv(df: pd.DataFrame, output_path: Path) -> None:
+@instrumented_stage('export')
+def export_outputs(df: pd.DataFrame, output_path: Path, formats: Iterable[str] = ('csv',),
+                   compression: str = 'zstd', partition_by_canton: bool = False) -> List[Path]:
     """
-    Exporte un DataFrame en CSV.
+    Exporte un DataFrame dans plusieurs formats (CSV, Parquet, JSONL).
     
     Args:
         df: DataFrame
-        output_path: Chemin de sortie
+        output_path: Chemin de sortie (extension remplacée selon le format)
+        formats: Formats à écrire
+        compression: Compression Parquet (zstd ou snappy)
+        partition_by_canton: Parquet partitionné par canton (un dossier par canton)
+        
+    Returns:
+        Chemins écrits
     """
-    logger.info(f"Export CSV vers {output_path}")
-    
-    # Colonnes finales
-    final_cols = ['company_name', 'canton', 'ville', 'site_web', 'email', 'telephone', 
-                  'specialites', 'source_url', 'notes', 'tag_gc']
+    from .export import export_dataframe
     
-    # Garder seulement colonnes présentes
-    df_export = df[[col for col in final_cols if col in df.columns]].copy()
+    paths = export_dataframe(df, output_path, formats, compression=compression,
+                             partition_by=['canton'] if partition_by_canton else None)
+    for path in paths:
+        logger.info(f"Export {path.suffix.lstrip('.')} terminé: {len(df)} lignes -> {path}")
+    return paths
+
+
+def run_streaming(batches: Iterable[pd.DataFrame], output_path: Path, no_crawl: bool = False,
+                  formats: Iterable[str] = ('csv',), **crawl_options) -> int:
+    """
+    Exécute le pipeline lot par lot, à mémoire bornée.
     
-    # Réorganiser colonnes
-    present_cols = [col for col in final_cols if col in df_export.columns]
-    df_export = df_export[present_cols]
+    Chaque lot est normalisé, enrichi, dédupliqué contre l'index global
+    (StreamingDeduplicator), classifié puis ajouté aux fichiers de sortie:
+    les lignes écrites restent disponibles si le run est interrompu. Seuls
+    l'index de déduplication et le lot courant restent en mémoire.
     
-    # Export
-    df_export.to_csv(output_path, index=False, encoding='utf-8')
-    logger.info(f"Export terminé: {len(df_export)} lignes")
+    Args:
+        batches: Lots d'entreprises (iter_source_batches)
+        output_path: Fichier de sortie (remplacé, extension selon le format)
+        no_crawl: Si True, ne pas crawler
+        formats: Formats écrits lot par lot (csv, jsonl)
+        **crawl_options: Options transmises à crawl_and_enrich
+        
+    Returns:
+        Nombre d'entreprises écrites
+    """
+    from .export import AppendExport
+    from .utils.deduplication import StreamingDeduplicator
+    
+    output = AppendExport(Path(output_path), formats)
+    dedup = StreamingDeduplicator()
+    if not no_crawl and crawl_options.get('enricher') is None:
+        # Un seul enricher pour tout le run: domaines morts, robots.txt en
+        # cache et rate limit par domaine survivent aux changements de lot
+        crawl_options['enricher'] = new_site_enricher(**{
+            key: crawl_options[key] for key in ('http', 'concurrency', 'parse_workers', 'max_page_bytes')
+            if key in crawl_options
+        })
+    written = 0
+    for number, batch in enumerate(batches, 1):
+        logger.info(f"Lot {number}: {len(batch)} entreprises")
+        batch = normalize_dataframe(batch)
+        batch = crawl_and_enrich(batch, no_crawl, **crawl_options)
+        with measure('dedup', rows_in=len(batch)) as stage:
+            batch = dedup.filter(batch)
+            stage['rows_out'] = len(batch)
+        if batch.empty:
+            continue
+        batch = add_classifications(batch)
+        with measure('export', rows_in=len(batch)):
+            output.write(batch)
+        written += len(batch)
+        logger.info(f"Lot {number}: {len(batch)} entreprises écrites ({written} au total)")
+    
+    logger.info(f"Streaming terminé: {written} entreprises, {dedup.dropped} doublons écartés "
+                f"-> {output_path}")
+    return written
 
 
-def push_to_google_sheets(df: pd.DataFrame, spreadsheet_id: str, worksheet_name: str = 'Companies') -> None:
+@instrumented_stage('google_sheets')
+def push_to_google_sheets(df: pd.DataFrame, spreadsheet_id: str,
+                          worksheet_name: str = 'Companies') -> Optional[dict]:
     """
-    Push vers Google Sheets via gspread.
+    Synchronise Google Sheets via gspread (seules les cellules modifiées sont écrites).
     
     Args:
         df: DataFrame
         spreadsheet_id: ID de la feuille Google
         worksheet_name: Nom de l'onglet
+        
+    Returns:
+        Compteurs de SheetSync.sync, None si la synchronisation n'a pas eu lieu
     """
     try:
         import gspread
         from google.oauth2.service_account import Credentials
     except ImportError:
         logger.error("gspread ou google-auth non installés, skip Google Sheets")
-        return
+        return None
+    
+    from .config import SERVICE_ACCOUNT_PATH
+    from .sheets_sync import SheetSync
     
-    logger.info("Push vers Google Sheets...")
+    logger.info("Synchronisation Google Sheets...")
     
     # Credentials
-    creds_path = Path(__file__).parent / 'config' / 'service_account.json'
+    creds_path = SERVICE_ACCOUNT_PATH
     if not creds_path.exists():
         logger.error(f"Credentials introuvables: {creds_path}")
-        return
+        return None
     
     try:
         scope = ['https://www.googleapis.com/auth/spreadsheets']
@@ -256,14 +514,19 @@ def push_to_google_sheets(df: pd.DataFrame, spreadsheet_id: str, worksheet_name:
         sheet = gc.open_by_key(spreadsheet_id)
         worksheet = sheet.worksheet(worksheet_name)
         
-        # Clear et push
-        worksheet.clear()
-        worksheet.append_row(df.columns.tolist())
-        worksheet.append_rows(df.values.tolist())
+        # Diff par clé (domaine / nom normalisé) et batch_update des plages modifiées
+        stats = SheetSync(worksheet).sync(df)
         
-        logger.info(f"Push réussi: {len(df)} lignes")
+        logger.info(f"Synchronisation réussie: {stats['updated']} lignes modifiées, "
+                    f"{stats['appended']} ajoutées, {stats['unchanged']} inchangées "
+                    f"({stats['requests']} requêtes, {stats['retries']} retries)")
+        report = current_report()
+        if report is not None:
+            report.add_counts('google_sheets', stats)
+        return stats
     except Exception as e:
         logger.error(f"Erreur push Google Sheets: {e}")
+        return None
 
 
 def main():
@@ -277,7 +540,15 @@ def main():
 Exemples:
   python -m src.pipeline --cantons "GE,VD"
   python -m src.pipeline --cantons "VD" --max-per-canton 50 --no-crawl
+  python -m src.pipeline --cantons "GE,VD" --concurrency 20
+  python -m src.pipeline --cantons "GE,VD" --concurrency 20 --parse-workers 4
+  python -m src.pipeline --cantons "VD" --pdf-workers 4
+  python -m src.pipeline --offline
+  python -m src.pipeline --cantons "GE,VD,VS,FR,NE,JU,BE,ZH" --streaming --batch-size 200
+  python -m src.pipeline --incremental --max-age 24
+  python -m src.pipeline --resume 20240131-142501
   python -m src.pipeline --sheets
+  python -m src.pipeline --format csv,parquet,jsonl --partition-by-canton
         """
     )
     
@@ -287,13 +558,79 @@ Exemples:
                        help="Limite d'entreprises par canton (default: None)")
     parser.add_argument('--no-crawl', action='store_true',
                        help="Ne pas crawler les sites web")
+    parser.add_argument('--concurrency', type=int, default=1,
+                       help="Nombre de sites crawlés en parallèle (default: 1 = séquentiel)")
+    parser.add_argument('--parse-workers', type=int, default=0,
+                       help="Processus dédiés au parsing HTML avec --concurrency > 1 "
+                            "(default: 0 = parsing dans le processus principal)")
+    parser.add_argument('--pdf-workers', type=int, default=0,
+                       help="Processus d'extraction du texte du PDF SIA Vaud "
+                            "(default: 0 = extraction dans le processus principal)")
+    parser.add_argument('--max-page-kb', type=int, default=512,
+                       help="Ko lus au maximum par page HTML, le reste est ignoré (default: 512)")
+    parser.add_argument('--max-connections', type=int, default=100,
+                       help="Taille max du pool de connexions HTTP (default: 100)")
+    parser.add_argument('--http2', action='store_true',
+                       help="Activer HTTP/2 (nécessite le paquet h2)")
+    parser.add_argument('--cache-ttl', type=float, default=168,
+                       help="Durée (heures) pendant laquelle une page en cache est réutilisée sans "
+                            "revalidation (default: 168, 0 = toujours revalider)")
+    parser.add_argument('--offline', action='store_true',
+                       help="Ne faire aucune requête réseau, utiliser uniquement le cache HTTP")
+    parser.add_argument('--incremental', action='store_true',
+                       help="Ne re-crawler que les entreprises périmées ou en échec")
+    parser.add_argument('--max-age', type=float, default=720,
+                       help="Âge max (heures) d'un enrichissement avant re-crawl en mode "
+                            "--incremental (default: 720)")
+    parser.add_argument('--review-duplicates', action='store_true',
+                       help="Exporter les doublons potentiels (fuzzy) dans "
+                            "data/intermediate/potential_duplicates.csv")
+    parser.add_argument('--resume', type=str, default=None, metavar='RUN_ID',
+                       help="Reprendre un run interrompu (sites déjà enrichis non re-crawlés)")
+    parser.add_argument('--checkpoint-every', type=int, default=50,
+                       help="Nombre de sites enrichis entre deux checkpoints (default: 50)")
+    parser.add_argument('--streaming', action='store_true',
+                       help="Traiter les sources par lots et écrire la sortie au fur et à mesure "
+                            "(mémoire bornée)")
+    parser.add_argument('--batch-size', type=int, default=500,
+                       help="Taille des lots en mode --streaming (default: 500)")
     parser.add_argument('--sheets', action='store_true',
-                       help="Push vers Google Sheets (nécessite credentials)")
+                       help="Synchroniser Google Sheets (nécessite credentials et "
+                            "src/config/sheets.json ou GC_SPREADSHEET_ID)")
+    parser.add_argument('--spreadsheet-id', type=str, default=None,
+                       help="ID de la feuille Google (remplace la configuration)")
     parser.add_argument('--output', type=str, default=None,
-                       help="Chemin de sortie CSV (default: data/final/companies_gc_romandie.csv)")
+                       help="Chemin de sortie, extension remplacée selon le format "
+                            "(default: data/final/companies_gc_romandie.csv)")
+    parser.add_argument('--format', type=str, default='csv',
+                       help="Formats de sortie séparés par virgule: csv, parquet, jsonl "
+                            "(default: csv; parquet nécessite pyarrow)")
+    parser.add_argument('--compression', choices=['zstd', 'snappy'], default='zstd',
+                       help="Compression Parquet (default: zstd)")
+    parser.add_argument('--partition-by-canton', action='store_true',
+                       help="Parquet partitionné par canton (un dossier canton=XX par valeur)")
     
     args = parser.parse_args()
     
+    from .export import APPENDABLE_FORMATS, format_path, parquet_available, parse_formats, read_export
+    try:
+        formats = parse_formats(args.format)
+    except ValueError as e:
+        parser.error(str(e))
+    if 'parquet' in formats and not parquet_available():
+        parser.error("--format parquet nécessite pyarrow (pip install pyarrow)")
+    
+    # Feuille Google Sheets (config, variables d'environnement ou --spreadsheet-id)
+    sheets_config = None
+    if args.sheets:
+        from .config import load_sheets_config
+        sheets_config = load_sheets_config()
+        if args.spreadsheet_id:
+            sheets_config['spreadsheet_id'] = args.spreadsheet_id
+        if not sheets_config['spreadsheet_id']:
+            parser.error("--sheets nécessite un spreadsheet_id (src/config/sheets.json, "
+                         "GC_SPREADSHEET_ID ou --spreadsheet-id)")
+    
     # Parse cantons
     cantons = [c.strip().upper() for c in args.cantons.split(',')]
     
@@ -314,9 +651,71 @@ Exemples:
         force=True  # Override si déjà configuré
     )
     
+    # Client HTTP partagé par les sources et le crawler
+    cache = ResponseCache(data_dir / 'intermediate' / 'http_cache',
+                          ttl=args.cache_ttl * 3600, offline=args.offline)
+    http = HttpClientPool(max_connections=args.max_connections, http2=args.http2, cache=cache)
+    
+    # État d'enrichissement par entreprise (runs incrémentaux)
+    from .crawler.state_store import EnrichmentStateStore
+    state_store = EnrichmentStateStore(data_dir / 'intermediate' / 'enrichment_state.sqlite',
+                                       max_age=args.max_age * 3600)
+    
+    if args.output:
+        output_path = Path(args.output)
+    else:
+        output_path = data_dir / 'final' / 'companies_gc_romandie.csv'
+    
+    # Checkpoints du run (reprise avec --resume RUN_ID)
+    from .crawler.checkpoint import CrawlCheckpoint
+    try:
+        checkpoint = CrawlCheckpoint(data_dir / 'intermediate' / 'checkpoints', run_id=args.resume,
+                                     every=args.checkpoint_every, resume=bool(args.resume))
+    except FileNotFoundError as e:
+        parser.error(f"--resume: {e}")
+    logger.info(f"Run {checkpoint.run_id} (reprendre avec --resume {checkpoint.run_id})")
+    
+    # Mesures par étape (rapport JSON à côté d'errors.log)
+    report = RunReport(run_id=checkpoint.run_id)
+    report.activate()
+    
+    crawl_options = {
+        'checkpoint': checkpoint,
+        'concurrency': args.concurrency,
+        'http': http,
+        'state_store': state_store,
+        'incremental': args.incremental,
+        'parse_workers': args.parse_workers,
+        'max_page_bytes': args.max_page_kb * 1024
+    }
+    
     try:
+        if args.streaming:
+            if args.review_duplicates:
+                logger.warning("--review-duplicates ignoré en mode --streaming")
+            streaming_formats = [fmt for fmt in formats if fmt in APPENDABLE_FORMATS]
+            if len(streaming_formats) < len(formats):
+                logger.warning("--format parquet ignoré en mode --streaming (csv/jsonl uniquement)")
+            if not streaming_formats:
+                streaming_formats = ['csv']
+            batches = iter_source_batches(cantons, args.max_per_canton, http=http,
+                                          batch_size=args.batch_size, pdf_workers=args.pdf_workers)
+            written = run_streaming(batches, output_path, args.no_crawl,
+                                    formats=streaming_formats, **crawl_options)
+            if not written:
+                logger.error("Aucune donnée à traiter")
+                return 1
+            
+            if sheets_config:
+                push_to_google_sheets(read_export(format_path(output_path, streaming_formats[0])),
+                                      sheets_config['spreadsheet_id'], sheets_config['worksheet'])
+            
+            checkpoint.close(completed=True)
+            logger.info("Pipeline terminé avec succès")
+            return 0
+        
         # 1. Charger sources
-        df = load_sources(cantons, args.max_per_canton)
+        df = load_sources(cantons, args.max_per_canton, http=http, pdf_workers=args.pdf_workers)
         
         if df.empty:
             logger.error("Aucune donnée à traiter")
@@ -328,36 +727,50 @@ Exemples:
         df = normalize_dataframe(df)
         
         # 3. Crawler et enrichir
-        df = crawl_and_enrich(df, args.no_crawl)
+        df = crawl_and_enrich(df, args.no_crawl, **crawl_options)
         
         # 4. Dédupliquer
         logger.info("Déduplication...")
         from .utils import deduplicate_dataframe
-        df = deduplicate_dataframe(df)
+        with measure('dedup', rows_in=len(df)) as stage:
+            df = deduplicate_dataframe(df)
+            stage['rows_out'] = len(df)
         logger.info(f"Après dédup: {len(df)} entreprises")
         
+        if args.review_duplicates:
+            from .utils.fuzzy_matching import find_candidate_pairs
+            pairs = find_candidate_pairs(df)
+            pairs_path = data_dir / 'intermediate' / 'potential_duplicates.csv'
+            pairs.to_csv(pairs_path, index=False, encoding='utf-8')
+            logger.info(f"{len(pairs)} doublons potentiels exportés vers {pairs_path}")
+        
         # 5. Classifier
         df = add_classifications(df)
         
-        # 6. Exporter
-        if args.output:
-            output_path = Path(args.output)
-        else:
-            output_path = data_dir / 'final' / 'companies_gc_romandie.csv'
-        
-        export_csv(df, output_path)
+        # 6. Exporter (tous les formats depuis la même table)
+        export_outputs(df, output_path, formats, compression=args.compression,
+                       partition_by_canton=args.partition_by_canton)
         
         # 7. Optionnel: Google Sheets
-        if args.sheets:
-            spreadsheet_id = "YOUR_SPREADSHEET_ID"  # TODO: config
-            push_to_google_sheets(df, spreadsheet_id)
+        if sheets_config:
+            push_to_google_sheets(df, sheets_config['spreadsheet_id'], sheets_config['worksheet'])
         
+        checkpoint.close(completed=True)
         logger.info("Pipeline terminé avec succès")
         return 0
         
     except Exception as e:
         logger.error(f"Erreur pipeline: {e}", exc_info=True)
         return 1
+    finally:
+        http.log_stats()
+        report.deactivate()
+        report.add_section('http', http.stats())
+        report.add_domain_stats(http.domain_stats)
+        report.write(data_dir / 'intermediate' / 'run_report.json')
+        report.log_summary()
+        http.close()
+        state_store.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,298 @@
+"""
+Synchronisation incrémentale d'un onglet Google Sheets.
+
+La feuille est lue une fois (get_all_values), chaque ligne est rattachée à
+une entreprise par sa clé (domaine du site, sinon nom normalisé, comme
+l'état d'enrichissement) et seules les cellules modifiées sont envoyées via
+batch_update, par paquets bornés en cellules et en plages. Les colonnes
+ajoutées à la main et les lignes absentes du run ne sont jamais touchées:
+les annotations manuelles survivent aux runs. Les réponses 429 (quota)
+sont retentées avec attente exponentielle.
+
+Le worksheet n'est utilisé qu'à travers get_all_values, batch_update,
+add_rows, add_cols, row_count et col_count: un faux backend local suffit
+pour les tests.
+"""
+import logging
+from typing import Iterator, List, Sequence
+
+import pandas as pd
+from tenacity import Retrying, retry_if_exception, stop_after_attempt, wait_exponential
+
+from .crawler.state_store import company_key
+from .export import export_columns
+
+logger = logging.getLogger(__name__)
+
+
+# Limites d'une requête batch_update (marge sous la taille max de payload de l'API)
+MAX_CELLS_PER_REQUEST = 10_000
+MAX_RANGES_PER_REQUEST = 500
+
+
+def is_rate_limited(exc: BaseException) -> bool:
+    """
+    True si l'erreur est un dépassement de quota (HTTP 429).
+    """
+    status = getattr(getattr(exc, 'response', None), 'status_code', None)
+    return status == 429 or getattr(exc, 'code', None) == 429
+
+
+def column_letter(position: int) -> str:
+    """
+    Lettre de colonne A1 d'une position 1-based (1 -> A, 27 -> AA).
+    """
+    letters = ''
+    while position > 0:
+        position, rest = divmod(position - 1, 26)
+        letters = chr(ord('A') + rest) + letters
+    return letters
+
+
+def a1_range(row: int, first_col: int, last_row: int, last_col: int) -> str:
+    return f"{column_letter(first_col)}{row}:{column_letter(last_col)}{last_row}"
+
+
+def _cell(value):
+    """
+    Valeur envoyée à la feuille (types Python natifs, '' si manquante).
+    """
+    if value is None or (not isinstance(value, (list, tuple)) and pd.isna(value)):
+        return ''
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _text(value) -> str:
+    """
+    Forme texte comparée à get_all_values (valeurs formatées par Sheets).
+    """
+    value = _cell(value)
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    return str(value)
+
+
+def _runs(positions: Sequence[int]) -> Iterator[List[int]]:
+    """
+    Positions consécutives regroupées ([1, 2, 5] -> [1, 2], [5]).
+    """
+    run = []
+    for position in positions:
+        if run and position != run[-1] + 1:
+            yield run
+            run = []
+        run.append(position)
+    if run:
+        yield run
+
+
+class SyncPlan:
+    """
+    Différences à appliquer: plages batch_update et compteurs.
+    """
+
+    def __init__(self):
+        self.data = []
+        self.header = []
+        self.updated = 0
+        self.unchanged = 0
+        self.appended = 0
+        self.skipped = 0
+        self.stale = 0
+        self.rows_needed = 0
+        self.cols_needed = 0
+
+    @property
+    def cells(self) -> int:
+        return sum(len(item['values']) * len(item['values'][0]) for item in self.data)
+
+    def stats(self) -> dict:
+        return {
+            'updated': self.updated,
+            'unchanged': self.unchanged,
+            'appended': self.appended,
+            'skipped': self.skipped,
+            'stale': self.stale,
+            'ranges': len(self.data),
+            'cells': self.cells
+        }
+
+
+class SheetSync:
+    """
+    Synchronise un DataFrame d'entreprises avec un worksheet gspread.
+    """
+
+    def __init__(self, worksheet, max_cells: int = MAX_CELLS_PER_REQUEST,
+                 max_ranges: int = MAX_RANGES_PER_REQUEST, max_attempts: int = 6,
+                 min_wait: float = 1.0, max_wait: float = 64.0):
+        """
+        Args:
+            worksheet: Onglet gspread (ou faux backend équivalent)
+            max_cells: Cellules max par requête batch_update
+            max_ranges: Plages max par requête batch_update
+            max_attempts: Tentatives max par requête en cas de 429
+            min_wait: Attente initiale entre tentatives (secondes)
+            max_wait: Attente max entre tentatives (secondes)
+        """
+        self.worksheet = worksheet
+        self.max_cells = max_cells
+        self.max_ranges = max_ranges
+        self.max_attempts = max_attempts
+        self.min_wait = min_wait
+        self.max_wait = max_wait
+        self.requests = 0
+        self.retries = 0
+
+    def _call(self, func, *args, **kwargs):
+        """
+        Appel API retenté sur 429.
+        """
+        def before_sleep(state):
+            self.retries += 1
+            logger.warning(f"Quota Google Sheets atteint, nouvelle tentative "
+                           f"({state.attempt_number}/{self.max_attempts})")
+
+        retrying = Retrying(
+            retry=retry_if_exception(is_rate_limited),
+            stop=stop_after_attempt(self.max_attempts),
+            wait=wait_exponential(multiplier=self.min_wait, min=self.min_wait, max=self.max_wait),
+            before_sleep=before_sleep,
+            reraise=True
+        )
+        self.requests += 1
+        return retrying(func, *args, **kwargs)
+
+    def plan(self, df: pd.DataFrame) -> SyncPlan:
+        """
+        Lit la feuille une fois et calcule les plages à écrire.
+        """
+        df = export_columns(df)
+        columns = list(df.columns)
+        values = self._call(self.worksheet.get_all_values)
+        header = list(values[0]) if values else []
+        rows = values[1:]
+
+        plan = SyncPlan()
+
+        # En-tête: colonnes gérées absentes ajoutées après les colonnes existantes
+        new_header = header + [col for col in columns if col not in header]
+        if len(new_header) > len(header):
+            plan.data.append({
+                'range': a1_range(1, len(header) + 1, 1, len(new_header)),
+                'values': [new_header[len(header):]]
+            })
+        plan.header = new_header
+        positions = [new_header.index(col) for col in columns]
+
+        # Lignes existantes par clé (première occurrence)
+        def cell(row, col):
+            position = header.index(col) if col in header else len(row)
+            return row[position] or None if position < len(row) else None
+
+        existing = {}
+        for number, row in enumerate(rows, start=2):
+            key = company_key(cell(row, 'site_web'), cell(row, 'company_name'))
+            if key is not None:
+                existing.setdefault(key, number)
+
+        records = df.astype(object).where(df.notna(), None)
+        site_values = records['site_web'] if 'site_web' in records.columns else [None] * len(df)
+        name_values = records['company_name'] if 'company_name' in records.columns else [None] * len(df)
+
+        seen = set()
+        appended = []
+        for record, site_web, company_name in zip(records.itertuples(index=False, name=None),
+                                                  site_values, name_values):
+            key = company_key(site_web, company_name)
+            if key is None or key in seen:
+                # Sans clé, une ligne serait ajoutée à chaque run
+                plan.skipped += 1
+                continue
+            seen.add(key)
+
+            number = existing.get(key)
+            if number is None:
+                row = [''] * (max(positions) + 1)
+                for i, position in enumerate(positions):
+                    row[position] = _cell(record[i])
+                appended.append(row)
+                continue
+
+            current = rows[number - 2]
+            changed = {positions[i]: record[i] for i in range(len(columns))
+                       if _text(current[positions[i]] if positions[i] < len(current) else '')
+                       != _text(record[i])}
+            if not changed:
+                plan.unchanged += 1
+                continue
+            plan.updated += 1
+            for run in _runs(sorted(changed)):
+                plan.data.append({
+                    'range': a1_range(number, run[0] + 1, number, run[-1] + 1),
+                    'values': [[_cell(changed[position]) for position in run]]
+                })
+
+        plan.stale = len(set(existing) - seen)
+
+        # Nouvelles lignes à la suite, en blocs contigus
+        if appended:
+            width = len(appended[0])
+            first = max(len(values), 1) + 1
+            block = max(1, self.max_cells // width)
+            for start in range(0, len(appended), block):
+                chunk = appended[start:start + block]
+                plan.data.append({
+                    'range': a1_range(first + start, 1, first + start + len(chunk) - 1, width),
+                    'values': chunk
+                })
+            plan.appended = len(appended)
+            plan.rows_needed = first + len(appended) - 1
+        plan.cols_needed = len(new_header)
+        return plan
+
+    def _batches(self, data: List[dict]) -> Iterator[List[dict]]:
+        """
+        Paquets de plages sous max_cells et max_ranges.
+        """
+        batch, cells = [], 0
+        for item in data:
+            size = len(item['values']) * len(item['values'][0])
+            if batch and (cells + size > self.max_cells or len(batch) >= self.max_ranges):
+                yield batch
+                batch, cells = [], 0
+            batch.append(item)
+            cells += size
+        if batch:
+            yield batch
+
+    def apply(self, plan: SyncPlan) -> dict:
+        """
+        Agrandit la grille si besoin puis envoie les plages par paquets.
+        """
+        if plan.rows_needed > self.worksheet.row_count:
+            self._call(self.worksheet.add_rows, plan.rows_needed - self.worksheet.row_count)
+        if plan.cols_needed > self.worksheet.col_count:
+            self._call(self.worksheet.add_cols, plan.cols_needed - self.worksheet.col_count)
+
+        for batch in self._batches(plan.data):
+            self._call(self.worksheet.batch_update, batch, value_input_option='RAW')
+
+        return {**plan.stats(), 'requests': self.requests, 'retries': self.retries}
+
+    def sync(self, df: pd.DataFrame) -> dict:
+        """
+        Calcule et applique les différences entre df et la feuille.
+
+        Returns:
+            Compteurs (lignes modifiées, ajoutées, inchangées, requêtes, retries)
+        """
+        return self.apply(self.plan(df))
+
+
+__all__ = ['MAX_CELLS_PER_REQUEST', 'MAX_RANGES_PER_REQUEST', 'SheetSync', 'SyncPlan',
+           'a1_range', 'column_letter', 'is_rate_limited']
@@ -4,9 +4,10 @@ Connecteurs génériques pour annuaires locaux.
 import logging
 import pandas as pd
 from typing import List, Optional
-import httpx
 from bs4 import BeautifulSoup
+from ..company_table import Company, companies_frame
 from ..utils import normalize_url
+from ..utils.http_client import HttpClientPool
 
 logger = logging.getLogger(__name__)
 
@@ -16,11 +17,12 @@ class GenericAnnuaireScraper:
     Scraper générique pour pages annuaires HTML simples.
     """
     
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, http: Optional[HttpClientPool] = None):
         self.timeout = timeout
+        self.http = http or HttpClientPool(timeout=timeout)
     
     def scrape_page(self, url: str, name_selector: str = "h2, h3", 
-                   info_selector: str = "p, div") -> List[dict]:
+                   info_selector: str = "p, div") -> List[Company]:
         """
         Scrape une page HTML générique d'annuaire.
         
@@ -30,18 +32,13 @@ class GenericAnnuaireScraper:
             info_selector: Selector CSS pour infos complémentaires
             
         Returns:
-            Liste de dicts entreprises
+            Liste d'entreprises (Company)
         """
         companies = []
         
         try:
-            with httpx.Client(timeout=self.timeout, follow_redirects=True) as client:
-                response = client.get(url, headers={
-                    'User-Agent': 'Mozilla/5.0 (compatible; GC-Romandie-Bot/1.0)',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'fr-FR,fr;q=0.9,en;q=0.8'
-                })
-                response.raise_for_status()
+            response = self.http.get(url, timeout=self.timeout)
+            response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'lxml')
             
@@ -49,10 +46,7 @@ class GenericAnnuaireScraper:
             name_elems = soup.select(name_selector)
             
             for elem in name_elems:
-                company = {
-                    'company_name': elem.get_text(strip=True),
-                    'source_url': url
-                }
+                company = Company(company_name=elem.get_text(strip=True), source_url=url)
                 
                 # Chercher infos dans éléments suivants
                 next_siblings = elem.find_next_siblings(limit=5)
@@ -64,15 +58,15 @@ class GenericAnnuaireScraper:
                     for link in links:
                         href = link['href']
                         if href.startswith('http'):
-                            company['site_web'] = normalize_url(href)
+                            company.site_web = normalize_url(href)
                     
                     # Emails
                     from ..utils.regex_patterns import extract_emails
                     emails = extract_emails(text)
                     if emails:
-                        company['email'] = emails[0]
+                        company.email = emails[0]
                 
-                if company.get('company_name'):
+                if company.company_name:
                     companies.append(company)
         
         except Exception as e:
@@ -81,35 +75,28 @@ class GenericAnnuaireScraper:
         return companies
 
 
-def load_generic_annuaire(url: str, canton: str) -> pd.DataFrame:
+def load_generic_annuaire(url: str, canton: str,
+                          http: Optional[HttpClientPool] = None) -> pd.DataFrame:
     """
     Charge depuis un annuaire générique.
     
     Args:
         url: URL de l'annuaire
         canton: Code canton
+        http: Pool HTTP partagé (optionnel)
         
     Returns:
         DataFrame avec entreprises
     """
-    scraper = GenericAnnuaireScraper()
+    scraper = GenericAnnuaireScraper(http=http)
     companies = scraper.scrape_page(url)
     
     # Ajouter canton si manquant
     for company in companies:
-        if 'canton' not in company:
-            company['canton'] = canton
+        if company.canton is None:
+            company.canton = canton
     
-    if companies:
-        df = pd.DataFrame(companies)
-        # Remplir colonnes manquantes
-        for col in ['company_name', 'canton', 'ville', 'site_web', 'email', 'telephone', 'source_url']:
-            if col not in df.columns:
-                df[col] = None
-        return df
-    else:
-        return pd.DataFrame(columns=['company_name', 'canton', 'ville', 'site_web', 
-                                    'email', 'telephone', 'source_url'])
+    return companies_frame(companies)
 
 
 __all__ = ['load_generic_annuaire', 'GenericAnnuaireScraper']
@@ -1,22 +1,174 @@
 """
 Parseur du PDF SIA Vaud (section Ingénieurs civils).
+
+L'extraction du texte (analyse de mise en page pdfplumber) domine le coût:
+les pages peuvent être réparties par tranches sur un pool de processus,
+chaque processus ouvrant le fichier lui-même, et les textes sont mis en
+cache par empreinte SHA-256 du PDF (un re-run sur le même fichier ne
+relance aucune extraction).
 """
+import hashlib
+import json
 import logging
+import os
 import pdfplumber
 import pandas as pd
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+from ..company_table import Company, companies_frame
 from ..utils import normalize_company_name, normalize_url
 from ..utils.regex_patterns import extract_emails, extract_phones
 
 logger = logging.getLogger(__name__)
 
 
-def parse_sia_pdf_vaud(pdf_path: str) -> pd.DataFrame:
+# Pages par tranche envoyée à un processus
+PAGES_PER_SHARD = 16
+
+# Version du format de cache (à incrémenter si l'extraction change)
+CACHE_VERSION = 1
+
+
+def pdf_hash(pdf_path: str) -> str:
+    """
+    Empreinte SHA-256 du contenu du PDF.
+    """
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _extract_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """
+    Textes des pages [start, stop) (exécuté dans un processus du pool).
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        return [page.extract_text() or '' for page in pdf.pages[start:stop]]
+
+
+def _page_count(pdf_path: str) -> int:
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+def _cache_path(cache_dir: Path, digest: str) -> Path:
+    return Path(cache_dir) / f"{digest}.json"
+
+
+def _read_cache(path: Path) -> Optional[List[str]]:
+    try:
+        data = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if data.get('version') != CACHE_VERSION:
+        return None
+    return data.get('pages')
+
+
+def _write_cache(path: Path, pages: List[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({'version': CACHE_VERSION, 'pages': pages}, ensure_ascii=False),
+                   encoding='utf-8')
+    os.replace(tmp, path)
+
+
+def extract_page_texts(pdf_path: str, workers: int = 0,
+                       cache_dir: Optional[Path] = None) -> List[str]:
+    """
+    Texte de chaque page du PDF, dans l'ordre des pages.
+
+    Args:
+        pdf_path: Chemin vers le PDF
+        workers: Processus d'extraction (0 = extraction dans le processus courant)
+        cache_dir: Dossier du cache de textes par empreinte du PDF (None = pas de cache)
+
+    Returns:
+        Liste des textes ('' pour une page sans texte)
+    """
+    cache_path = _cache_path(cache_dir, pdf_hash(pdf_path)) if cache_dir else None
+    if cache_path is not None:
+        pages = _read_cache(cache_path)
+        if pages is not None:
+            logger.info(f"SIA Vaud: {len(pages)} pages lues depuis le cache ({cache_path.name})")
+            return pages
+
+    count = _page_count(pdf_path)
+    shards = [(start, min(start + PAGES_PER_SHARD, count))
+              for start in range(0, count, PAGES_PER_SHARD)]
+
+    if workers > 0 and len(shards) > 1:
+        logger.info(f"SIA Vaud: extraction de {count} pages sur {workers} processus")
+        with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as pool:
+            # map conserve l'ordre des tranches
+            results = pool.map(_extract_range, [pdf_path] * len(shards),
+                               [start for start, _ in shards], [stop for _, stop in shards])
+            pages = [text for shard in results for text in shard]
+    else:
+        pages = _extract_range(pdf_path, 0, count)
+
+    if cache_path is not None:
+        _write_cache(cache_path, pages)
+    return pages
+
+
+def _parse_page(text: str, page_num: int, pdf_path: str) -> List[Company]:
+    """
+    Entreprises détectées dans le texte d'une page.
+    """
+    companies = []
+    
+    # Chercher entrées entreprises
+    # Format typique: Nom entreprise, Adresse, Ville, Tél, Email, Site
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    
+    # Heuristique simple pour détecter entrées
+    # TODO: Adapter selon format réel du PDF
+    current_entry = Company()
+    
+    for i, line in enumerate(lines):
+        # Détecter email
+        emails = extract_emails(line)
+        if emails:
+            current_entry.email = emails[0]
+        
+        # Détecter téléphone
+        phones = extract_phones(line)
+        if phones:
+            current_entry.telephone = phones[0]
+        
+        # Détecter URL
+        if 'http' in line.lower():
+            words = line.split()
+            for word in words:
+                if word.startswith('http'):
+                    current_entry.site_web = normalize_url(word)
+                    break
+        
+        # Si ligne contient Vaud, ce pourrait être une entreprise
+        if 'Vaud' in line or i % 5 == 0:
+            if current_entry.email or current_entry.telephone or current_entry.site_web:
+                current_entry.canton = 'VD'
+                current_entry.ville = current_entry.ville or 'Vaud'
+                current_entry.source_url = f"file://{pdf_path}#page={page_num+1}"
+                companies.append(current_entry)
+                current_entry = Company()
+    
+    return companies
+
+
+def parse_sia_pdf_vaud(pdf_path: str, workers: int = 0,
+                       cache_dir: Optional[Path] = None) -> pd.DataFrame:
     """
     Parse un PDF SIA Vaud et extrait les informations d'entreprises.
     
     Args:
         pdf_path: Chemin vers le PDF
+        workers: Processus d'extraction du texte (0 = séquentiel)
+        cache_dir: Dossier du cache de textes (None = pas de cache)
         
     Returns:
         DataFrame avec colonnes: company_name, canton, ville, site_web, email, telephone, source_url
@@ -24,69 +176,21 @@ def parse_sia_pdf_vaud(pdf_path: str) -> pd.DataFrame:
     companies = []
     
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                text = page.extract_text()
-                
-                if not text:
-                    continue
-                
-                # Chercher entrées entreprises
-                # Format typique: Nom entreprise, Adresse, Ville, Tél, Email, Site
-                lines = [line.strip() for line in text.split('\n') if line.strip()]
-                
-                # Heuristique simple pour détecter entrées
-                # TODO: Adapter selon format réel du PDF
-                current_entry = {}
-                
-                for i, line in enumerate(lines):
-                    # Détecter email
-                    emails = extract_emails(line)
-                    if emails:
-                        current_entry['email'] = emails[0]
-                    
-                    # Détecter téléphone
-                    phones = extract_phones(line)
-                    if phones:
-                        current_entry['telephone'] = phones[0]
-                    
-                    # Détecter URL
-                    if 'http' in line.lower():
-                        words = line.split()
-                        for word in words:
-                            if word.startswith('http'):
-                                current_entry['site_web'] = normalize_url(word)
-                                break
-                    
-                    # Si ligne contient Vaud, ce pourrait être une entreprise
-                    if 'Vaud' in line or i % 5 == 0:
-                        if current_entry:
-                            current_entry['canton'] = 'VD'
-                            current_entry['ville'] = current_entry.get('ville', 'Vaud')
-                            current_entry['source_url'] = f"file://{pdf_path}#page={page_num+1}"
-                            companies.append(current_entry)
-                            current_entry = {}
+        pages = extract_page_texts(pdf_path, workers=workers, cache_dir=cache_dir)
+        for page_num, text in enumerate(pages):
+            if text:
+                companies.extend(_parse_page(text, page_num, pdf_path))
         
         # Créer DataFrame
-        if companies:
-            df = pd.DataFrame(companies)
-            # Remplir colonnes manquantes
-            for col in ['company_name', 'canton', 'ville', 'site_web', 'email', 'telephone', 'source_url']:
-                if col not in df.columns:
-                    df[col] = None
-            return df
-        else:
-            # Retourner DataFrame vide avec colonnes
-            return pd.DataFrame(columns=['company_name', 'canton', 'ville', 'site_web', 
-                                        'email', 'telephone', 'source_url'])
+        return companies_frame(companies)
     
     except Exception as e:
         logger.error(f"Erreur parsing PDF {pdf_path}: {e}")
-        return pd.DataFrame(columns=['company_name', 'canton', 'ville', 'site_web', 
-                                    'email', 'telephone', 'source_url'])
+        return companies_frame([])
 
 
-def load_sia_pdf_vaud(pdf_path: Optional[str] = None) -> pd.DataFrame:
+def load_sia_pdf_vaud(pdf_path: Optional[str] = None, workers: int = 0,
+                      cache_dir: Optional[Path] = None) -> pd.DataFrame:
     """
     Charge les données SIA Vaud depuis un PDF.
     
@@ -94,17 +198,17 @@ def load_sia_pdf_vaud(pdf_path: Optional[str] = None) -> pd.DataFrame:
     
     Args:
         pdf_path: Chemin vers le PDF (optionnel)
+        workers: Processus d'extraction du texte (0 = séquentiel)
+        cache_dir: Dossier du cache de textes (None = pas de cache)
         
     Returns:
         DataFrame avec entreprises
     """
     if not pdf_path:
         logger.info("Pas de PDF SIA Vaud fourni")
-        return pd.DataFrame(columns=['company_name', 'canton', 'ville', 'site_web', 
-                                    'email', 'telephone', 'source_url'])
+        return companies_frame([])
     
-    return parse_sia_pdf_vaud(pdf_path)
-
+    return parse_sia_pdf_vaud(pdf_path, workers=workers, cache_dir=cache_dir)
 
-__all__ = ['load_sia_pdf_vaud', 'parse_sia_pdf_vaud']
 
+__all__ = ['extract_page_texts', 'load_sia_pdf_vaud', 'parse_sia_pdf_vaud', 'pdf_hash']
@@ -4,12 +4,14 @@ Connecteur pour suisse.ing (ex-USIC).
 import logging
 import time
 import pandas as pd
-from typing import List, Optional
+from typing import Iterator, List, Optional
 import httpx
 from bs4 import BeautifulSoup
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
 
+from ..company_table import Company, CompanyTable, companies_frame
 from ..utils import normalize_url
+from ..utils.http_client import CacheMissError, HttpClientPool
 from ..utils.regex_patterns import extract_emails
 
 logger = logging.getLogger(__name__)
@@ -32,28 +34,25 @@ class SuisseIngScraper:
     
     BASE_URL = "https://suisse.ing"
     
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, http: Optional[HttpClientPool] = None):
         self.timeout = timeout
+        self.http = http or HttpClientPool(timeout=timeout)
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10),
+           retry=retry_if_not_exception_type(CacheMissError))
     def _fetch_url(self, url: str) -> Optional[httpx.Response]:
         """
         Récupère une URL avec retry.
         """
         try:
-            with httpx.Client(timeout=self.timeout, follow_redirects=True) as client:
-                response = client.get(url, headers={
-                    'User-Agent': 'Mozilla/5.0 (compatible; GC-Romandie-Bot/1.0)',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'fr-FR,fr;q=0.9,en;q=0.8'
-                })
-                response.raise_for_status()
-                return response
+            response = self.http.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response
         except Exception as e:
             logger.warning(f"Erreur fetch {url}: {e}")
             raise
     
-    def scrape_canton(self, canton_code: str) -> List[dict]:
+    def scrape_canton(self, canton_code: str) -> List[Company]:
         """
         Scrape les entreprises d'un canton.
         
@@ -61,7 +60,7 @@ class SuisseIngScraper:
             canton_code: Code canton (GE, VD, etc.)
             
         Returns:
-            Liste de dicts entreprises
+            Liste d'entreprises (Company)
         """
         if canton_code not in ROMAND_CANTONS:
             logger.warning(f"Canton {canton_code} non supporté")
@@ -85,12 +84,12 @@ class SuisseIngScraper:
             company_divs = soup.find_all('div', class_=lambda x: x and 'company' in str(x).lower())
             
             for div in company_divs:
-                company = {}
+                company = Company(canton=canton_code, source_url=search_url)
                 
                 # Nom entreprise
                 name_elem = div.find('h3') or div.find('h2') or div.find('a', class_=lambda x: x and 'name' in str(x).lower())
                 if name_elem:
-                    company['company_name'] = name_elem.get_text(strip=True)
+                    company.company_name = name_elem.get_text(strip=True)
                 
                 # Ville
                 ville_elem = div.find('span', class_=lambda x: x and 'ville' in str(x).lower())
@@ -98,25 +97,23 @@ class SuisseIngScraper:
                     ville_elem = div.find(string=lambda x: x and ROMAND_CANTONS.get(canton_code, '').lower() in x.lower() if isinstance(x, str) else False)
                 if ville_elem:
                     if isinstance(ville_elem, str):
-                        company['ville'] = ville_elem.strip()
+                        company.ville = ville_elem.strip()
                     else:
-                        company['ville'] = ville_elem.get_text(strip=True)
+                        company.ville = ville_elem.get_text(strip=True)
                 
                 # Site web
                 link = div.find('a', href=lambda x: x and x.startswith('http'))
                 if link:
-                    company['site_web'] = normalize_url(link['href'])
+                    company.site_web = normalize_url(link['href'])
                 
                 # Email (souvent pas sur page liste, nécessite crawl individual)
                 
-                company['canton'] = canton_code
-                company['source_url'] = search_url
-                
-                if company.get('company_name'):
+                if company.company_name:
                     companies.append(company)
             
-            # Rate limit
-            time.sleep(1)
+            # Rate limit (inutile si servi depuis le cache)
+            if not response.extensions.get('from_cache'):
+                time.sleep(1)
             
         except Exception as e:
             logger.error(f"Erreur scrape canton {canton_code}: {e}")
@@ -137,29 +134,44 @@ class SuisseIngScraper:
             companies = self.scrape_canton(canton_code)
             all_companies.extend(companies)
         
-        if all_companies:
-            df = pd.DataFrame(all_companies)
-            # Remplir colonnes manquantes
-            for col in ['company_name', 'canton', 'ville', 'site_web', 'email', 'telephone', 'source_url']:
-                if col not in df.columns:
-                    df[col] = None
-            return df
-        else:
-            return pd.DataFrame(columns=['company_name', 'canton', 'ville', 'site_web', 
-                                        'email', 'telephone', 'source_url'])
+        return companies_frame(all_companies)
+
+
+def iter_suisse_ing(cantons: Optional[List[str]] = None, http: Optional[HttpClientPool] = None,
+                    batch_size: int = 500) -> Iterator[pd.DataFrame]:
+    """
+    Charge suisse.ing par lots (un canton après l'autre).
+    
+    Args:
+        cantons: Liste de codes cantons (None = tous les romands)
+        http: Pool HTTP partagé (optionnel)
+        batch_size: Nombre max d'entreprises par lot
+        
+    Yields:
+        DataFrames d'entreprises
+    """
+    scraper = SuisseIngScraper(http=http)
+    
+    for canton in cantons or list(ROMAND_CANTONS.keys()):
+        logger.info(f"Scraping suisse.ing pour {canton}...")
+        table = CompanyTable.from_records(scraper.scrape_canton(canton))
+        for batch in table.batches(batch_size):
+            yield batch.frame
 
 
-def load_suisse_ing(cantons: Optional[List[str]] = None) -> pd.DataFrame:
+def load_suisse_ing(cantons: Optional[List[str]] = None,
+                    http: Optional[HttpClientPool] = None) -> pd.DataFrame:
     """
     Charge les données depuis suisse.ing.
     
     Args:
         cantons: Liste de codes cantons (None = tous les romands)
+        http: Pool HTTP partagé (optionnel)
         
     Returns:
         DataFrame avec entreprises
     """
-    scraper = SuisseIngScraper()
+    scraper = SuisseIngScraper(http=http)
     
     if not cantons:
         cantons = list(ROMAND_CANTONS.keys())
@@ -171,17 +183,8 @@ def load_suisse_ing(cantons: Optional[List[str]] = None) -> pd.DataFrame:
         companies = scraper.scrape_canton(canton)
         all_companies.extend(companies)
     
-    if all_companies:
-        df = pd.DataFrame(all_companies)
-        # Remplir colonnes manquantes
-        for col in ['company_name', 'canton', 'ville', 'site_web', 'email', 'telephone', 'source_url']:
-            if col not in df.columns:
-                df[col] = None
-        return df
-    else:
-        return pd.DataFrame(columns=['company_name', 'canton', 'ville', 'site_web', 
-                                    'email', 'telephone', 'source_url'])
+    return companies_frame(all_companies)
 
 
-__all__ = ['load_suisse_ing', 'SuisseIngScraper']
+__all__ = ['load_suisse_ing', 'iter_suisse_ing', 'SuisseIngScraper']
 
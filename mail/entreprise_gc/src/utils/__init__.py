@@ -4,6 +4,7 @@ Module utilitaires pour le pipeline GC Romandie.
 from .regex_patterns import (
     extract_emails,
     extract_phones,
+    extract_contacts,
     clean_email,
     normalize_phone,
     is_webmail
@@ -11,22 +12,30 @@ from .regex_patterns import (
 from .normalizers import (
     normalize_company_name,
     normalize_url,
-    normalize_text
+    normalize_text,
+    normalize_company_names,
+    normalize_urls,
+    normalize_texts
 )
 from .deduplication import deduplicate_dataframe
-from .classification import classify_tag_gc, get_tag_gc_label
+from .classification import classify_tag_gc, classify_tag_gc_batch, get_tag_gc_label
 
 __all__ = [
     'extract_emails',
     'extract_phones',
+    'extract_contacts',
     'clean_email',
     'normalize_phone',
     'is_webmail',
     'normalize_company_name',
     'normalize_url',
     'normalize_text',
+    'normalize_company_names',
+    'normalize_urls',
+    'normalize_texts',
     'deduplicate_dataframe',
     'classify_tag_gc',
+    'classify_tag_gc_batch',
     'get_tag_gc_label'
 ]
 
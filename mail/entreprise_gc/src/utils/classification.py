@@ -2,7 +2,10 @@
 Module de classification des entreprises selon tag_gc.
 """
 import re
-from typing import List
+from typing import Dict, List, Set
+
+import numpy as np
+import pandas as pd
 
 
 # Mots-clés génie civil (core GC)
@@ -75,6 +78,160 @@ EDUCATION_KEYWORDS = {
 }
 
 
+# Mots-clés courts (<= 4 caractères) exigeant aussi une frontière de mot à droite
+# ("it", "lab", "eau"...). Les autres n'exigent qu'une frontière à gauche, ce qui
+# garde les composés allemands ("tiefbauarbeiten") et les pluriels.
+STRICT_BOUNDARY_MAX_LEN = 4
+
+# Séparateur des textes concaténés par classify_tag_gc_batch
+BATCH_SEPARATOR = '\x00'
+
+
+def _trie_regex(keywords) -> str:
+    """
+    Construit une alternance regex factorisée en trie (préfixes communs).
+    
+    Les branches les plus longues sont essayées en premier: la capture
+    correspond au mot-clé le plus long qui commence à la position.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = keyword
+    
+    def build(node) -> str:
+        alternatives = [re.escape(char) + build(child)
+                        for char, child in sorted(node.items()) if char]
+        if '' in node:
+            alternatives.append(r'\b' if len(node['']) <= STRICT_BOUNDARY_MAX_LEN else '')
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return '(?:' + '|'.join(alternatives) + ')'
+    
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    Recherche simultanée de plusieurs ensembles de mots-clés en une passe.
+    
+    Une seule regex (trie de tous les mots-clés, frontières de mots) est
+    compilée; chaque occurrence est rattachée à ses catégories. Un mot-clé
+    trouvé implique aussi les mots-clés plus courts qui en sont le préfixe
+    ("béton armé" implique "béton").
+    """
+    
+    def __init__(self, categories: Dict[str, Set[str]]):
+        """
+        Args:
+            categories: Nom de catégorie -> ensemble de mots-clés (minuscules)
+        """
+        self.categories = {name: frozenset(keywords) for name, keywords in categories.items()}
+        
+        all_keywords = set().union(*self.categories.values())
+        owners = {kw: [name for name, kws in self.categories.items() if kw in kws]
+                  for kw in all_keywords}
+        
+        # Mot-clé trouvé -> [(catégorie, mot-clé)] impliqués
+        self._implied = {}
+        for keyword in all_keywords:
+            implied = []
+            for prefix in all_keywords:
+                if not keyword.startswith(prefix):
+                    continue
+                if (len(prefix) <= STRICT_BOUNDARY_MAX_LEN and len(prefix) < len(keyword)
+                        and (keyword[len(prefix)].isalnum() or keyword[len(prefix)] == '_')):
+                    continue
+                implied.extend((name, prefix) for name in owners[prefix])
+            self._implied[keyword] = sorted(implied, key=lambda item: -len(item[1]))
+        
+        # Mot-clé trouvé -> catégories impliquées
+        self.keyword_categories = {
+            keyword: frozenset(name for name, _ in implied)
+            for keyword, implied in self._implied.items()
+        }
+        
+        trie = _trie_regex(all_keywords)
+        self.pattern = re.compile(r'(?=\b(' + trie + '))')
+        
+        # Balayage findall: mêmes occurrences (chevauchantes) que pattern, plus
+        # BATCH_SEPARATOR qui délimite les textes d'un buffer batch.
+        self.scan_pattern = re.compile(r'(?=(' + BATCH_SEPARATOR + r'|\b(?:' + trie + ')))')
+        self.category_bits = {name: 1 << i for i, name in enumerate(self.categories)}
+        self.scan_bits = {
+            keyword: sum(self.category_bits[name] for name in names)
+            for keyword, names in self.keyword_categories.items()
+        }
+    
+    def find(self, text: str) -> Dict[str, List[str]]:
+        """
+        Mots-clés trouvés par catégorie, dans l'ordre d'apparition.
+        
+        Args:
+            text: Texte en minuscules
+            
+        Returns:
+            Dict catégorie -> liste de mots-clés (toutes catégories présentes)
+        """
+        found = {name: {} for name in self.categories}
+        for match in self.pattern.finditer(text):
+            for name, keyword in self._implied[match.group(1)]:
+                found[name][keyword] = None
+        return {name: list(keywords) for name, keywords in found.items()}
+    
+    def categories_found(self, text: str) -> Set[str]:
+        """
+        Catégories ayant au moins un mot-clé dans le texte.
+        """
+        found = set()
+        for keyword in self.scan_pattern.findall(text):
+            found.update(self.keyword_categories.get(keyword, ()))
+        return found
+    
+    def keywords(self, *names: str) -> List[str]:
+        """
+        Mots-clés (triés) d'une ou plusieurs catégories.
+        """
+        return sorted(set().union(*(self.categories[name] for name in names)))
+
+
+KEYWORD_MATCHER = KeywordMatcher({
+    'gc_core': GC_CORE_KEYWORDS,
+    'general': GENERAL_KEYWORDS,
+    'durable': DUrable_KEYWORDS,
+    'education': EDUCATION_KEYWORDS
+})
+
+
+def _tag_from_categories(found: Set[str]) -> int:
+    """
+    Applique les règles de priorité tag_gc aux catégories trouvées.
+    """
+    # Règles de classification
+    if 'gc_core' not in found:
+        # Pas de GC -> 0
+        return 0
+    
+    # GC trouvé
+    if 'general' in found:
+        # GC + général -> 2
+        return 2
+    
+    # GC seul -> 1, mais vérifier durable/éducation
+    if 'education' in found:
+        # GC + éducation -> 4 (priorité max)
+        return 4
+    
+    if 'durable' in found:
+        # GC + durable -> 3
+        return 3
+    
+    # GC pur
+    return 1
+
+
 def classify_tag_gc(specialites_text: str, company_name: str = "") -> int:
     """
     Classifie une entreprise selon le tag_gc (0-4).
@@ -103,33 +260,60 @@ def classify_tag_gc(specialites_text: str, company_name: str = "") -> int:
     # Combiner textes
     combined = f"{specialites_text} {company_name}".lower()
     
-    # Chercher mots-clés
-    gc_core_found = any(keyword in combined for keyword in GC_CORE_KEYWORDS)
-    general_found = any(keyword in combined for keyword in GENERAL_KEYWORDS)
-    durable_found = any(keyword in combined for keyword in DUrable_KEYWORDS)
-    education_found = any(keyword in combined for keyword in EDUCATION_KEYWORDS)
+    # Chercher mots-clés (une seule passe)
+    return _tag_from_categories(KEYWORD_MATCHER.categories_found(combined))
+
+
+def _as_text(series: pd.Series) -> pd.Series:
+    """
+    Colonne texte: valeurs manquantes -> "", autres -> str.
+    """
+    return series.where(series.notna(), '').astype(str)
+
+
+def classify_tag_gc_batch(specialites: pd.Series, names: pd.Series, return_masks: bool = False):
+    """
+    Classifie des colonnes entières (même résultat que classify_tag_gc ligne à ligne).
     
-    # Règles de classification
-    if not gc_core_found:
-        # Pas de GC -> 0 ou 2 selon si général trouvé
-        return 0 if general_found else 0
+    Les textes combinés sont concaténés dans un seul buffer (BATCH_SEPARATOR
+    entre deux lignes); la regex compilée le parcourt une fois avec findall
+    (occurrences chevauchantes, comme explain_classification) et chaque
+    mot-clé est rattaché à sa ligne par somme cumulée des séparateurs.
     
-    # GC trouvé
-    if general_found:
-        # GC + général -> 2
-        return 2
+    Args:
+        specialites: Série des spécialités
+        names: Série des noms d'entreprises (même longueur)
+        return_masks: Si True, retourner aussi les masques par catégorie
+        
+    Returns:
+        ndarray des tags (0-4), ou tuple (tags, dict catégorie -> masque booléen)
+    """
+    combined = (_as_text(specialites).reset_index(drop=True) + ' ' +
+                _as_text(names).reset_index(drop=True))
+    n = len(combined)
+    found = np.zeros(n, dtype=np.int64)
     
-    # GC seul -> 1, mais vérifier durable/éducation
-    if education_found:
-        # GC + éducation -> 4 (priorité max)
-        return 4
+    if n:
+        buffer = BATCH_SEPARATOR.join(combined.tolist()).lower()
+        if buffer.count(BATCH_SEPARATOR) != n - 1:
+            # Séparateur présent dans les données: le neutraliser (non-mot comme lui)
+            buffer = BATCH_SEPARATOR.join(combined.str.replace(BATCH_SEPARATOR, ' ', regex=False)).lower()
+        tokens = pd.Series(KEYWORD_MATCHER.scan_pattern.findall(buffer), dtype=object)
+        is_separator = (tokens == BATCH_SEPARATOR).to_numpy()
+        rows = np.cumsum(is_separator)[~is_separator]
+        bits = tokens[~is_separator].map(KEYWORD_MATCHER.scan_bits).to_numpy(dtype=np.int64)
+        np.bitwise_or.at(found, rows, bits)
     
-    if durable_found:
-        # GC + durable -> 3
-        return 3
+    masks = {name: (found & bit) != 0 for name, bit in KEYWORD_MATCHER.category_bits.items()}
+    tags = np.select(
+        [~masks['gc_core'], masks['general'], masks['education'], masks['durable']],
+        [0, 2, 4, 3],
+        default=1
+    ).astype(np.int64)
     
-    # GC pur
-    return 1
+    if return_masks:
+        return tags, masks
+    return tags
 
 
 def get_tag_gc_label(tag: int) -> str:
@@ -170,12 +354,13 @@ def explain_classification(specialites_text: str, company_name: str = "") -> dic
     
     combined = f"{specialites_text} {company_name}".lower()
     
-    gc_core_matches = [kw for kw in GC_CORE_KEYWORDS if kw in combined]
-    general_matches = [kw for kw in GENERAL_KEYWORDS if kw in combined]
-    durable_matches = [kw for kw in DUrable_KEYWORDS if kw in combined]
-    education_matches = [kw for kw in EDUCATION_KEYWORDS if kw in combined]
+    matches = KEYWORD_MATCHER.find(combined)
+    gc_core_matches = matches['gc_core']
+    general_matches = matches['general']
+    durable_matches = matches['durable']
+    education_matches = matches['education']
     
-    tag = classify_tag_gc(specialites_text, company_name)
+    tag = _tag_from_categories({name for name, found in matches.items() if found})
     
     return {
         'tag': tag,
@@ -198,16 +383,13 @@ def get_specialties_keywords(tag: int) -> List[str]:
     Returns:
         Liste de mots-clés
     """
-    if tag == 0:
-        return list(GENERAL_KEYWORDS)[:10]
-    elif tag == 1:
-        return list(GC_CORE_KEYWORDS)[:10]
-    elif tag == 2:
-        return list(GC_CORE_KEYWORDS | GENERAL_KEYWORDS)[:10]
-    elif tag == 3:
-        return list(GC_CORE_KEYWORDS | DUrable_KEYWORDS)[:10]
-    elif tag == 4:
-        return list(GC_CORE_KEYWORDS | EDUCATION_KEYWORDS)[:10]
-    else:
+    categories = {
+        0: ['general'],
+        1: ['gc_core'],
+        2: ['gc_core', 'general'],
+        3: ['gc_core', 'durable'],
+        4: ['gc_core', 'education']
+    }
+    if tag not in categories:
         return []
-
+    return KEYWORD_MATCHER.keywords(*categories[tag])[:10]
@@ -2,10 +2,87 @@
 Module de déduplication des entreprises.
 """
 import pandas as pd
-from typing import Optional
-from .normalizers import normalize_company_name, extract_main_words
+from .normalizers import extract_main_words_normalized, normalize_company_names
 from .regex_patterns import extract_domain
-from tldextract import extract as tld_extract
+from .domains import registered_domains
+
+
+def _email_bonus(email) -> int:
+    """
+    Bonus de richesse lié à l'email (non-webmail, générique).
+    """
+    from .regex_patterns import is_webmail
+    
+    score = 0
+    if not is_webmail(email):
+        score += 2
+    elif 'formulaire' not in email.lower():
+        score += 1
+    
+    generic = ['info@', 'contact@', 'office@', 'bureau@']
+    if any(email.lower().startswith(g) for g in generic):
+        score += 1
+    
+    return score
+
+
+def _filled(series: pd.Series) -> pd.Series:
+    """
+    Masque des valeurs renseignées (non nulles et non vides).
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object)
+    return series.notna() & series.fillna('').astype(bool)
+
+
+def _map_unique(series: pd.Series, func) -> pd.Series:
+    """
+    Applique func une seule fois par valeur distincte.
+    """
+    uniques = series.dropna().unique()
+    return series.map(dict(zip(uniques, map(func, uniques))))
+
+
+def _richness_scores(df: pd.DataFrame) -> pd.Series:
+    """
+    Score de richesse de chaque fiche (champs remplis + qualité email).
+    """
+    score = pd.Series(0, index=df.index)
+    
+    # Champs remplis
+    for col in ['email', 'telephone', 'site_web', 'specialites', 'ville', 'canton']:
+        if col in df.columns:
+            score += _filled(df[col]).astype(int)
+    
+    # Email non-webmail / générique bonus
+    if 'email' in df.columns:
+        has_email = _filled(df['email'])
+        bonus = _map_unique(df.loc[has_email, 'email'], _email_bonus)
+        score = score.add(bonus, fill_value=0).astype(int)
+    
+    return score
+
+
+def _take_unused(bucket: list, used: list) -> list:
+    """
+    Compacte un bucket d'index en retirant les positions déjà utilisées.
+    
+    Le bucket est modifié en place pour que chaque position utilisée ne
+    soit parcourue qu'une fois.
+    """
+    bucket[:] = [j for j in bucket if not used[j]]
+    return bucket
+
+
+def _build_index(keys) -> dict:
+    """
+    Index clé -> liste de positions (ordre croissant), clés vides ignorées.
+    """
+    index = {}
+    for pos, key in enumerate(keys):
+        if key is not None:
+            index.setdefault(key, []).append(pos)
+    return index
 
 
 def deduplicate_dataframe(df: pd.DataFrame) -> pd.DataFrame:
@@ -17,6 +94,11 @@ def deduplicate_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     2. Clés de dédup: domaine > nom+ville > nom
     3. Conserver fiche la plus riche
     
+    Les fiches sont parcourues dans l'ordre; chaque fiche non encore groupée
+    absorbe les fiches restantes qui partagent sa clé de plus haute priorité.
+    Les recherches passent par des index de hachage (domaine, nom+ville, nom,
+    mots principaux), ce qui rend le traitement quasi linéaire.
+    
     Args:
         df: DataFrame avec colonnes: company_name, canton, ville, site_web, email, etc.
         
@@ -26,108 +108,76 @@ def deduplicate_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
     
-    df = df.copy()
+    df = df.copy(deep=False)
     
     # Normaliser noms
-    df['_name_normalized'] = df['company_name'].apply(normalize_company_name)
-    df['_main_words'] = df['company_name'].apply(extract_main_words)
+    df['_name_normalized'] = normalize_company_names(df['company_name'])
+    df['_main_words'] = extract_main_words_normalized(df['_name_normalized'])
     
     # Extraire domaines
-    def get_domain(row):
-        if pd.notna(row.get('site_web')) and row['site_web']:
-            try:
-                result = tld_extract(row['site_web'])
-                return result.registered_domain or result.domain
-            except:
-                pass
-        return None
-    
-    df['_domain'] = df.apply(get_domain, axis=1)
+    if 'site_web' in df.columns:
+        df['_domain'] = registered_domains(df['site_web'])
+    else:
+        df['_domain'] = None
     
     # Score de richesse
-    def richness_score(row):
-        score = 0
-        
-        # Champs remplis
-        for col in ['email', 'telephone', 'site_web', 'specialites', 'ville', 'canton']:
-            if pd.notna(row.get(col)) and row[col]:
-                score += 1
-        
-        # Email non-webmail bonus
-        if pd.notna(row.get('email')) and row['email']:
-            from .regex_patterns import is_webmail
-            if not is_webmail(row['email']):
-                score += 2
-            elif 'formulaire' not in row['email'].lower():
-                score += 1
-        
-        # Email générique bonus
-        if pd.notna(row.get('email')) and row['email']:
-            generic = ['info@', 'contact@', 'office@', 'bureau@', 'info@']
-            if any(row['email'].lower().startswith(g) for g in generic):
-                score += 1
-        
-        return score
+    df['_richness'] = _richness_scores(df)
+    
+    n = len(df)
+    domains = [d if isinstance(d, str) and d else None for d in df['_domain']]
+    names = df['_name_normalized'].tolist()
+    main_words = [w or None for w in df['_main_words']]
+    if 'ville' in df.columns:
+        villes = [str(v).strip().lower() if pd.notna(v) else None for v in df['ville']]
+    else:
+        villes = [None] * n
+    richness = df['_richness'].tolist()
     
-    df['_richness'] = df.apply(richness_score, axis=1)
+    # Index de hachage
+    domain_index = _build_index(domains)
+    name_ville_index = _build_index(
+        (name, ville) if ville is not None else None for name, ville in zip(names, villes)
+    )
+    name_index = _build_index(names)
+    main_words_index = _build_index(main_words)
     
-    # Grouper par clé de dédup
-    groups = []
-    used_indices = set()
+    used = [False] * n
+    keep_positions = []
     
     # Prioritizer: domaine > nom+ville > nom
-    for idx, row in df.iterrows():
-        if idx in used_indices:
+    for pos in range(n):
+        if used[pos]:
             continue
         
-        # Trouver doublons potentiels
-        duplicates = [idx]
-        key = None
+        others = []
         
         # Essai 1: domaine
-        if pd.notna(row['_domain']) and row['_domain']:
-            for other_idx, other_row in df.iterrows():
-                if other_idx != idx and other_idx not in used_indices:
-                    if other_row['_domain'] == row['_domain']:
-                        duplicates.append(other_idx)
-                        key = f"domain:{row['_domain']}"
+        if domains[pos] is not None:
+            others = [j for j in _take_unused(domain_index[domains[pos]], used) if j != pos]
         
         # Essai 2: nom+ville
-        if len(duplicates) == 1:
-            for other_idx, other_row in df.iterrows():
-                if other_idx != idx and other_idx not in used_indices:
-                    if (other_row['_name_normalized'] == row['_name_normalized'] and
-                        pd.notna(other_row['ville']) and pd.notna(row['ville']) and
-                        other_row['ville'].strip().lower() == row['ville'].strip().lower()):
-                        duplicates.append(other_idx)
-                        key = f"name+ville:{row['_name_normalized']}+{row['ville']}"
-        
-        # Essai 3: nom seulement (si similaire)
-        if len(duplicates) == 1:
-            for other_idx, other_row in df.iterrows():
-                if other_idx != idx and other_idx not in used_indices:
-                    if (other_row['_name_normalized'] == row['_name_normalized'] or
-                        (other_row['_main_words'] == row['_main_words'] and row['_main_words'])):
-                        duplicates.append(other_idx)
-                        key = f"name:{row['_name_normalized']}"
+        if not others and villes[pos] is not None:
+            bucket = name_ville_index[(names[pos], villes[pos])]
+            others = [j for j in _take_unused(bucket, used) if j != pos]
         
-        # Si doublons, conserver le plus riche
-        if len(duplicates) > 1:
-            best_idx = max(duplicates, key=lambda i: df.loc[i, '_richness'])
-        else:
-            best_idx = idx
+        # Essai 3: nom seulement (ou mêmes mots principaux)
+        if not others:
+            candidates = set(_take_unused(name_index[names[pos]], used))
+            if main_words[pos] is not None:
+                candidates.update(_take_unused(main_words_index[main_words[pos]], used))
+            candidates.discard(pos)
+            others = sorted(candidates)
         
-        groups.append({
-            'keep_idx': best_idx,
-            'duplicates': duplicates,
-            'key': key or f"unique:{idx}"
-        })
+        duplicates = [pos] + others
+        
+        # Si doublons, conserver le plus riche
+        keep_positions.append(max(duplicates, key=lambda j: richness[j]))
         
-        used_indices.update(duplicates)
+        for j in duplicates:
+            used[j] = True
     
     # Garder les meilleurs
-    keep_indices = [g['keep_idx'] for g in groups]
-    result = df.loc[keep_indices].copy()
+    result = df.iloc[keep_positions]
     
     # Retirer colonnes internes
     result = result.drop(columns=['_name_normalized', '_main_words', '_domain', '_richness'], errors='ignore')
@@ -138,6 +188,77 @@ def deduplicate_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     return result
 
 
+class StreamingDeduplicator:
+    """
+    Déduplication par lots avec un index global de clés déjà émises.
+    
+    Chaque lot est d'abord dédupliqué en interne (deduplicate_dataframe,
+    fiche la plus riche conservée), puis les fiches dont une clé (domaine,
+    nom+ville, nom, mots principaux) a déjà été émise par un lot précédent
+    sont écartées. Seules les clés sont gardées en mémoire; une fiche déjà
+    écrite n'est jamais remplacée par un doublon plus riche arrivé plus tard.
+    """
+    
+    def __init__(self):
+        self.domains = set()
+        self.name_villes = set()
+        self.names = set()
+        self.main_words = set()
+        self.dropped = 0
+    
+    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Retourne les fiches du lot qui ne sont pas des doublons.
+        
+        Args:
+            df: Lot d'entreprises (normalisé)
+            
+        Returns:
+            Lot dédupliqué (index réinitialisé)
+        """
+        if df.empty:
+            return df
+        
+        df = deduplicate_dataframe(df)
+        
+        normalized = normalize_company_names(df['company_name'])
+        names = normalized.tolist()
+        main_words = extract_main_words_normalized(normalized).tolist()
+        if 'site_web' in df.columns:
+            domains = registered_domains(df['site_web']).tolist()
+        else:
+            domains = [None] * len(df)
+        if 'ville' in df.columns:
+            villes = [str(v).strip().lower() if pd.notna(v) else None for v in df['ville']]
+        else:
+            villes = [None] * len(df)
+        
+        keep = []
+        for domain, name, ville, words in zip(domains, names, villes, main_words):
+            domain = domain if isinstance(domain, str) and domain else None
+            name_ville = (name, ville) if ville is not None else None
+            keep.append(not (
+                (domain is not None and domain in self.domains) or
+                (name_ville is not None and name_ville in self.name_villes) or
+                name in self.names or
+                (words and words in self.main_words)
+            ))
+        
+        for kept, domain, name, ville, words in zip(keep, domains, names, villes, main_words):
+            if not kept:
+                continue
+            if isinstance(domain, str) and domain:
+                self.domains.add(domain)
+            if ville is not None:
+                self.name_villes.add((name, ville))
+            self.names.add(name)
+            if words:
+                self.main_words.add(words)
+        
+        self.dropped += len(keep) - sum(keep)
+        return df[keep].reset_index(drop=True)
+
+
 def add_deduplication_notes(df: pd.DataFrame) -> pd.DataFrame:
     """
     Ajoute des notes sur la déduplication pour debug.
@@ -148,12 +269,18 @@ def add_deduplication_notes(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame avec colonne notes enrichie
     """
-    df = df.copy()
+    df = df.copy(deep=False)
     
     # Initialiser notes si manquante
     if 'notes' not in df.columns:
         df['notes'] = ""
     
+    # Domaines des sites (une résolution par site distinct)
+    if 'site_web' in df.columns:
+        df['_site_domain'] = registered_domains(df['site_web'])
+    else:
+        df['_site_domain'] = None
+    
     # Marquer emails suspects
     def check_email(row):
         notes = str(row.get('notes', '')) if pd.notna(row.get('notes')) else ""
@@ -161,11 +288,7 @@ def add_deduplication_notes(df: pd.DataFrame) -> pd.DataFrame:
         if pd.notna(row.get('email')) and row['email']:
             from .regex_patterns import extract_domain, is_webmail
             email_domain = extract_domain(row['email'])
-            site_domain = None
-            
-            if pd.notna(row.get('site_web')) and row['site_web']:
-                result = tld_extract(row['site_web'])
-                site_domain = result.registered_domain or result.domain
+            site_domain = row['_site_domain']
             
             # Incohérence domaine
             if email_domain and site_domain and email_domain != site_domain:
@@ -180,13 +303,16 @@ def add_deduplication_notes(df: pd.DataFrame) -> pd.DataFrame:
     
     df['notes'] = df.apply(check_email, axis=1)
     
-    return df
+    return df.drop(columns=['_site_domain'])
 
 
 def mark_potential_duplicates(df: pd.DataFrame, threshold: float = 0.85) -> pd.DataFrame:
     """
     Marque les doublons potentiels via fuzzy matching (optionnel, pour review manuelle).
     
+    Les paires candidates viennent de find_candidate_pairs (blocage + cdist);
+    une ligne est marquée si un nom différent du sien lui ressemble.
+    
     Args:
         df: DataFrame
         threshold: Score de similarité minimum
@@ -195,30 +321,19 @@ def mark_potential_duplicates(df: pd.DataFrame, threshold: float = 0.85) -> pd.D
         DataFrame avec colonne _potential_duplicate
     """
     try:
-        from rapidfuzz import fuzz, process
+        from .fuzzy_matching import find_candidate_pairs
+        pairs = find_candidate_pairs(df, threshold=threshold)
     except ImportError:
         # Rapidfuzz non dispo, passer
         df['_potential_duplicate'] = False
         return df
     
-    df = df.copy()
+    df = df.copy(deep=False)
     df['_potential_duplicate'] = False
     
-    # Pour chaque ligne, chercher similaire
-    names_normalized = df['company_name'].apply(normalize_company_name).tolist()
-    
-    for idx in df.index:
-        name_norm = names_normalized[idx]
-        matches = process.extract(name_norm, names_normalized, limit=5, scorer=fuzz.ratio)
-        
-        # Ignorer self et très courts
-        if len(name_norm) < 5:
-            continue
-        
-        for match_name, score, _ in matches:
-            if score >= threshold * 100 and match_name != name_norm:
-                df.loc[idx, '_potential_duplicate'] = True
-                break
+    # Ignorer les noms identiques (doublons exacts gérés par deduplicate_dataframe)
+    pairs = pairs[pairs['left_name'] != pairs['right_name']]
+    marked = set(pairs['left_index']) | set(pairs['right_index'])
+    df.loc[df.index.isin(marked), '_potential_duplicate'] = True
     
     return df
-
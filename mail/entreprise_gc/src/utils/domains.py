@@ -0,0 +1,75 @@
+"""
+Résolution des domaines enregistrés (example.ch pour https://www.example.ch/x).
+
+Un seul extracteur tldextract est construit, sur la liste de suffixes
+embarquée dans le paquet: aucun accès réseau (runners hors ligne), aucun
+cache disque. Les résultats sont mémoïsés (LRU) et registered_domains ne
+résout qu'une fois chaque valeur distincte d'une colonne.
+"""
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import urlparse
+
+import pandas as pd
+import tldextract
+
+
+# Taille du cache LRU (URLs distinctes mémorisées)
+DOMAIN_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=1)
+def get_extractor() -> tldextract.TLDExtract:
+    """
+    Extracteur partagé, sur l'instantané de la liste de suffixes du paquet.
+    """
+    return tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+
+@lru_cache(maxsize=DOMAIN_CACHE_SIZE)
+def registered_domain(url: str) -> Optional[str]:
+    """
+    Domaine enregistré d'une URL (ou d'un hôte), sinon le nom de domaine nu.
+
+    Args:
+        url: URL ou nom d'hôte
+
+    Returns:
+        Domaine (ex: 'example.ch', 'example.co.uk') ou None si rien d'exploitable
+    """
+    if not url or not isinstance(url, str):
+        return None
+    try:
+        result = get_extractor()(url)
+    except Exception:
+        return None
+    # top_domain_under_public_suffix remplace registered_domain (tldextract >= 5.3)
+    domain = getattr(result, 'top_domain_under_public_suffix', None)
+    if domain is None:
+        domain = result.registered_domain
+    return domain or result.domain or None
+
+
+def url_domain(url: str) -> str:
+    """
+    Domaine enregistré d'une URL, sinon son hôte (rate limit, domaines morts).
+    """
+    return registered_domain(url) or urlparse(url).netloc
+
+
+def registered_domains(series: pd.Series) -> pd.Series:
+    """
+    Domaines enregistrés d'une colonne d'URLs (une résolution par valeur distincte).
+
+    Args:
+        series: URLs (valeurs manquantes ou vides acceptées)
+
+    Returns:
+        Series alignée sur l'index d'entrée, None si pas de domaine
+    """
+    uniques = series.dropna().unique()
+    mapping = {value: registered_domain(value) for value in uniques}
+    return series.map(mapping).astype(object).where(lambda s: s.notna(), None)
+
+
+__all__ = ['get_extractor', 'registered_domain', 'registered_domains', 'url_domain']
@@ -0,0 +1,220 @@
+"""
+Détection de doublons approximatifs (fuzzy) par blocage et scoring vectorisé.
+
+Au lieu de comparer chaque nom à tous les autres, les noms sont répartis en
+blocs (canton + premier mot, buckets MinHash sur n-grammes de caractères) et
+rapidfuzz.process.cdist ne score que les paires d'un même bloc.
+"""
+import logging
+import zlib
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .normalizers import normalize_company_name
+
+logger = logging.getLogger(__name__)
+
+
+# Paramètres MinHash / LSH: 8 bandes de 3 lignes (seuil Jaccard ~0.5)
+MINHASH_BANDS = 8
+MINHASH_ROWS = 3
+NGRAM_SIZE = 3
+
+_PRIME = (1 << 31) - 1
+_rng = np.random.RandomState(1234)
+_HASH_A = _rng.randint(1, _PRIME, size=MINHASH_BANDS * MINHASH_ROWS).astype(np.uint64)
+_HASH_B = _rng.randint(0, _PRIME, size=MINHASH_BANDS * MINHASH_ROWS).astype(np.uint64)
+
+PAIR_COLUMNS = ['left_index', 'right_index', 'left_name', 'right_name', 'score', 'block']
+
+
+def _ngrams(text: str, size: int = NGRAM_SIZE) -> set:
+    padded = f" {text} "
+    if len(padded) <= size:
+        return {padded}
+    return {padded[i:i + size] for i in range(len(padded) - size + 1)}
+
+
+def minhash_signatures(texts: list, chunk_size: int = 5000) -> np.ndarray:
+    """
+    Signatures MinHash des n-grammes de caractères d'une liste de textes.
+    
+    Le calcul est vectorisé par paquets: tous les n-grammes d'un paquet sont
+    hachés ensemble puis réduits par texte (np.minimum.reduceat).
+
+    Args:
+        texts: Textes normalisés (non vides)
+        chunk_size: Nombre de textes par paquet (borne la mémoire)
+
+    Returns:
+        Tableau (len(texts), MINHASH_BANDS * MINHASH_ROWS)
+    """
+    signatures = np.empty((len(texts), len(_HASH_A)), dtype=np.uint64)
+    for start in range(0, len(texts), chunk_size):
+        chunk = texts[start:start + chunk_size]
+        grams = [_ngrams(text) for text in chunk]
+        offsets = np.cumsum([0] + [len(g) for g in grams[:-1]])
+        hashes = np.fromiter(
+            (zlib.crc32(gram.encode('utf-8')) & _PRIME for g in grams for gram in g),
+            dtype=np.uint64
+        )
+        permuted = (_HASH_A[:, None] * hashes[None, :] + _HASH_B[:, None]) % _PRIME
+        signatures[start:start + len(chunk)] = np.minimum.reduceat(permuted, offsets, axis=1).T
+    return signatures
+
+
+def minhash_signature(text: str) -> np.ndarray:
+    """
+    Signature MinHash d'un seul texte.
+    """
+    return minhash_signatures([text])[0]
+
+
+def _blocking_keys(name: str, canton: Optional[str], signature: np.ndarray) -> list:
+    keys = [('token', canton or '', name.split()[0])]
+    for band in range(MINHASH_BANDS):
+        rows = signature[band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS]
+        keys.append(('minhash', band, rows.tobytes()))
+    return keys
+
+
+def blocking_keys(name: str, canton: Optional[str] = None) -> list:
+    """
+    Clés de blocage d'un nom normalisé.
+
+    Args:
+        name: Nom normalisé
+        canton: Code canton (optionnel)
+
+    Returns:
+        Liste de clés hashables
+    """
+    return _blocking_keys(name, canton, minhash_signature(name))
+
+
+def _split_block(positions: list, signature_of: dict, max_block_size: int, band: int = 0):
+    """
+    Découpe un bloc trop grand par bandes MinHash successives.
+
+    Returns:
+        (sous-blocs d'au plus max_block_size positions, positions restées
+        dans un sous-bloc trop grand une fois toutes les bandes utilisées)
+    """
+    if len(positions) <= max_block_size:
+        return [positions], []
+    if band >= MINHASH_BANDS:
+        return [], positions
+    groups = {}
+    for pos in positions:
+        rows = signature_of[pos][band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS]
+        groups.setdefault(rows.tobytes(), []).append(pos)
+    kept, dropped = [], []
+    for group in groups.values():
+        if len(group) < 2:
+            continue
+        sub_blocks, sub_dropped = _split_block(group, signature_of, max_block_size, band + 1)
+        kept.extend(sub_blocks)
+        dropped.extend(sub_dropped)
+    return kept, dropped
+
+
+# Taille de bloc à partir de laquelle cdist utilise plusieurs threads
+_PARALLEL_BLOCK_SIZE = 256
+
+
+def find_candidate_pairs(df: pd.DataFrame, threshold: float = 0.85, workers: int = -1,
+                         min_length: int = 5, max_block_size: int = 2000) -> pd.DataFrame:
+    """
+    Trouve les paires de noms similaires pour revue manuelle.
+
+    Args:
+        df: DataFrame avec company_name (et canton si disponible)
+        threshold: Score de similarité minimum (0-1, fuzz.ratio)
+        workers: Nombre de threads pour cdist (-1 = tous les cœurs)
+        min_length: Longueur minimale d'un nom normalisé pour être comparé
+        max_block_size: Taille max d'un bloc scoré; au-delà (clé trop peu
+                        sélective), le bloc est redécoupé par bandes MinHash
+
+    Returns:
+        DataFrame des paires (colonnes PAIR_COLUMNS), trié par score décroissant.
+        left_index/right_index sont des labels de df.
+    """
+    from rapidfuzz import fuzz, process
+
+    if df.empty or 'company_name' not in df.columns:
+        return pd.DataFrame(columns=PAIR_COLUMNS)
+
+    # Normaliser une fois par nom distinct
+    raw_names = df['company_name']
+    uniques = raw_names.dropna().unique()
+    normalized = dict(zip(uniques, (normalize_company_name(x) if isinstance(x, str) else '' for x in uniques)))
+    names = [normalized.get(x, '') if pd.notna(x) else '' for x in raw_names]
+    cantons = df['canton'].tolist() if 'canton' in df.columns else [None] * len(df)
+    labels = df.index.tolist()
+
+    # Blocs: clé -> positions
+    candidates = [pos for pos, name in enumerate(names) if len(name) >= min_length]
+    signatures = minhash_signatures([names[pos] for pos in candidates])
+    signature_of = dict(zip(candidates, signatures))
+    blocks = {}
+    for pos, signature in zip(candidates, signatures):
+        canton = cantons[pos] if isinstance(cantons[pos], str) else None
+        for key in _blocking_keys(names[pos], canton, signature):
+            blocks.setdefault(key, []).append(pos)
+
+    cutoff = threshold * 100
+    lefts, rights, scores_found, block_kinds = [], [], [], []
+    oversized, dropped = 0, set()
+    for key, block in blocks.items():
+        if len(block) < 2:
+            continue
+        sub_blocks = [block]
+        if len(block) > max_block_size:
+            oversized += 1
+            sub_blocks, sub_dropped = _split_block(block, signature_of, max_block_size)
+            dropped.update(sub_dropped)
+
+        for positions in sub_blocks:
+            block_names = [names[pos] for pos in positions]
+            scores = process.cdist(block_names, block_names, scorer=fuzz.ratio, score_cutoff=cutoff,
+                                   workers=workers if len(positions) >= _PARALLEL_BLOCK_SIZE else 1)
+            hits = np.argwhere(np.triu(scores, k=1) >= cutoff)
+            if len(hits):
+                positions = np.asarray(positions)
+                lefts.append(positions[hits[:, 0]])
+                rights.append(positions[hits[:, 1]])
+                scores_found.append(scores[hits[:, 0], hits[:, 1]])
+                block_kinds.append(np.full(len(hits), key[0], dtype=object))
+
+    if oversized:
+        logger.info(f"{oversized} blocs de plus de {max_block_size} noms redécoupés par bandes MinHash")
+    if dropped:
+        logger.warning(f"{len(dropped)} noms non comparés dans {oversized} blocs trop grands "
+                       f"(> {max_block_size}, même après découpage MinHash)")
+
+    if not lefts:
+        return pd.DataFrame(columns=PAIR_COLUMNS)
+
+    # Dédupliquer les paires trouvées dans plusieurs blocs (premier bloc conservé)
+    left = np.concatenate(lefts)
+    right = np.concatenate(rights)
+    _, first = np.unique(left * len(names) + right, return_index=True)
+    left, right = left[first], right[first]
+
+    labels = np.asarray(labels, dtype=object)
+    names = np.asarray(names, dtype=object)
+    result = pd.DataFrame({
+        'left_index': labels[left],
+        'right_index': labels[right],
+        'left_name': names[left],
+        'right_name': names[right],
+        'score': np.concatenate(scores_found)[first].astype(float),
+        'block': np.concatenate(block_kinds)[first]
+    })
+    return result.sort_values('score', ascending=False, kind='stable').reset_index(drop=True)
+
+
+__all__ = ['find_candidate_pairs', 'blocking_keys', 'minhash_signature', 'minhash_signatures',
+           'PAIR_COLUMNS']
@@ -0,0 +1,174 @@
+"""
+Cache HTTP persistant sur disque avec revalidation conditionnelle.
+
+Les corps de réponse sont stockés par empreinte SHA-256 de leur contenu
+(bodies/<sha>), les métadonnées par empreinte de l'URL normalisée
+(entries/<sha>.json). Deux URLs servant le même contenu partagent un corps.
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+# Statuts mis en cache (succès + absences définitives)
+CACHEABLE_STATUS = {200, 203, 404, 410}
+
+
+class CacheMissError(httpx.RequestError):
+    """
+    URL absente du cache en mode hors-ligne.
+    """
+
+
+def normalize_cache_url(url: str) -> str:
+    """
+    Normalise une URL pour la clé de cache.
+
+    - Schéma et hôte en minuscules
+    - Sans fragment
+    - Sans slash final (hors racine)
+
+    Args:
+        url: URL brute
+
+    Returns:
+        URL normalisée
+    """
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ''))
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+class ResponseCache:
+    """
+    Cache de réponses HTTP sur disque.
+    """
+
+    def __init__(self, directory: Path, ttl: float = 7 * 24 * 3600, offline: bool = False):
+        """
+        Args:
+            directory: Dossier du cache (créé si besoin)
+            ttl: Durée (secondes) pendant laquelle une entrée est servie sans réseau
+            offline: Si True, ne jamais toucher au réseau
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.offline = offline
+        (self.directory / 'entries').mkdir(parents=True, exist_ok=True)
+        (self.directory / 'bodies').mkdir(parents=True, exist_ok=True)
+
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def _entry_path(self, url: str) -> Path:
+        key = hashlib.sha256(normalize_cache_url(url).encode('utf-8')).hexdigest()
+        return self.directory / 'entries' / f"{key}.json"
+
+    def _body_path(self, digest: str) -> Path:
+        return self.directory / 'bodies' / digest
+
+    def lookup(self, url: str) -> Optional[dict]:
+        """
+        Retourne l'entrée de cache d'une URL (ou None).
+        """
+        path = self._entry_path(url)
+        try:
+            entry = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if not self._body_path(entry['body_sha256']).exists():
+            return None
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        """
+        True si l'entrée peut être servie sans revalidation.
+        """
+        return self.offline or (time.time() - entry['fetched_at']) < self.ttl
+
+    def conditional_headers(self, entry: dict) -> dict:
+        """
+        Headers If-None-Match / If-Modified-Since pour revalider une entrée.
+        """
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url: str, response: httpx.Response) -> None:
+        """
+        Enregistre une réponse (si son statut est cacheable).
+        """
+        if response.status_code not in CACHEABLE_STATUS:
+            return
+
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        body_path = self._body_path(digest)
+        if not body_path.exists():
+            _write_atomic(body_path, body)
+
+        entry = {
+            'url': normalize_cache_url(url),
+            'final_url': str(response.url),
+            'status': response.status_code,
+            'content_type': response.headers.get('Content-Type'),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': time.time(),
+            'body_sha256': digest
+        }
+        _write_atomic(self._entry_path(url), json.dumps(entry).encode('utf-8'))
+
+    def touch(self, url: str, entry: dict) -> None:
+        """
+        Marque une entrée comme revalidée (réponse 304).
+        """
+        entry = dict(entry, fetched_at=time.time())
+        _write_atomic(self._entry_path(url), json.dumps(entry).encode('utf-8'))
+
+    def to_response(self, entry: dict) -> httpx.Response:
+        """
+        Reconstruit une réponse httpx depuis une entrée de cache.
+        """
+        headers = {}
+        if entry.get('content_type'):
+            headers['Content-Type'] = entry['content_type']
+        return httpx.Response(
+            entry['status'],
+            headers=headers,
+            content=self._body_path(entry['body_sha256']).read_bytes(),
+            request=httpx.Request('GET', entry['final_url']),
+            extensions={'from_cache': True}
+        )
+
+    def stats(self) -> dict:
+        """
+        Statistiques du cache.
+        """
+        return {
+            'cache_hits': self.hits,
+            'cache_revalidated': self.revalidated,
+            'cache_misses': self.misses
+        }
+
+
+__all__ = ['ResponseCache', 'CacheMissError', 'normalize_cache_url']
@@ -0,0 +1,401 @@
+"""
+Client HTTP partagé (pool de connexions) pour le crawler et les sources.
+"""
+import asyncio
+import logging
+import time
+from typing import Optional, Tuple
+
+import httpx
+
+from .http_cache import CacheMissError, ResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+# User agent personnalisé
+USER_AGENT = "Mozilla/5.0 (compatible; GC-Romandie-Bot/1.0; +https://github.com/example/gc-romandie)"
+
+# Headers envoyés avec chaque requête
+DEFAULT_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'fr-FR,fr;q=0.9,en;q=0.8'
+}
+
+# Types de contenu acceptés pour une page HTML
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'text/plain')
+
+# Headers décrivant le corps brut, invalides après décodage/troncature
+_BODY_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+
+
+class ContentTypeError(httpx.RequestError):
+    """
+    Corps non téléchargé: Content-Type hors des types demandés.
+    """
+
+
+class HttpClientPool:
+    """
+    Clients httpx longue durée (sync et async) partagés par tous les fetchers.
+
+    Conserve les connexions TCP/TLS (keep-alive, HTTP/2 optionnel) d'une requête
+    à l'autre et compte les connexions ouvertes pour mesurer leur réutilisation.
+    """
+
+    def __init__(self, timeout: float = 12, max_connections: int = 100,
+                 max_keepalive_connections: int = 20, keepalive_expiry: float = 30.0,
+                 http2: bool = False, user_agent: str = USER_AGENT,
+                 headers: Optional[dict] = None, verify: bool = True,
+                 transport: Optional[httpx.BaseTransport] = None,
+                 async_transport: Optional[httpx.AsyncBaseTransport] = None,
+                 cache: Optional[ResponseCache] = None):
+        """
+        Args:
+            timeout: Timeout par défaut (secondes)
+            max_connections: Nombre max de connexions simultanées
+            max_keepalive_connections: Nombre max de connexions gardées ouvertes
+            keepalive_expiry: Durée de vie d'une connexion inactive (secondes)
+            http2: Activer HTTP/2 (nécessite le paquet h2)
+            user_agent: User-Agent envoyé
+            headers: Headers supplémentaires communs
+            verify: Vérification TLS
+            transport: Transport sync personnalisé (tests)
+            async_transport: Transport async personnalisé (tests)
+            cache: Cache de réponses sur disque (optionnel)
+        """
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("Paquet h2 non installé, HTTP/2 désactivé")
+                http2 = False
+
+        self.timeout = timeout
+        self.http2 = http2
+        self.verify = verify
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.headers = {'User-Agent': user_agent, **DEFAULT_HEADERS, **(headers or {})}
+        self.transport = transport
+        self.async_transport = async_transport
+        self.cache = cache
+
+        self._client = None
+        self._async_client = None
+        self._async_loop = None
+
+        self.requests_sent = 0
+        self.connections_opened = 0
+        self.bytes_received = 0
+        self.domain_stats = {}
+        self.truncated = 0
+        self.skipped_content_type = 0
+
+    def _client_kwargs(self) -> dict:
+        return {
+            'timeout': self.timeout,
+            'follow_redirects': True,
+            'verify': self.verify,
+            'limits': self.limits,
+            'http2': self.http2,
+            'headers': self.headers
+        }
+
+    @property
+    def client(self) -> httpx.Client:
+        """
+        Client synchrone (créé au premier usage).
+        """
+        if self._client is None:
+            self._client = httpx.Client(transport=self.transport, **self._client_kwargs())
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        Client asynchrone lié à la boucle d'événements courante.
+
+        Les connexions d'un AsyncClient ne survivent pas à leur boucle: un
+        nouveau client est créé si la boucle a changé (ex: asyncio.run successifs).
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = httpx.AsyncClient(transport=self.async_transport,
+                                                   **self._client_kwargs())
+            self._async_loop = loop
+        return self._async_client
+
+    def _trace(self, event_name: str, info: dict) -> None:
+        if event_name == 'connection.connect_tcp.complete':
+            self.connections_opened += 1
+
+    async def _trace_async(self, event_name: str, info: dict) -> None:
+        self._trace(event_name, info)
+
+    def _record(self, url: str, response: Optional[httpx.Response], elapsed: float = 0.0,
+                cache_hit: bool = False) -> None:
+        """
+        Cumule latence, octets et hits de cache par domaine (hôte sans www).
+        """
+        host = httpx.URL(url).host.lower().removeprefix('www.')
+        stats = self.domain_stats.get(host)
+        if stats is None:
+            stats = self.domain_stats[host] = {'requests': 0, 'cache_hits': 0, 'bytes': 0,
+                                               'latency_s': 0.0, 'max_latency_s': 0.0}
+        if cache_hit:
+            stats['cache_hits'] += 1
+            return
+        stats['requests'] += 1
+        stats['latency_s'] += elapsed
+        stats['max_latency_s'] = max(stats['max_latency_s'], elapsed)
+        if response is not None:
+            stats['bytes'] += len(response.content)
+
+    def is_cached(self, url: str) -> bool:
+        """
+        True si l'URL sera servie depuis le cache sans requête réseau.
+        """
+        if self.cache is None:
+            return False
+        entry = self.cache.lookup(url)
+        return entry is not None and self.cache.is_fresh(entry)
+
+    def _cache_lookup(self, url: str, headers: Optional[dict]):
+        """
+        Consulte le cache avant une requête.
+
+        Returns:
+            Tuple (réponse cachée ou None, entrée à revalider, headers de requête)
+        """
+        if self.cache is None:
+            return None, None, headers
+
+        entry = self.cache.lookup(url)
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.hits += 1
+            return self.cache.to_response(entry), None, headers
+
+        if self.cache.offline:
+            self.cache.misses += 1
+            raise CacheMissError(f"Hors-ligne, absent du cache: {url}",
+                                 request=httpx.Request('GET', url))
+
+        if entry is not None:
+            headers = {**(headers or {}), **self.cache.conditional_headers(entry)}
+        return None, entry, headers
+
+    def _cache_update(self, url: str, entry: Optional[dict], response: httpx.Response) -> httpx.Response:
+        """
+        Met à jour le cache après une requête réseau.
+        """
+        if self.cache is None:
+            return response
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.revalidated += 1
+            self.cache.touch(url, entry)
+            return self.cache.to_response(entry)
+
+        self.cache.misses += 1
+        if not response.extensions.get('truncated'):
+            # Un corps tronqué ne doit pas servir une lecture future plus large
+            self.cache.store(url, response)
+        return response
+
+    def _check_content_type(self, response: httpx.Response,
+                            content_types: Optional[Tuple[str, ...]]) -> None:
+        """
+        Lève ContentTypeError si une réponse réussie n'a pas un type accepté.
+
+        Une réponse sans Content-Type est acceptée.
+        """
+        if not content_types or not response.is_success:
+            return
+        content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type and not content_type.startswith(content_types):
+            self.skipped_content_type += 1
+            raise ContentTypeError(f"Contenu ignoré ({content_type}): {response.request.url}",
+                                   request=response.request)
+
+    def _capped_response(self, streamed: httpx.Response, body: bytearray, truncated: bool) -> httpx.Response:
+        """
+        Réponse complète construite à partir du corps lu (décodé, éventuellement tronqué).
+        """
+        self.bytes_received += len(body)
+        if truncated:
+            self.truncated += 1
+        headers = [(k, v) for k, v in streamed.headers.multi_items() if k.lower() not in _BODY_HEADERS]
+        return httpx.Response(
+            streamed.status_code,
+            headers=headers,
+            content=bytes(body),
+            request=streamed.request,
+            extensions={**{k: v for k, v in streamed.extensions.items() if k in ('http_version', 'reason_phrase')},
+                        'truncated': truncated}
+        )
+
+    @staticmethod
+    def _append_capped(body: bytearray, chunk: bytes, max_bytes: Optional[int]) -> bool:
+        """
+        Ajoute un morceau au corps; True si le budget est dépassé (corps tronqué).
+        """
+        body += chunk
+        if max_bytes is not None and len(body) > max_bytes:
+            del body[max_bytes:]
+            return True
+        return False
+
+    def get(self, url: str, headers: Optional[dict] = None,
+            timeout: Optional[float] = None, max_bytes: Optional[int] = None,
+            content_types: Optional[Tuple[str, ...]] = None) -> httpx.Response:
+        """
+        GET synchrone via le pool (et le cache s'il est configuré).
+
+        Avec max_bytes ou content_types, la réponse est lue en flux: le
+        Content-Type est vérifié avant de télécharger le corps, et la lecture
+        s'arrête au budget (réponse marquée extensions['truncated']).
+
+        Args:
+            url: URL
+            headers: Headers spécifiques à la requête
+            timeout: Timeout spécifique (None = défaut du pool)
+            max_bytes: Taille max du corps lu (décompressé)
+            content_types: Préfixes de Content-Type acceptés (ContentTypeError sinon)
+
+        Returns:
+            Réponse httpx (statut non vérifié)
+        """
+        cached, entry, headers = self._cache_lookup(url, headers)
+        if cached is not None:
+            self._record(url, cached, cache_hit=True)
+            self._check_content_type(cached, content_types)
+            return cached
+
+        self.requests_sent += 1
+        kwargs = {
+            'headers': headers,
+            'timeout': timeout if timeout is not None else self.timeout,
+            'extensions': {'trace': self._trace}
+        }
+        start = time.perf_counter()
+        response = None
+        try:
+            if max_bytes is None and content_types is None:
+                response = self.client.get(url, **kwargs)
+                self.bytes_received += len(response.content)
+                return self._cache_update(url, entry, response)
+
+            with self.client.stream('GET', url, **kwargs) as streamed:
+                self._check_content_type(streamed, content_types)
+                body, truncated = bytearray(), False
+                for chunk in streamed.iter_bytes():
+                    if self._append_capped(body, chunk, max_bytes):
+                        truncated = True
+                        break
+            response = self._capped_response(streamed, body, truncated)
+            return self._cache_update(url, entry, response)
+        finally:
+            self._record(url, response, time.perf_counter() - start)
+
+    async def aget(self, url: str, headers: Optional[dict] = None,
+                   timeout: Optional[float] = None, max_bytes: Optional[int] = None,
+                   content_types: Optional[Tuple[str, ...]] = None) -> httpx.Response:
+        """
+        GET asynchrone via le pool (et le cache s'il est configuré).
+        """
+        cached, entry, headers = self._cache_lookup(url, headers)
+        if cached is not None:
+            self._record(url, cached, cache_hit=True)
+            self._check_content_type(cached, content_types)
+            return cached
+
+        self.requests_sent += 1
+        kwargs = {
+            'headers': headers,
+            'timeout': timeout if timeout is not None else self.timeout,
+            'extensions': {'trace': self._trace_async}
+        }
+        start = time.perf_counter()
+        response = None
+        try:
+            if max_bytes is None and content_types is None:
+                response = await self.async_client.get(url, **kwargs)
+                self.bytes_received += len(response.content)
+                return self._cache_update(url, entry, response)
+
+            async with self.async_client.stream('GET', url, **kwargs) as streamed:
+                self._check_content_type(streamed, content_types)
+                body, truncated = bytearray(), False
+                async for chunk in streamed.aiter_bytes():
+                    if self._append_capped(body, chunk, max_bytes):
+                        truncated = True
+                        break
+            response = self._capped_response(streamed, body, truncated)
+            return self._cache_update(url, entry, response)
+        finally:
+            self._record(url, response, time.perf_counter() - start)
+
+    def stats(self) -> dict:
+        """
+        Statistiques de réutilisation des connexions.
+        """
+        reused = max(0, self.requests_sent - self.connections_opened)
+        return {
+            'requests': self.requests_sent,
+            'connections_opened': self.connections_opened,
+            'connections_reused': reused,
+            'reuse_ratio': round(reused / self.requests_sent, 3) if self.requests_sent else 0.0,
+            'http2': self.http2,
+            'bytes_received': self.bytes_received,
+            'truncated': self.truncated,
+            'skipped_content_type': self.skipped_content_type,
+            **(self.cache.stats() if self.cache is not None else {})
+        }
+
+    def log_stats(self) -> None:
+        """
+        Log les statistiques de connexions.
+        """
+        stats = self.stats()
+        logger.info(
+            f"HTTP: {stats['requests']} requêtes, {stats['connections_opened']} connexions ouvertes, "
+            f"{stats['connections_reused']} réutilisées ({stats['reuse_ratio']:.0%}), "
+            f"{stats['bytes_received'] / 1e6:.1f} Mo reçus, {stats['truncated']} corps tronqués, "
+            f"{stats['skipped_content_type']} ignorés (Content-Type)"
+        )
+        if self.cache is not None:
+            logger.info(
+                f"Cache HTTP: {stats['cache_hits']} hits, {stats['cache_revalidated']} revalidés (304), "
+                f"{stats['cache_misses']} absents du cache"
+            )
+
+    async def aclose(self) -> None:
+        """
+        Ferme le client asynchrone (à appeler avant la fin de sa boucle).
+        """
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_loop = None
+
+    def close(self) -> None:
+        """
+        Ferme le client synchrone et ses connexions.
+        """
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+__all__ = ['HttpClientPool', 'USER_AGENT', 'DEFAULT_HEADERS', 'HTML_CONTENT_TYPES', 'CacheMissError',
+           'ContentTypeError']
@@ -0,0 +1,235 @@
+"""
+Instrumentation du pipeline: temps, CPU, mémoire et débit par étape.
+
+Un RunReport actif (with report:) reçoit les mesures des fonctions décorées
+par @instrumented_stage; hors rapport actif, le décorateur ne fait rien.
+Le rapport est écrit en JSON et résumé sous forme de tableau dans les logs.
+"""
+import functools
+import json
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+_active_report = None
+
+
+def current_report() -> Optional['RunReport']:
+    """
+    Rapport actif (ou None).
+    """
+    return _active_report
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Pic de mémoire résidente du processus (Mo), None si indisponible.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: Ko, macOS: octets
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _rows(value) -> Optional[int]:
+    # Lignes d'un DataFrame/Series (les dicts de compteurs ou listes de chemins ne comptent pas)
+    shape = getattr(value, 'shape', None)
+    return shape[0] if shape else None
+
+
+class RunReport:
+    """
+    Mesures d'un run: une entrée par étape, plus des sections libres (crawl).
+    """
+
+    def __init__(self, run_id: Optional[str] = None):
+        self.run_id = run_id
+        self.started_at = time.time()
+        self.stages = []
+        self.sections = {}
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    def activate(self) -> None:
+        """
+        Rend le rapport actif: les étapes décorées y sont enregistrées.
+        """
+        global _active_report
+        self._previous = _active_report
+        _active_report = self
+
+    def deactivate(self) -> None:
+        global _active_report
+        if _active_report is self:
+            _active_report = self._previous
+
+    def __enter__(self):
+        self.activate()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.deactivate()
+
+    @contextmanager
+    def stage(self, name: str, rows_in: Optional[int] = None):
+        """
+        Mesure une étape; le dict produit peut recevoir rows_out.
+
+        Les appels répétés d'une même étape (mode streaming, un appel par lot)
+        sont cumulés dans une seule entrée.
+
+        Usage:
+            with report.stage('dedup', rows_in=len(df)) as stage:
+                df = deduplicate_dataframe(df)
+                stage['rows_out'] = len(df)
+        """
+        current = {'rows_in': rows_in, 'rows_out': None}
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield current
+        finally:
+            self._accumulate(name, current, time.perf_counter() - wall, time.process_time() - cpu)
+
+    def _accumulate(self, name: str, current: dict, wall: float, cpu: float) -> None:
+        record = next((s for s in self.stages if s['stage'] == name), None)
+        if record is None:
+            record = {'stage': name, 'calls': 0, 'wall_s': 0.0, 'cpu_s': 0.0,
+                      'rows_in': None, 'rows_out': None}
+            self.stages.append(record)
+        record['calls'] += 1
+        record['wall_s'] = round(record['wall_s'] + wall, 3)
+        record['cpu_s'] = round(record['cpu_s'] + cpu, 3)
+        for key in ('rows_in', 'rows_out'):
+            if current[key] is not None:
+                record[key] = (record[key] or 0) + current[key]
+        record['peak_rss_mb'] = peak_rss_mb()
+        rows = record['rows_in'] if record['rows_in'] is not None else record['rows_out']
+        record['rows_per_s'] = round(rows / record['wall_s'], 1) if rows and record['wall_s'] > 0 else None
+
+    def add_section(self, name: str, data: dict) -> None:
+        """
+        Ajoute (ou remplace) des valeurs dans une section libre.
+        """
+        self.sections.setdefault(name, {}).update(data)
+
+    def add_counts(self, name: str, counts: dict) -> None:
+        """
+        Additionne des compteurs dans une section (un appel par lot).
+        """
+        section = self.sections.setdefault(name, {})
+        for key, value in counts.items():
+            section[key] = section.get(key, 0) + value
+
+    def add_domain_stats(self, domains: dict, section: str = 'crawl') -> None:
+        """
+        Cumule des mesures par domaine (domaine -> {compteur: valeur});
+        les maxima (clés max_*) sont conservés plutôt qu'additionnés.
+        """
+        target = self.sections.setdefault(section, {}).setdefault('domains', {})
+        for domain, stats in domains.items():
+            entry = target.setdefault(domain, {'requests': 0, 'cache_hits': 0, 'bytes': 0,
+                                               'latency_s': 0.0, 'retries': 0})
+            for key, value in stats.items():
+                if key.startswith('max_'):
+                    entry[key] = max(entry.get(key, 0), value)
+                else:
+                    entry[key] = entry.get(key, 0) + value
+
+    def to_dict(self) -> dict:
+        return {
+            'run_id': self.run_id,
+            'started_at': self.started_at,
+            'wall_s': round(time.perf_counter() - self._wall_start, 3),
+            'cpu_s': round(time.process_time() - self._cpu_start, 3),
+            'peak_rss_mb': peak_rss_mb(),
+            'stages': self.stages,
+            **self.sections
+        }
+
+    def write(self, path: Path) -> None:
+        """
+        Écrit le rapport JSON.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2, default=str),
+                        encoding='utf-8')
+        logger.info(f"Rapport de run écrit: {path}")
+
+    def summary(self) -> str:
+        """
+        Tableau lisible des étapes.
+        """
+        def fmt(value, spec):
+            return format(value, spec) if value is not None else '-'
+
+        lines = [f"{'étape':<22} {'mur (s)':>9} {'CPU (s)':>9} {'RSS max':>9} {'entrée':>8} "
+                 f"{'sortie':>8} {'lignes/s':>10}"]
+        for s in self.stages:
+            lines.append(
+                f"{s['stage']:<22} {s['wall_s']:>9.2f} {s['cpu_s']:>9.2f} "
+                f"{fmt(s['peak_rss_mb'], '>8.0f')}M {fmt(s['rows_in'], '>8')} "
+                f"{fmt(s['rows_out'], '>8')} {fmt(s['rows_per_s'], '>10.1f')}"
+            )
+        total = self.to_dict()
+        lines.append(f"{'total':<22} {total['wall_s']:>9.2f} {total['cpu_s']:>9.2f} "
+                     f"{fmt(total['peak_rss_mb'], '>8.0f')}M")
+
+        crawl = self.sections.get('crawl')
+        if crawl and crawl.get('domains'):
+            slowest = sorted(crawl['domains'].items(), key=lambda item: -item[1]['latency_s'])[:5]
+            lines.append("domaines les plus lents (latence cumulée):")
+            for domain, stats in slowest:
+                lines.append(f"  {domain:<40} {stats['latency_s']:>8.2f}s {stats['requests']:>4} req "
+                             f"{stats['bytes'] / 1024:>8.0f} Ko {stats.get('retries', 0):>3} retries "
+                             f"{stats['cache_hits']:>3} cache")
+        return '\n'.join(lines)
+
+    def log_summary(self) -> None:
+        logger.info("Résumé du run:\n" + self.summary())
+
+
+@contextmanager
+def measure(name: str, rows_in: Optional[int] = None):
+    """
+    Mesure un bloc comme étape du rapport actif (sans effet hors rapport).
+    """
+    report = current_report()
+    if report is None:
+        yield {}
+        return
+    with report.stage(name, rows_in=rows_in) as record:
+        yield record
+
+
+def instrumented_stage(name: str) -> Callable:
+    """
+    Décorateur: mesure la fonction comme étape du rapport actif.
+
+    Le nombre de lignes en entrée est celui du premier argument, celui en
+    sortie celui du résultat (DataFrame ou Series uniquement).
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            report = current_report()
+            if report is None:
+                return func(*args, **kwargs)
+            with report.stage(name, rows_in=_rows(args[0]) if args else None) as record:
+                result = func(*args, **kwargs)
+                record['rows_out'] = _rows(result)
+            return result
+        return wrapper
+    return decorator
+
+
+__all__ = ['RunReport', 'current_report', 'instrumented_stage', 'measure', 'peak_rss_mb']
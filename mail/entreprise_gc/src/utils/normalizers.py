@@ -2,10 +2,71 @@
 Utilitaires de normalisation pour noms d'entreprises, URLs, etc.
 """
 import re
+from functools import lru_cache
 from slugify import slugify
-from typing import Optional
+from typing import Callable, Optional
 
+import numpy as np
+import pandas as pd
 
+
+# Formes sociales retirées des noms (appliquées dans cet ordre)
+LEGAL_FORM_PATTERNS = [
+    re.compile(r'\b(s\.?a\.?|sàrl|sarl|ag|gmbh|llc|inc|corp|holding|group)\b'),
+    re.compile(r'\b(société anonyme|société à responsabilité limitée)\b')
+]
+
+# Table de retrait des accents (basique), construite une fois
+ACCENT_TABLE = str.maketrans({
+    'à': 'a', 'á': 'a', 'â': 'a', 'ã': 'a', 'ä': 'a',
+    'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e',
+    'ì': 'i', 'í': 'i', 'î': 'i', 'ï': 'i',
+    'ò': 'o', 'ó': 'o', 'ô': 'o', 'õ': 'o', 'ö': 'o',
+    'ù': 'u', 'ú': 'u', 'û': 'u', 'ü': 'u',
+    'ñ': 'n', 'ç': 'c'
+})
+
+_NAME_INVALID_RE = re.compile(r'[^a-z0-9\s\-]')
+_DASHES_RE = re.compile(r'-+')
+_TRACKING_RE = re.compile(r'[?&](utm_source|utm_medium|utm_campaign|fbclid|gclid)=[^&]*')
+
+# Mots ignorés par extract_main_words
+MAIN_WORDS_STOP_WORDS = frozenset({'et', 'and', 'ltd', 'the', 'le', 'la', 'les', 'de', 'du'})
+
+# Noms distincts mémorisés par normalize_company_name
+NAME_CACHE_SIZE = 1 << 17
+
+
+def map_distinct(series: pd.Series, func: Callable) -> pd.Series:
+    """
+    Applique func une fois par valeur distincte non manquante.
+
+    Les valeurs sont codées par pd.factorize puis le résultat est
+    redistribué par indexation numpy. Une colonne catégorielle reste
+    catégorielle: func est appliquée aux catégories et seuls les codes
+    sont réindexés.
+
+    Args:
+        series: Colonne d'entrée
+        func: Fonction scalaire
+
+    Returns:
+        Series alignée sur l'entrée, None (NaN si catégorielle) pour les valeurs manquantes
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        mapped = pd.Series([func(value) for value in series.cat.categories.tolist()], dtype=object)
+        # Catégories résultantes distinctes (deux catégories peuvent fusionner)
+        new_codes, new_categories = pd.factorize(mapped)
+        remap = np.append(new_codes, -1)
+        return pd.Series(pd.Categorical.from_codes(remap[series.cat.codes.to_numpy()], new_categories),
+                         index=series.index, name=series.name)
+    codes, uniques = pd.factorize(series)
+    # Dernière case: résultat des valeurs manquantes (code -1)
+    values = np.array([func(value) for value in uniques.tolist()] + [None], dtype=object)
+    return pd.Series(values[codes], index=series.index, name=series.name)
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def normalize_company_name(name: str) -> str:
     """
     Normalise un nom d'entreprise pour la déduplication.
@@ -16,6 +77,8 @@ def normalize_company_name(name: str) -> str:
     - Doubles espaces
     - Espaces de début/fin
     
+    Le résultat est mémorisé par nom (LRU).
+    
     Args:
         name: Nom brut
         
@@ -28,39 +91,34 @@ def normalize_company_name(name: str) -> str:
     # Lowercase
     normalized = name.lower().strip()
     
-    # Retirer formes sociales
-    forms = [
-        r'\b(s\.?a\.?|sàrl|sarl|ag|gmbh|llc|inc|corp|holding|group)\b',
-        r'\b(société anonyme|société à responsabilité limitée)\b'
-    ]
-    for pattern in forms:
-        normalized = re.sub(pattern, '', normalized)
+    # Retirer formes sociales (la seconde forme ne concerne que "société ...")
+    normalized = LEGAL_FORM_PATTERNS[0].sub('', normalized)
+    if 'soci' in normalized:
+        normalized = LEGAL_FORM_PATTERNS[1].sub('', normalized)
     
     # Retirer accents (basique)
-    replacements = {
-        'à': 'a', 'á': 'a', 'â': 'a', 'ã': 'a', 'ä': 'a',
-        'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e',
-        'ì': 'i', 'í': 'i', 'î': 'i', 'ï': 'i',
-        'ò': 'o', 'ó': 'o', 'ô': 'o', 'õ': 'o', 'ö': 'o',
-        'ù': 'u', 'ú': 'u', 'û': 'u', 'ü': 'u',
-        'ñ': 'n', 'ç': 'c'
-    }
-    for accented, unaccented in replacements.items():
-        normalized = normalized.replace(accented, unaccented)
+    if not normalized.isascii():
+        normalized = normalized.translate(ACCENT_TABLE)
     
     # Retirer caractères spéciaux sauf espaces et tirets
-    normalized = re.sub(r'[^a-z0-9\s\-]', '', normalized)
-    
-    # Retirer doubles espaces et tirets
-    normalized = re.sub(r'\s+', ' ', normalized)
-    normalized = re.sub(r'-+', '-', normalized)
+    normalized = _NAME_INVALID_RE.sub('', normalized)
     
-    # Trim
-    normalized = normalized.strip()
+    # Retirer doubles espaces et tirets, trim
+    normalized = ' '.join(normalized.split())
+    if '--' in normalized:
+        normalized = _DASHES_RE.sub('-', normalized)
     
     return normalized
 
 
+def normalize_company_names(series: pd.Series) -> pd.Series:
+    """
+    Version colonne de normalize_company_name (manquant -> "").
+    """
+    # Valeurs déjà distinctes: le cache LRU serait inutile ici
+    return map_distinct(series, normalize_company_name.__wrapped__).fillna('')
+
+
 def normalize_url(url: str) -> Optional[str]:
     """
     Normalise une URL.
@@ -95,11 +153,19 @@ def normalize_url(url: str) -> Optional[str]:
         url = url.split('#')[0]
     
     # Retirer paramètres de tracking communs
-    url = re.sub(r'[?&](utm_source|utm_medium|utm_campaign|fbclid|gclid)=[^&]*', '', url)
+    if '?' in url or '&' in url:
+        url = _TRACKING_RE.sub('', url)
     
     return url
 
 
+def normalize_urls(series: pd.Series) -> pd.Series:
+    """
+    Version colonne de normalize_url (une normalisation par URL distincte).
+    """
+    return map_distinct(series, normalize_url)
+
+
 def normalize_text(text: str) -> str:
     """
     Normalise un texte générique pour CSV (ASCII-only, retours de ligne).
@@ -113,16 +179,20 @@ def normalize_text(text: str) -> str:
     if not text or not isinstance(text, str):
         return ""
     
-    # Retirer retours de ligne
-    text = text.replace('\n', ' ').replace('\r', ' ')
-    
-    # Retirer doubles espaces
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Trim
-    text = text.strip()
-    
-    return text
+    # Retirer retours de ligne et doubles espaces, trim
+    # (split() découpe sur les mêmes blancs Unicode que \s)
+    return ' '.join(text.split())
+
+
+def _normalize_text_value(value) -> str:
+    return ' '.join((value if isinstance(value, str) else str(value)).split())
+
+
+def normalize_texts(series: pd.Series) -> pd.Series:
+    """
+    Version colonne de normalize_text(str(x)) (manquant -> None).
+    """
+    return map_distinct(series, _normalize_text_value)
 
 
 def slugify_for_file(text: str) -> str:
@@ -152,12 +222,22 @@ def extract_main_words(name: str, max_words: int = 3) -> str:
     Returns:
         Mots principaux
     """
-    normalized = normalize_company_name(name)
+    return _main_words(normalize_company_name(name), max_words)
+
+
+def _main_words(normalized: str, max_words: int = 3) -> str:
     words = normalized.split()
     
     # Filtrer mots courts/commun
-    stop_words = {'et', 'and', 'ltd', 'the', 'le', 'la', 'les', 'de', 'du'}
-    filtered = [w for w in words if len(w) > 2 and w not in stop_words]
+    filtered = [w for w in words if len(w) > 2 and w not in MAIN_WORDS_STOP_WORDS]
     
     return ' '.join(filtered[:max_words])
 
+
+def extract_main_words_normalized(normalized_names: pd.Series, max_words: int = 3) -> pd.Series:
+    """
+    Version colonne d'extract_main_words, à partir de noms déjà normalisés
+    (normalize_company_names): chaque nom n'est normalisé qu'une fois.
+    """
+    return map_distinct(normalized_names, lambda name: _main_words(name, max_words)).fillna('')
+
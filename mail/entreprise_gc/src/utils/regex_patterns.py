@@ -1,7 +1,12 @@
 """
 Patterns regex pour extraction d'emails, téléphones et autres données structurées.
+
+CONTACT_PATTERN trouve emails (y compris obfusqués: [at], (at)) et
+téléphones suisses en un seul parcours du texte; les groupes capturés
+donnent directement la forme canonique (pas de second nettoyage).
 """
 import re
+from typing import Iterator, List, NamedTuple, Union
 
 
 # Email regex - inclut obfuscations simples
@@ -16,6 +21,21 @@ PHONE_CH_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+# Séparateur entre blocs de chiffres d'un téléphone: espaces, point, tiret, barre
+_PHONE_SEP = r'\s*[./\-]?\s*'
+
+# Emails et téléphones suisses en une passe (groupes nommés -> forme canonique).
+# Téléphone: +41 / 0041 (avec "(0)" optionnel) ou format national 0XX,
+# hors d'une suite de chiffres plus longue
+_CONTACT_REGEX = (
+    r'(?<![A-Z0-9._%+\-])(?P<local>[A-Z0-9._%+\-]+)(?P<at>\s*\[at\]\s*|\s*\(at\)\s*|@)(?P<domain>[A-Z0-9.\-]+\.[A-Z]{2,})'
+    r'|(?<![\d+])(?:(?:\+|00)41\s*(?:\(0\)\s*)?|0)(?P<area>\d{2})' + _PHONE_SEP
+    + r'(?P<p1>\d{3})' + _PHONE_SEP + r'(?P<p2>\d{2})' + _PHONE_SEP + r'(?P<p3>\d{2})(?!\d)'
+)
+CONTACT_PATTERN = re.compile(_CONTACT_REGEX, re.IGNORECASE)
+# Variante bytes: offsets en octets dans un buffer brut (UTF-8)
+CONTACT_PATTERN_BYTES = re.compile(_CONTACT_REGEX.encode('ascii'), re.IGNORECASE)
+
 # URL simple
 URL_PATTERN = re.compile(
     r'https?://[^\s<>"{}|\\^`\[\]]+',
@@ -29,6 +49,68 @@ DOMAIN_PATTERN = re.compile(
 )
 
 
+class ContactHit(NamedTuple):
+    """
+    Donnée de contact trouvée dans un buffer.
+    
+    Attributes:
+        kind: 'email' ou 'phone'
+        value: Forme canonique (local@domaine.ch, +41 XX XXX XX XX)
+        start: Début du match (octets si buffer bytes, sinon caractères)
+        end: Fin du match
+        obfuscated: Email écrit avec [at]/(at)
+    """
+    kind: str
+    value: str
+    start: int
+    end: int
+    obfuscated: bool = False
+
+
+def scan_contacts(buffer: Union[str, bytes]) -> Iterator[ContactHit]:
+    """
+    Parcourt un buffer une fois et produit emails et téléphones dans l'ordre.
+    
+    Args:
+        buffer: Texte, ou bytes (offsets en octets)
+        
+    Yields:
+        ContactHit (doublons compris, voir extract_contacts)
+    """
+    if not buffer:
+        return
+    is_bytes = isinstance(buffer, (bytes, bytearray))
+    pattern = CONTACT_PATTERN_BYTES if is_bytes else CONTACT_PATTERN
+    for match in pattern.finditer(buffer):
+        groups = match.groupdict()
+        if is_bytes:
+            # Les groupes ne contiennent que de l'ASCII (classes du pattern)
+            groups = {name: value.decode('ascii') if value is not None else None
+                      for name, value in groups.items()}
+        if groups['local'] is not None:
+            yield ContactHit('email', f"{groups['local']}@{groups['domain'].lower()}",
+                             match.start(), match.end(), groups['at'] != '@')
+        else:
+            yield ContactHit('phone', f"+41 {groups['area']} {groups['p1']} {groups['p2']} {groups['p3']}",
+                             match.start(), match.end())
+
+
+def extract_contacts(buffer: Union[str, bytes]) -> dict:
+    """
+    Emails et téléphones d'un buffer, dédupliqués dans l'ordre d'apparition.
+    
+    Args:
+        buffer: Texte ou bytes
+        
+    Returns:
+        {'emails': [...], 'phones': [...]}
+    """
+    found = {'email': {}, 'phone': {}}
+    for hit in scan_contacts(buffer):
+        found[hit.kind].setdefault(hit.value, None)
+    return {'emails': list(found['email']), 'phones': list(found['phone'])}
+
+
 def clean_email(email: str) -> str:
     """
     Nettoie et normalise un email, retire les obfuscations.
@@ -74,20 +156,7 @@ def extract_emails(text: str) -> list[str]:
     Returns:
         Liste d'emails nettoyés
     """
-    if not text:
-        return []
-    
-    matches = EMAIL_PATTERN.findall(text)
-    emails = []
-    
-    for match in matches:
-        email = match[0]  # Premier groupe
-        cleaned = clean_email(email)
-        
-        if cleaned and cleaned not in emails:
-            emails.append(cleaned)
-    
-    return emails
+    return extract_contacts(text)['emails'] if text else []
 
 
 def normalize_phone(phone: str) -> str:
@@ -132,18 +201,7 @@ def extract_phones(text: str) -> list[str]:
     Returns:
         Liste de téléphones normalisés
     """
-    if not text:
-        return []
-    
-    matches = PHONE_CH_PATTERN.findall(text)
-    phones = []
-    
-    for phone in matches:
-        normalized = normalize_phone(phone if isinstance(phone, str) else '')
-        if normalized and normalized not in phones:
-            phones.append(normalized)
-    
-    return phones
+    return extract_contacts(text)['phones'] if text else []
 
 
 def extract_domain(email: str) -> str:
@@ -0,0 +1,226 @@
+"""
+Politique de retry HTTP selon le type d'échec.
+
+Les échecs permanents (404/410, DNS inexistant, certificat TLS invalide,
+Content-Type refusé) ne sont jamais retentés; les échecs de domaine (DNS,
+TLS) marquent en plus le domaine comme mort pour le reste du run. Les échecs
+transitoires (timeouts, 429, 5xx) sont retentés en respectant Retry-After.
+"""
+import email.utils
+import logging
+import ssl
+import time
+from typing import Callable, Optional
+
+import httpx
+from tenacity import (AsyncRetrying, Retrying, retry_if_exception, stop_after_attempt,
+                      wait_exponential)
+
+from .http_client import CacheMissError, ContentTypeError
+
+logger = logging.getLogger(__name__)
+
+
+PERMANENT = 'permanent'
+TRANSIENT = 'transient'
+
+# Statuts HTTP retentés (avec Retry-After si fourni)
+TRANSIENT_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+# Messages d'erreur de domaine inexistant (NXDOMAIN, selon la plateforme).
+# Les échecs temporaires du résolveur (EAI_AGAIN, "Temporary failure in name
+# resolution") n'en font pas partie: ils sont retentés.
+DNS_ERROR_MARKERS = ('name or service not known', 'nodename nor servname', 'no address associated')
+
+# Messages d'erreur de certificat (nom ne correspondant pas, certificat invalide)
+TLS_ERROR_MARKERS = ('certificate verify failed', 'hostname mismatch', "doesn't match")
+
+
+class DeadDomainError(httpx.RequestError):
+    """
+    Requête non envoyée: domaine marqué mort plus tôt dans le run.
+    """
+
+
+def _exception_chain(exc: BaseException):
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        yield exc
+        exc = exc.__cause__ or exc.__context__
+
+
+def domain_failure(exc: BaseException) -> Optional[str]:
+    """
+    Raison pour laquelle l'échec condamne tout le domaine ('dns', 'tls') ou None.
+    """
+    if not isinstance(exc, httpx.ConnectError):
+        return None
+    for error in _exception_chain(exc):
+        if isinstance(error, ssl.SSLCertVerificationError):
+            return 'tls'
+        message = str(error).lower()
+        if any(marker in message for marker in TLS_ERROR_MARKERS):
+            return 'tls'
+        if any(marker in message for marker in DNS_ERROR_MARKERS):
+            return 'dns'
+    return None
+
+
+def classify_failure(exc: BaseException) -> str:
+    """
+    Classe un échec de requête: PERMANENT (ne pas retenter) ou TRANSIENT.
+    """
+    if isinstance(exc, (CacheMissError, ContentTypeError, DeadDomainError)):
+        return PERMANENT
+    if isinstance(exc, httpx.HTTPStatusError):
+        return TRANSIENT if exc.response.status_code in TRANSIENT_STATUS else PERMANENT
+    if domain_failure(exc):
+        return PERMANENT
+    return TRANSIENT
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """
+    Délai (secondes) demandé par l'en-tête Retry-After d'une réponse d'erreur.
+    """
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return None
+    value = exc.response.headers.get('Retry-After')
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Retry des échecs transitoires, court-circuit des échecs permanents.
+
+    Tient le registre des domaines morts et compte les retries gaspillés
+    (retries d'une requête qui a fini par échouer).
+    """
+
+    def __init__(self, max_attempts: int = 3, min_wait: float = 2, max_wait: float = 10,
+                 max_retry_after: float = 60):
+        """
+        Args:
+            max_attempts: Tentatives max par requête (1 = pas de retry)
+            min_wait: Attente min entre tentatives (secondes, backoff exponentiel)
+            max_wait: Attente max du backoff exponentiel
+            max_retry_after: Plafond appliqué à Retry-After
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.max_retry_after = max_retry_after
+        self._backoff = wait_exponential(multiplier=1, min=min_wait, max=max_wait)
+        self.dead_domains = {}
+        self.requests = 0
+        self.failures = 0
+        self.retries = 0
+        self.wasted_retries = 0
+        self.short_circuited = 0
+        self.domain_retries = {}
+
+    def is_dead(self, domain: Optional[str]) -> bool:
+        return bool(domain) and domain in self.dead_domains
+
+    def _wait(self, retry_state) -> float:
+        delay = retry_after(retry_state.outcome.exception())
+        if delay is not None:
+            return min(delay, self.max_retry_after)
+        return self._backoff(retry_state)
+
+    def _retrying_kwargs(self) -> dict:
+        return {
+            'stop': stop_after_attempt(self.max_attempts),
+            'wait': self._wait,
+            'retry': retry_if_exception(lambda exc: classify_failure(exc) == TRANSIENT),
+            'reraise': True
+        }
+
+    def _before_call(self, url: str, domain: Optional[str]) -> None:
+        self.requests += 1
+        if self.is_dead(domain):
+            self.short_circuited += 1
+            raise DeadDomainError(f"Domaine mort ({self.dead_domains[domain]}): {url}")
+
+    def _after_failure(self, exc: BaseException, attempts: int, domain: Optional[str]) -> None:
+        self.failures += 1
+        self.wasted_retries += attempts - 1
+        reason = domain_failure(exc)
+        if reason and domain and domain not in self.dead_domains:
+            self.dead_domains[domain] = reason
+            logger.info(f"Domaine {domain} marqué mort pour ce run ({reason})")
+
+    def _count_retries(self, retrying, domain: Optional[str]) -> None:
+        retries = retrying.statistics.get('attempt_number', 1) - 1
+        self.retries += retries
+        if retries and domain:
+            self.domain_retries[domain] = self.domain_retries.get(domain, 0) + retries
+
+    def call(self, func: Callable, url: str, domain: Optional[str] = None):
+        """
+        Appelle func(url) avec retry des échecs transitoires.
+
+        Args:
+            func: Fonction de fetch
+            url: URL demandée
+            domain: Domaine de l'URL (registre des domaines morts)
+        """
+        self._before_call(url, domain)
+        retrying = Retrying(**self._retrying_kwargs())
+        try:
+            result = retrying(func, url)
+        except Exception as e:
+            self._after_failure(e, retrying.statistics.get('attempt_number', 1), domain)
+            raise
+        finally:
+            self._count_retries(retrying, domain)
+        return result
+
+    async def acall(self, func: Callable, url: str, domain: Optional[str] = None):
+        """
+        Variante asynchrone de call (func renvoie une coroutine).
+        """
+        self._before_call(url, domain)
+        retrying = AsyncRetrying(**self._retrying_kwargs())
+
+        # tenacity n'attend le résultat que d'une fonction coroutine: les
+        # lambdas renvoyant une coroutine sont enveloppées
+        async def attempt(u):
+            return await func(u)
+
+        try:
+            result = await retrying(attempt, url)
+        except Exception as e:
+            self._after_failure(e, retrying.statistics.get('attempt_number', 1), domain)
+            raise
+        finally:
+            self._count_retries(retrying, domain)
+        return result
+
+    def stats(self) -> dict:
+        return {
+            'requests': self.requests,
+            'failures': self.failures,
+            'retries': self.retries,
+            'wasted_retries': self.wasted_retries,
+            'dead_domains': len(self.dead_domains),
+            'short_circuited': self.short_circuited
+        }
+
+    def log_stats(self) -> None:
+        stats = self.stats()
+        logger.info(f"Retries: {stats['retries']} dont {stats['wasted_retries']} gaspillés, "
+                    f"{stats['dead_domains']} domaines morts, "
+                    f"{stats['short_circuited']} requêtes évitées")
+
+
+__all__ = ['RetryPolicy', 'DeadDomainError', 'classify_failure', 'domain_failure',
+           'retry_after', 'PERMANENT', 'TRANSIENT']
@@ -0,0 +1,83 @@
+"""
+Faux worksheet gspread en mémoire pour les tests de synchronisation.
+"""
+import re
+from types import SimpleNamespace
+
+
+class FakeAPIError(Exception):
+    """
+    Erreur API (status HTTP dans response.status_code, comme gspread.exceptions.APIError).
+    """
+
+    def __init__(self, status_code: int):
+        super().__init__(f"APIError [{status_code}]")
+        self.response = SimpleNamespace(status_code=status_code)
+        self.code = status_code
+
+
+def _parse_a1(cell: str):
+    match = re.fullmatch(r'([A-Z]+)(\d+)', cell)
+    col = 0
+    for char in match.group(1):
+        col = col * 26 + ord(char) - ord('A') + 1
+    return int(match.group(2)), col
+
+
+class FakeWorksheet:
+    """
+    Grille de cellules (texte, comme get_all_values) et journal des appels.
+    """
+
+    def __init__(self, values=None, rows: int = 1000, cols: int = 26, fail_statuses=None):
+        """
+        Args:
+            values: Contenu initial (liste de lignes)
+            rows: Nombre de lignes de la grille
+            cols: Nombre de colonnes de la grille
+            fail_statuses: Statuts HTTP levés par les prochains batch_update
+        """
+        self.cells = {}
+        self.row_count = rows
+        self.col_count = cols
+        self.fail_statuses = list(fail_statuses or [])
+        self.reads = 0
+        self.updates = []
+        for r, row in enumerate(values or [], start=1):
+            for c, value in enumerate(row, start=1):
+                if value != '':
+                    self.cells[(r, c)] = str(value)
+
+    def get_all_values(self):
+        self.reads += 1
+        if not self.cells:
+            return []
+        height = max(r for r, _ in self.cells)
+        width = max(c for _, c in self.cells)
+        return [[self.cells.get((r, c), '') for c in range(1, width + 1)]
+                for r in range(1, height + 1)]
+
+    def add_rows(self, rows: int):
+        self.row_count += rows
+
+    def add_cols(self, cols: int):
+        self.col_count += cols
+
+    def batch_update(self, data, value_input_option=None):
+        if self.fail_statuses:
+            raise FakeAPIError(self.fail_statuses.pop(0))
+        for item in data:
+            start, end = item['range'].split(':')
+            first_row, first_col = _parse_a1(start)
+            last_row, last_col = _parse_a1(end)
+            if last_row > self.row_count or last_col > self.col_count:
+                raise ValueError(f"Range {item['range']} exceeds grid limits")
+            for r, row in enumerate(item['values'], start=first_row):
+                for c, value in enumerate(row, start=first_col):
+                    if isinstance(value, bool):
+                        value = 'TRUE' if value else 'FALSE'
+                    self.cells[(r, c)] = str(value)
+                    if value == '':
+                        del self.cells[(r, c)]
+        self.updates.append(list(data))
+        return {}
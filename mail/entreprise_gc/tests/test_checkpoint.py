@@ -0,0 +1,91 @@
+"""
+Tests pour les checkpoints et la reprise d'un run.
+"""
+import json
+
+import pandas as pd
+import pytest
+from src.crawler.checkpoint import CrawlCheckpoint
+from src.crawler.site_enricher import SiteEnricher
+from src.pipeline import crawl_and_enrich
+
+
+def test_checkpoint_flush_and_reload(tmp_path):
+    """Test écriture par paquets, manifeste et relecture tolérante."""
+    checkpoint = CrawlCheckpoint(tmp_path, run_id='run1', every=2)
+    checkpoint.record('domain:a.ch', 'https://a.ch', {'email': 'info@a.ch'})
+    assert not checkpoint.results_path.exists()
+
+    checkpoint.record('domain:b.ch', 'https://b.ch', {'email': 'info@b.ch'})
+    checkpoint.record('domain:c.ch', 'https://c.ch', RuntimeError("timeout"))
+    with open(checkpoint.results_path, 'a', encoding='utf-8') as f:
+        f.write('{"key": "domain:d.ch", "res')  # Interruption pendant l'écriture
+
+    resumed = CrawlCheckpoint(tmp_path, run_id='run1')
+    assert resumed.get('domain:b.ch') == {'email': 'info@b.ch'}
+    assert resumed.get('domain:c.ch') is None
+    assert json.loads((tmp_path / 'run1' / 'manifest.json').read_text())['completed'] == 2
+
+
+def test_checkpoint_append_after_truncated_line(tmp_path):
+    """Test reprise après ligne tronquée: le résultat suivant n'est pas fusionné avec elle."""
+    checkpoint = CrawlCheckpoint(tmp_path, run_id='run1', every=1)
+    checkpoint.record('domain:a.ch', 'https://a.ch', {'email': 'info@a.ch'})
+    with open(checkpoint.results_path, 'a', encoding='utf-8') as f:
+        f.write('{"key": "domain:b.ch", "res')
+
+    resumed = CrawlCheckpoint(tmp_path, run_id='run1', every=1, resume=True)
+    resumed.record('domain:c.ch', 'https://c.ch', {'email': 'info@c.ch'})
+
+    reloaded = CrawlCheckpoint(tmp_path, run_id='run1', resume=True)
+    assert reloaded.get('domain:a.ch') == {'email': 'info@a.ch'}
+    assert reloaded.get('domain:c.ch') == {'email': 'info@c.ch'}
+    assert reloaded.get('domain:b.ch') is None
+
+
+def test_completed_run_removes_checkpoint(tmp_path):
+    """Test fin de run réussie: dossier supprimé; run interrompu: dossier conservé."""
+    interrupted = CrawlCheckpoint(tmp_path, run_id='run1')
+    interrupted.record('domain:a.ch', 'https://a.ch', {'email': 'info@a.ch'})
+    interrupted.close()
+    assert (tmp_path / 'run1' / 'results.jsonl').exists()
+
+    completed = CrawlCheckpoint(tmp_path, run_id='run1', resume=True)
+    completed.record('domain:b.ch', 'https://b.ch', {'email': 'info@b.ch'})
+    completed.close(completed=True)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_resume_unknown_run(tmp_path):
+    """Test --resume d'un run inexistant: erreur explicite, aucun dossier créé."""
+    with pytest.raises(FileNotFoundError, match='run-inconnu'):
+        CrawlCheckpoint(tmp_path, run_id='run-inconnu', resume=True)
+    assert not (tmp_path / 'run-inconnu').exists()
+
+
+def test_crawl_resume_skips_done_sites(tmp_path, monkeypatch):
+    """Test reprise: seuls les sites non enrichis sont crawlés."""
+    crawled = []
+
+    def fake_enrich(self, site_web, existing_email=None):
+        crawled.append(site_web)
+        if site_web == 'https://b.ch' and len(crawled) == 2:
+            raise KeyboardInterrupt
+        return {'email': f"info@{site_web.split('//')[1]}", 'errors': []}
+
+    monkeypatch.setattr(SiteEnricher, 'enrich_site', fake_enrich)
+
+    df = pd.DataFrame([
+        {'company_name': 'A SA', 'site_web': 'https://a.ch', 'email': None},
+        {'company_name': 'B SA', 'site_web': 'https://b.ch', 'email': None},
+    ])
+
+    try:
+        crawl_and_enrich(df.copy(), checkpoint=CrawlCheckpoint(tmp_path, run_id='run1', every=10))
+    except KeyboardInterrupt:
+        pass
+
+    crawled.clear()
+    result = crawl_and_enrich(df.copy(), checkpoint=CrawlCheckpoint(tmp_path, run_id='run1'))
+    assert crawled == ['https://b.ch']
+    assert result['email'].tolist() == ['info@a.ch', 'info@b.ch']
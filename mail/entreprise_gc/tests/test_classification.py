@@ -61,3 +61,66 @@ def test_classify_empty():
     assert classify_tag_gc("") == 0
     assert classify_tag_gc("", "") == 0
 
+
+
+def test_classify_no_substring_false_hits():
+    """Test mots-clés courts non détectés dans d'autres mots."""
+    # "eau" dans "bureau", "it" dans "qualité", "lab" dans "collaboration"
+    explanation = explain_classification("Bureau d'ingénieurs, qualité et collaboration")
+    assert explanation['gc_core_matches'] == []
+    assert explanation['general_matches'] == []
+    assert explanation['education_matches'] == []
+
+
+def test_classify_word_prefix_matches():
+    """Test composés et pluriels toujours détectés."""
+    assert classify_tag_gc("Tiefbauarbeiten und Brückenbau") == 1
+    assert classify_tag_gc("Traitement des eaux et IT") == 2
+
+
+def test_get_specialties_keywords():
+    """Test mots-clés attendus par tag."""
+    from src.utils.classification import get_specialties_keywords
+    keywords = get_specialties_keywords(3)
+    assert len(keywords) == 10
+    assert keywords == sorted(keywords)
+    assert get_specialties_keywords(99) == []
+
+
+def test_classify_tag_gc_batch_matches_row_wise():
+    """Test batch identique à la version ligne à ligne."""
+    import numpy as np
+    import pandas as pd
+    from src.utils.classification import classify_tag_gc_batch
+
+    specialites = pd.Series([
+        "Génie civil et structures", None, "Génie civil et architecture",
+        "Génie civil, Minergie et stages EPFL", "Bureau d'études", "",
+        "Ponts\nbéton", "Hydraulique\x00 et développement durable"
+    ], index=[5, 3, 9, 1, 0, 2, 8, 4])
+    names = pd.Series([
+        "Test SA", "Tiefbau AG", None, "GC Sàrl", "Bureau SA", "Lab Conseil", "X", "Y"
+    ], index=specialites.index)
+
+    expected = [classify_tag_gc(s if isinstance(s, str) else '', n if isinstance(n, str) else '')
+                for s, n in zip(specialites, names)]
+    tags, masks = classify_tag_gc_batch(specialites, names, return_masks=True)
+
+    assert tags.tolist() == expected
+    assert masks['gc_core'].dtype == np.bool_
+    assert masks['gc_core'][1]
+    assert classify_tag_gc_batch(pd.Series([], dtype=object), pd.Series([], dtype=object)).tolist() == []
+
+
+def test_overlapping_keywords_agree():
+    """Test mots-clés chevauchants: classify, batch et explain donnent le même tag."""
+    import pandas as pd
+    from src.utils.classification import classify_tag_gc_batch
+
+    texts = ["minergie-pont", "génie structure", "béton armé-lab", "minergie-eco stage"]
+
+    batch = classify_tag_gc_batch(pd.Series(texts), pd.Series([''] * len(texts))).tolist()
+    explained = [explain_classification(text)['tag'] for text in texts]
+
+    assert classify_tag_gc("minergie-pont") == 3
+    assert [classify_tag_gc(text) for text in texts] == batch == explained
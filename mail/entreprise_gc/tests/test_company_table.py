@@ -0,0 +1,78 @@
+"""
+Tests pour la table d'entreprises en colonnes.
+"""
+import pandas as pd
+import pytest
+
+from src.company_table import Company, CompanyTable, SOURCE_COLUMNS, set_value
+from src.pipeline import normalize_dataframe
+from src.utils.deduplication import deduplicate_dataframe
+
+
+def _records():
+    return [
+        Company(company_name="Bureau Alpha SA", canton="VD", ville="Lausanne",
+                site_web="https://www.alpha.ch", source_url="https://suisse.ing/search?canton=VD"),
+        Company(company_name="Alpha SA", canton="VD", ville="Lausanne",
+                site_web="https://alpha.ch", email="info@alpha.ch",
+                source_url="https://suisse.ing/search?canton=VD"),
+        Company(company_name="Beta Ingénieurs", canton="GE", ville="Genève"),
+    ]
+
+
+def test_company_slots():
+    """Test enregistrement à slots: pas de __dict__, champs inconnus refusés."""
+    company = Company(company_name="Alpha SA", canton="VD")
+
+    assert not hasattr(company, '__dict__')
+    assert company.email is None
+    with pytest.raises(AttributeError):
+        company.notes = "x"
+
+
+def test_from_records_categorical():
+    """Test construction: colonnes attendues, canton/ville/source_url catégorielles."""
+    table = CompanyTable.from_records(_records())
+
+    assert list(table.frame.columns) == list(SOURCE_COLUMNS)
+    for col in ('canton', 'ville', 'source_url'):
+        assert isinstance(table.frame[col].dtype, pd.CategoricalDtype)
+    assert table.frame['canton'].cat.categories.tolist() == ['GE', 'VD']
+    assert list(table.records()) == _records()
+    assert len(CompanyTable.empty()) == 0
+
+
+def test_slice_and_concat():
+    """Test tranches sans copie et concaténation à catégories unifiées."""
+    table = CompanyTable.from_records(_records())
+
+    batches = list(table.batches(2))
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert isinstance(batches[1].frame['canton'].dtype, pd.CategoricalDtype)
+
+    merged = CompanyTable.concat([batches[1], batches[0].frame])
+    assert isinstance(merged.frame['canton'].dtype, pd.CategoricalDtype)
+    assert merged.frame['canton'].tolist() == ['GE', 'VD', 'VD']
+    assert list(merged.frame.index) == [0, 1, 2]
+
+
+def test_set_value_new_category():
+    """Test affectation d'une valeur hors catégories."""
+    df = CompanyTable.from_records(_records()).frame
+
+    set_value(df, 2, 'source_url', "https://beta.ch/contact")
+
+    assert df.at[2, 'source_url'] == "https://beta.ch/contact"
+
+
+def test_pipeline_stages_keep_categories():
+    """Test normalisation et déduplication sur une table catégorielle."""
+    df = CompanyTable.from_records(_records()).frame
+
+    result = deduplicate_dataframe(normalize_dataframe(df))
+
+    assert len(result) == 2
+    assert isinstance(result['ville'].dtype, pd.CategoricalDtype)
+    assert result['email'].tolist()[0] == "info@alpha.ch"
+    # L'entrée n'est pas modifiée par les étapes
+    assert df['company_name'].tolist()[0] == "Bureau Alpha SA"
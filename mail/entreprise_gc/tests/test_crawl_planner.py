@@ -0,0 +1,109 @@
+"""
+Tests pour le planificateur robots.txt / sitemap.
+"""
+import gzip
+
+import httpx
+from src.crawler.crawl_planner import CrawlPlanner, parse_sitemap, site_key
+from src.crawler.site_enricher import SiteEnricher
+
+
+ROBOTS = """User-agent: *
+Crawl-delay: 4
+Disallow: /intern/
+Sitemap: https://example.ch/sitemap_index.xml
+"""
+
+SITEMAP_INDEX = """<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.ch/pages.xml.gz</loc></sitemap>
+</sitemapindex>"""
+
+PAGES = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://example.ch/fr/projets</loc></url>
+  <url><loc>https://example.ch/intern/kontakt</loc></url>
+  <url><loc>https://example.ch/fr/nous-joindre/contact</loc></url>
+  <url><loc>https://example.ch/fr/prestations</loc></url>
+</urlset>"""
+
+
+def chunked(data: bytes, size: int = 16):
+    """Découpe un document en petits morceaux (flux)."""
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+def test_parse_sitemap_streamed_gzip():
+    """Test sitemap gzippé lu par petits morceaux."""
+    entries = list(parse_sitemap(chunked(gzip.compress(PAGES.encode()))))
+    assert entries[0] == ('url', 'https://example.ch/fr/projets')
+    assert len(entries) == 4
+    assert list(parse_sitemap([SITEMAP_INDEX.encode()])) == [('sitemap', 'https://example.ch/pages.xml.gz')]
+
+
+def test_planner_robots_rules():
+    """Test Disallow, Crawl-delay et sitemaps déclarés."""
+    planner = CrawlPlanner(max_crawl_delay=3)
+    site = site_key('https://Example.ch/fr/')
+    planner.set_robots(site, ROBOTS)
+
+    assert site == 'https://example.ch'
+    assert not planner.can_fetch(site, 'https://example.ch/intern/kontakt')
+    assert planner.can_fetch(site, 'https://example.ch/contact')
+    assert planner.crawl_delay(site) == 3
+    assert planner.sitemap_urls(site, 'https://example.ch') == ['https://example.ch/sitemap_index.xml']
+    assert planner.crawl_delay('https://unknown.ch') == 0
+
+
+def test_robots_per_host(monkeypatch):
+    """Test robots.txt lu par hôte: www.x.ch et shop.x.ch ont chacun leurs règles."""
+    enricher = SiteEnricher(rate_limit=0)
+    robots = {
+        'https://www.example.ch/robots.txt': "User-agent: *\nDisallow:\n",
+        'https://shop.example.ch/robots.txt': "User-agent: *\nDisallow: /\nCrawl-delay: 2\n",
+    }
+    fetched = []
+
+    def fake_fetch(url, kind='page'):
+        fetched.append(url)
+        content = robots.get(url, "<p>info@example.ch</p>")
+        return httpx.Response(200, content=content.encode(), request=httpx.Request('GET', url))
+
+    monkeypatch.setattr(enricher, '_fetch_url', fake_fetch)
+    monkeypatch.setattr(enricher, '_wait_rate_limit', lambda domain: None)
+
+    assert enricher.enrich_site('https://www.example.ch')['email'] == 'info@example.ch'
+    shop = enricher.enrich_site('https://shop.example.ch')
+
+    assert 'https://shop.example.ch/robots.txt' in fetched
+    assert 'https://shop.example.ch' not in fetched
+    assert shop['email'] == 'formulaire'
+    assert enricher._rate_limit_for('example.ch') == 2
+
+
+def test_enrich_site_uses_sitemap(monkeypatch):
+    """Test pages contact et prestations prises dans le sitemap, robots.txt respecté."""
+    enricher = SiteEnricher(rate_limit=0)
+    fetched = []
+    pages = {
+        'https://example.ch/robots.txt': ROBOTS.encode(),
+        'https://example.ch': b"<p>Bienvenue</p>",
+        'https://example.ch/sitemap_index.xml': SITEMAP_INDEX.encode(),
+        'https://example.ch/pages.xml.gz': gzip.compress(PAGES.encode()),
+        'https://example.ch/fr/nous-joindre/contact': b"<p>info@example.ch</p>",
+        'https://example.ch/fr/prestations': b"<div class='services'>Ponts et routes</div>",
+    }
+
+    def fake_fetch(url, kind='page'):
+        fetched.append(url)
+        return httpx.Response(200, content=pages[url], request=httpx.Request('GET', url))
+
+    monkeypatch.setattr(enricher, '_fetch_url', fake_fetch)
+    monkeypatch.setattr(enricher, '_wait_rate_limit', lambda domain: None)
+
+    result = enricher.enrich_site('https://example.ch')
+
+    assert fetched == list(pages)
+    assert result['email'] == 'info@example.ch'
+    assert result['specialites'] == 'Ponts et routes'
+    assert enricher._rate_limit_for('example.ch') == 4
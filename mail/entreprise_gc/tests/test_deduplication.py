@@ -58,3 +58,34 @@ def test_deduplicate_keep_richest():
     assert len(result) == 1
     assert pd.notna(result.iloc[0]['email'])
 
+
+
+def test_deduplicate_priority_order():
+    """Test clé domaine prioritaire, groupes non transitifs."""
+    df = pd.DataFrame([
+        {'company_name': 'Alpha', 'site_web': 'https://alpha.ch', 'ville': 'Sion'},
+        {'company_name': 'Beta', 'site_web': 'https://www.alpha.ch', 'ville': 'Sion'},
+        {'company_name': 'Alpha SA', 'site_web': None, 'ville': 'Sion'}
+    ], index=[10, 20, 30])
+    
+    result = deduplicate_dataframe(df)
+    assert result['company_name'].tolist() == ['Alpha', 'Alpha SA']
+
+
+def test_streaming_deduplicator_across_batches():
+    """Test doublons écartés d'un lot à l'autre via l'index global."""
+    from src.utils.deduplication import StreamingDeduplicator
+
+    dedup = StreamingDeduplicator()
+    first = dedup.filter(pd.DataFrame([
+        {'company_name': 'Test SA', 'ville': 'Lausanne', 'site_web': 'https://test.ch', 'email': None},
+        {'company_name': 'Test Sàrl', 'ville': 'Lausanne', 'site_web': 'https://www.test.ch', 'email': 'info@test.ch'},
+    ]))
+    second = dedup.filter(pd.DataFrame([
+        {'company_name': 'Autre Nom', 'ville': 'Genève', 'site_web': 'https://test.ch/fr', 'email': None},
+        {'company_name': 'Nouveau SA', 'ville': 'Sion', 'site_web': None, 'email': None},
+    ]))
+
+    assert first['email'].tolist() == ['info@test.ch']
+    assert second['company_name'].tolist() == ['Nouveau SA']
+    assert dedup.dropped == 1
@@ -0,0 +1,26 @@
+"""
+Tests pour la résolution des domaines enregistrés.
+"""
+import pandas as pd
+
+from src.utils.domains import registered_domain, registered_domains, url_domain
+
+
+def test_registered_domain():
+    """Test domaine enregistré (suffixes multiples, hôte nu, valeurs vides)."""
+    assert registered_domain("https://www.bureau-exemple.ch/contact") == "bureau-exemple.ch"
+    assert registered_domain("http://shop.example.co.uk") == "example.co.uk"
+    assert registered_domain("example.ch") == "example.ch"
+    assert registered_domain("") is None
+    assert registered_domain(None) is None
+    assert url_domain("http://localhost:8080/x") == "localhost"
+
+
+def test_registered_domains_series():
+    """Test version colonne: alignée sur l'index, None si manquant."""
+    series = pd.Series(["https://www.a.ch", None, "http://a.ch/", "", "https://b.ch"], index=[5, 6, 7, 8, 9])
+
+    result = registered_domains(series)
+
+    assert list(result.index) == [5, 6, 7, 8, 9]
+    assert result.tolist() == ["a.ch", None, "a.ch", None, "b.ch"]
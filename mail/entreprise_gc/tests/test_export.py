@@ -0,0 +1,87 @@
+"""
+Tests pour l'export multi-format (CSV, JSONL, Parquet).
+"""
+import pandas as pd
+import pytest
+
+from src.company_table import encode_categoricals
+from src.export import (AppendExport, atomic_path, export_dataframe, parse_formats, read_export,
+                        write_csv)
+
+
+def _companies():
+    df = pd.DataFrame({
+        'company_name': ["Alpha SA", "Béta Sàrl", "Gamma AG"],
+        'canton': ["VD", "GE", "VD"],
+        'ville': ["Lausanne", None, "Nyon"],
+        'site_web': ["https://alpha.ch", None, "https://gamma.ch"],
+        'email': ["info@alpha.ch", None, None],
+        '_domain': ["alpha.ch", None, "gamma.ch"],
+        'tag_gc': pd.Categorical([1, 0, 2], categories=range(5))
+    })
+    return encode_categoricals(df)
+
+
+def test_parse_formats():
+    """Test option --format: doublons retirés, format inconnu refusé."""
+    assert parse_formats("csv, JSONL,csv") == ['csv', 'jsonl']
+    with pytest.raises(ValueError):
+        parse_formats("csv,xlsx")
+
+
+def test_export_csv_and_jsonl(tmp_path):
+    """Test export multi-format: colonnes finales seulement, relecture identique."""
+    paths = export_dataframe(_companies(), tmp_path / 'out.csv', ['csv', 'jsonl'])
+
+    assert [path.name for path in paths] == ['out.csv', 'out.jsonl']
+    for path in paths:
+        result = read_export(path)
+        assert list(result.columns) == ['company_name', 'canton', 'ville', 'site_web', 'email', 'tag_gc']
+        assert result['company_name'].tolist() == ["Alpha SA", "Béta Sàrl", "Gamma AG"]
+        assert result['tag_gc'].tolist() == [1, 0, 2]
+    assert (tmp_path / 'out.jsonl').read_text(encoding='utf-8').count('\n') == 3
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['out.csv', 'out.jsonl']
+
+
+def test_atomic_write_keeps_previous_on_error(tmp_path):
+    """Test écriture atomique: une erreur laisse l'export précédent intact."""
+    output = tmp_path / 'out.csv'
+    write_csv(_companies(), output)
+    before = output.read_text(encoding='utf-8')
+
+    with pytest.raises(RuntimeError):
+        with atomic_path(output) as tmp:
+            tmp.write_text("partiel", encoding='utf-8')
+            raise RuntimeError("interrompu")
+
+    assert output.read_text(encoding='utf-8') == before
+    assert [p.name for p in tmp_path.iterdir()] == ['out.csv']
+
+
+def test_append_export_writes_batches(tmp_path):
+    """Test export par lots: chaque lot est visible dès son écriture."""
+    (tmp_path / 'out.csv').write_text("ancien\n", encoding='utf-8')
+    output = AppendExport(tmp_path / 'out.csv', ['csv', 'jsonl'])
+    df = _companies()
+
+    output.write(df.iloc[:2])
+    assert len(pd.read_csv(tmp_path / 'out.csv')) == 2
+    output.write(df.iloc[2:])
+
+    assert len(pd.read_csv(tmp_path / 'out.csv')) == 3
+    assert len(read_export(tmp_path / 'out.jsonl')) == 3
+    with pytest.raises(ValueError):
+        AppendExport(tmp_path / 'out.csv', ['parquet'])
+
+
+def test_export_parquet_partitioned(tmp_path):
+    """Test Parquet: colonnes typées, partitionnement par canton."""
+    pytest.importorskip('pyarrow')
+
+    export_dataframe(_companies(), tmp_path / 'out.csv', ['parquet'])
+    result = pd.read_parquet(tmp_path / 'out.parquet')
+    assert isinstance(result['canton'].dtype, pd.CategoricalDtype)
+    assert result['company_name'].tolist() == ["Alpha SA", "Béta Sàrl", "Gamma AG"]
+
+    export_dataframe(_companies(), tmp_path / 'out.csv', ['parquet'], partition_by=['canton'])
+    assert sorted(p.name for p in (tmp_path / 'out.parquet').iterdir()) == ['canton=GE', 'canton=VD']
@@ -0,0 +1,60 @@
+"""
+Tests pour la détection de doublons approximatifs.
+"""
+import pandas as pd
+import pytest
+from src.utils.deduplication import mark_potential_duplicates
+from src.utils.fuzzy_matching import find_candidate_pairs, minhash_signature
+
+
+@pytest.fixture
+def near_duplicates_df():
+    """Fixture: noms proches avec index non contigu."""
+    return pd.DataFrame([
+        {'company_name': 'Bureau Durand Ingénieurs SA', 'canton': 'VD'},
+        {'company_name': 'Hydro Conseils Valais', 'canton': 'VS'},
+        {'company_name': 'Bureau Durant Ingenieurs Sàrl', 'canton': 'GE'},
+        {'company_name': 'ABC', 'canton': 'VD'},
+    ], index=[100, 7, 42, 3])
+
+
+def test_minhash_signature_deterministic():
+    """Test signature stable pour un même texte."""
+    assert (minhash_signature("bureau durand") == minhash_signature("bureau durand")).all()
+
+
+def test_find_candidate_pairs(near_duplicates_df):
+    """Test paire trouvée malgré cantons différents (bucket MinHash)."""
+    pairs = find_candidate_pairs(near_duplicates_df)
+    assert len(pairs) == 1
+    assert {pairs.loc[0, 'left_index'], pairs.loc[0, 'right_index']} == {100, 42}
+    assert pairs.loc[0, 'score'] >= 85
+
+
+def test_mark_potential_duplicates_non_range_index(near_duplicates_df):
+    """Test marquage par label avec index non contigu."""
+    result = mark_potential_duplicates(near_duplicates_df)
+    assert result['_potential_duplicate'].to_dict() == {100: True, 7: False, 42: True, 3: False}
+
+
+def test_find_candidate_pairs_empty():
+    """Test DataFrame vide."""
+    assert find_candidate_pairs(pd.DataFrame()).empty
+
+
+def test_oversized_blocks_split_or_reported(caplog):
+    """Test blocs trop grands: redécoupés par MinHash, noms restants signalés en WARNING."""
+    names = [f"Bureau {word} Ingénieurs" for word in
+             ('Alpha', 'Bravo', 'Charlie', 'Delta', 'Echo', 'Foxtrot', 'Golf', 'Hotel')]
+    df = pd.DataFrame({'company_name': names + ["Bureau Alpha Ingenieur", "Bureau Echo Ingenieur"],
+                       'canton': 'VD'})
+
+    pairs = find_candidate_pairs(df, max_block_size=4)
+    found = dict(zip(zip(pairs['left_index'], pairs['right_index']), pairs['block']))
+    # Paires trouvées dans le bloc "bureau" redécoupé, pas seulement via les buckets MinHash
+    assert found[(0, 8)] == found[(4, 9)] == 'token'
+
+    same = pd.DataFrame({'company_name': ["Bureau Alpha Ingénieurs"] * 6, 'canton': 'VD'})
+    with caplog.at_level('WARNING', logger='src.utils.fuzzy_matching'):
+        assert find_candidate_pairs(same, max_block_size=4).empty
+    assert "6 noms non comparés" in caplog.text
@@ -0,0 +1,56 @@
+"""
+Tests pour l'extraction HTML en une passe.
+"""
+from src.crawler.html_extractor import extract_page
+
+
+PAGE = """<html><head>
+<style>.x { content: "style@example.ch"; }</style>
+<script>var tracking = "ignore me";</script>
+<script type="application/ld+json">{"email": "ld@example.ch"}</script>
+</head><body>
+<p>Bureau d'ingénieurs <b>Exemple</b> SA</p>
+<a href="mailto:info@example.ch?subject=Contact">Écrire</a>
+<a href="tel:+41211234567">Appeler</a>
+<!-- ancien contact: old@example.ch -->
+<section class="our-services"><h2>Prestations</h2><p>Génie civil</p>
+  <div class="services">Ponts</div></section>
+<div id="prestations">Béton armé</div>
+</body></html>"""
+
+
+def test_extract_page_contacts():
+    """Test mailto, JSON-LD et commentaires récoltés; style ignoré."""
+    result = extract_page(PAGE, "https://example.ch")
+
+    assert set(result['emails']) == {'info@example.ch', 'ld@example.ch', 'old@example.ch'}
+    assert result['parse_time'] >= 0
+
+
+def test_extract_page_specialites():
+    """Test sections spécialités en ordre du document, sans doublon ni script."""
+    result = extract_page(PAGE, "https://example.ch")
+
+    assert result['specialites'] == "Prestations Génie civil Ponts Béton armé"
+    assert 'ignore me' not in result['specialites']
+
+
+def test_extract_page_empty():
+    """Test page vide ou invalide."""
+    assert extract_page("", "https://example.ch")['emails'] == []
+    assert extract_page("<?xml version='1.0' encoding='utf-8'?><p>a@b.ch</p>")['emails'] == ['a@b.ch']
+
+
+def test_rank_contact_links():
+    """Test classement des liens de contact (même site, meilleurs d'abord)."""
+    from src.crawler.html_extractor import rank_contact_links
+
+    links = extract_page(
+        '<a href="/about">À propos</a><a href="/impressum">Impressum</a>'
+        '<a href="https://other.ch/contact">Partenaire</a><a href="/kontakt#form">Kontakt</a>'
+        '<a href="/docs/contact.pdf">PDF</a><a href="/projets">Projets</a>'
+    )['links']
+
+    assert rank_contact_links(links, "https://www.example.ch/", top_k=3) == [
+        "https://www.example.ch/kontakt", "https://www.example.ch/impressum", "https://www.example.ch/about"
+    ]
@@ -0,0 +1,88 @@
+"""
+Tests pour le cache HTTP sur disque.
+"""
+import httpx
+import pytest
+from src.utils.http_cache import CacheMissError, ResponseCache, normalize_cache_url
+from src.utils.http_client import HttpClientPool
+
+
+class CountingHandler:
+    """Transport factice qui compte les requêtes."""
+
+    def __init__(self, etag='"v1"'):
+        self.requests = []
+        self.etag = etag
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if request.headers.get('If-None-Match') == self.etag:
+            return httpx.Response(304)
+        return httpx.Response(200, text="<p>info@example.ch</p>",
+                              headers={'ETag': self.etag, 'Content-Type': 'text/html'})
+
+
+def test_normalize_cache_url():
+    """Test normalisation clé de cache."""
+    assert normalize_cache_url("HTTPS://Example.CH/Contact/#top") == "https://example.ch/Contact"
+    assert normalize_cache_url("https://example.ch") == "https://example.ch/"
+
+
+def test_cache_hit_within_ttl(tmp_path):
+    """Test pas de requête réseau dans le TTL."""
+    handler = CountingHandler()
+    cache = ResponseCache(tmp_path, ttl=3600)
+    http = HttpClientPool(transport=httpx.MockTransport(handler), cache=cache)
+
+    first = http.get("https://example.ch/contact")
+    second = http.get("https://example.ch/contact/")
+
+    assert len(handler.requests) == 1
+    assert second.text == first.text
+    assert second.extensions.get('from_cache') is True
+    assert http.is_cached("https://example.ch/contact")
+    assert cache.stats()['cache_hits'] == 1
+
+
+def test_cache_revalidation(tmp_path):
+    """Test revalidation conditionnelle après expiration."""
+    handler = CountingHandler()
+    cache = ResponseCache(tmp_path, ttl=0)
+    http = HttpClientPool(transport=httpx.MockTransport(handler), cache=cache)
+
+    http.get("https://example.ch")
+    response = http.get("https://example.ch")
+
+    assert len(handler.requests) == 2
+    assert handler.requests[1].headers['If-None-Match'] == '"v1"'
+    assert response.status_code == 200
+    assert "info@example.ch" in response.text
+    assert cache.stats()['cache_revalidated'] == 1
+
+
+def test_cache_offline(tmp_path):
+    """Test mode hors-ligne: cache seul, erreur si absent."""
+    handler = CountingHandler()
+    online = HttpClientPool(transport=httpx.MockTransport(handler),
+                            cache=ResponseCache(tmp_path, ttl=0))
+    online.get("https://example.ch")
+
+    offline = HttpClientPool(transport=httpx.MockTransport(handler),
+                             cache=ResponseCache(tmp_path, ttl=0, offline=True))
+    assert offline.get("https://example.ch").status_code == 200
+    with pytest.raises(CacheMissError):
+        offline.get("https://other.ch")
+    assert len(handler.requests) == 1
+
+
+def test_cache_content_addressed(tmp_path):
+    """Test corps identiques stockés une seule fois."""
+    handler = CountingHandler()
+    http = HttpClientPool(transport=httpx.MockTransport(handler),
+                          cache=ResponseCache(tmp_path))
+
+    http.get("https://example.ch/a")
+    http.get("https://example.ch/b")
+
+    assert len(list((tmp_path / 'bodies').iterdir())) == 1
+    assert len(list((tmp_path / 'entries').iterdir())) == 2
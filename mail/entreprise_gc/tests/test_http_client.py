@@ -0,0 +1,124 @@
+"""
+Tests pour le pool HTTP partagé.
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from src.utils.http_client import HttpClientPool, USER_AGENT
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b"<html>ok</html>"
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Fixture: serveur HTTP local keep-alive."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_shared_headers():
+    """Test headers communs envoyés par le pool."""
+    seen = {}
+
+    def handler(request):
+        seen.update(request.headers)
+        return httpx.Response(200, text="ok")
+
+    with HttpClientPool(transport=httpx.MockTransport(handler)) as http:
+        response = http.get("https://example.ch")
+
+    assert response.status_code == 200
+    assert seen['user-agent'] == USER_AGENT
+    assert 'fr-FR' in seen['accept-language']
+
+
+def test_connection_reuse(local_server):
+    """Test réutilisation de la connexion keep-alive."""
+    with HttpClientPool() as http:
+        for path in ['/', '/contact', '/impressum']:
+            assert http.get(local_server + path).status_code == 200
+        stats = http.stats()
+        domain_stats = http.domain_stats
+
+    assert stats['requests'] == 3
+    assert stats['connections_opened'] == 1
+    assert stats['connections_reused'] == 2
+    (host_stats,) = domain_stats.values()
+    assert host_stats['requests'] == 3 and host_stats['bytes'] > 0
+
+
+def test_http2_without_h2(monkeypatch):
+    """Test fallback HTTP/1.1 si h2 absent."""
+    import builtins
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name == 'h2':
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, '__import__', fake_import)
+    assert HttpClientPool(http2=True).http2 is False
+
+
+class _ChunkStream(httpx.SyncByteStream):
+    """Corps en flux qui compte les morceaux lus."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.read = 0
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+
+def test_streaming_byte_cap(tmp_path):
+    """Test lecture arrêtée au budget, corps tronqué non mis en cache."""
+    from src.utils.http_cache import ResponseCache
+
+    stream = _ChunkStream([b"<p>" + b"x" * 1000] * 100)
+    handler = lambda request: httpx.Response(200, headers={'Content-Type': 'text/html'}, stream=stream)
+    cache = ResponseCache(tmp_path)
+    http = HttpClientPool(transport=httpx.MockTransport(handler), cache=cache)
+
+    response = http.get("https://example.ch", max_bytes=2500, content_types=('text/html',))
+
+    assert len(response.content) == 2500
+    assert response.extensions['truncated'] is True
+    assert stream.read == 3
+    assert cache.lookup("https://example.ch") is None
+    assert http.stats()['truncated'] == 1
+
+
+def test_streaming_content_type_gate():
+    """Test corps non téléchargé si Content-Type refusé."""
+    from src.utils.http_client import ContentTypeError
+
+    stream = _ChunkStream([b"%PDF-1.4"] * 10)
+    handler = lambda request: httpx.Response(200, headers={'Content-Type': 'application/pdf'}, stream=stream)
+    http = HttpClientPool(transport=httpx.MockTransport(handler))
+
+    with pytest.raises(ContentTypeError):
+        http.get("https://example.ch/brochure", content_types=('text/html',))
+    assert stream.read == 0
+    assert http.get("https://example.ch/ok").status_code == 200
@@ -0,0 +1,70 @@
+"""
+Tests pour l'instrumentation du pipeline.
+"""
+import json
+
+import pandas as pd
+
+from src.utils.instrumentation import RunReport, instrumented_stage, measure
+
+
+@instrumented_stage('filtre')
+def _keep_first_two(df):
+    return df.head(2)
+
+
+def test_instrumented_stage_records_rows():
+    """Test mesures cumulées par étape (appels répétés = une entrée)."""
+    df = pd.DataFrame({'a': range(5)})
+
+    # Hors rapport actif: aucune mesure, résultat inchangé
+    assert len(_keep_first_two(df)) == 2
+
+    with RunReport(run_id='test') as report:
+        _keep_first_two(df)
+        _keep_first_two(df)
+        with measure('dedup', rows_in=3) as stage:
+            stage['rows_out'] = 1
+
+    assert [s['stage'] for s in report.stages] == ['filtre', 'dedup']
+    filtre = report.stages[0]
+    assert filtre['calls'] == 2
+    assert (filtre['rows_in'], filtre['rows_out']) == (10, 4)
+    assert filtre['wall_s'] >= 0 and filtre['cpu_s'] >= 0
+
+
+@instrumented_stage('export')
+def _write_paths(df):
+    return ['out.csv', 'out.jsonl']
+
+
+def test_rows_counted_only_for_frames():
+    """Test lignes de sortie: une liste de chemins ou un dict de compteurs n'en compte pas."""
+    with RunReport(run_id='test') as report:
+        _write_paths(pd.DataFrame({'a': range(5)}))
+
+    export = report.stages[0]
+    assert export['rows_in'] == 5
+    assert export['rows_out'] is None
+
+
+def test_run_report_json_and_summary(tmp_path):
+    """Test rapport JSON (domaines cumulés) et tableau résumé."""
+    report = RunReport(run_id='test')
+    with report.stage('crawl', rows_in=1):
+        pass
+    report.add_domain_stats({'example.ch': {'requests': 2, 'bytes': 2048, 'latency_s': 0.5,
+                                            'max_latency_s': 0.4, 'cache_hits': 1}})
+    report.add_domain_stats({'example.ch': {'retries': 1, 'max_latency_s': 0.1}})
+
+    path = tmp_path / 'run_report.json'
+    report.write(path)
+    data = json.loads(path.read_text(encoding='utf-8'))
+
+    domain = data['crawl']['domains']['example.ch']
+    assert domain['requests'] == 2 and domain['retries'] == 1
+    assert domain['max_latency_s'] == 0.4
+    assert data['stages'][0]['stage'] == 'crawl'
+
+    summary = report.summary()
+    assert 'crawl' in summary and 'example.ch' in summary
@@ -63,3 +63,98 @@ def test_classification_consistency():
         computed = classify_tag_gc(text)
         assert computed == expected_tag, f"Text: {text}, Expected: {expected_tag}, Got: {computed}"
 
+
+
+def test_run_streaming_appends_batches(tmp_path):
+    """Test pipeline par lots: sortie écrite au fur et à mesure, doublons inter-lots écartés."""
+    from src.pipeline import run_streaming
+
+    batches = [
+        pd.DataFrame([{'company_name': 'Ponts SA', 'canton': 'VD', 'ville': 'Lausanne',
+                       'site_web': 'ponts.ch', 'email': None, 'specialites': 'Génie civil'}]),
+        pd.DataFrame([{'company_name': 'Ponts SA', 'canton': 'VD', 'ville': 'Lausanne',
+                       'site_web': 'https://www.ponts.ch', 'email': None, 'specialites': None},
+                      {'company_name': 'Archi Sàrl', 'canton': 'GE', 'ville': 'Genève',
+                       'site_web': None, 'email': None, 'specialites': 'Architecture'}]),
+    ]
+    output = tmp_path / 'out.csv'
+
+    assert run_streaming(iter(batches), output, no_crawl=True) == 2
+
+    result = pd.read_csv(output)
+    assert result['company_name'].tolist() == ['Ponts SA', 'Archi Sàrl']
+    assert result['tag_gc'].tolist() == [1, 0]
+
+
+def test_run_streaming_keeps_rows_on_interruption(tmp_path):
+    """Test interruption en cours de run: les lots déjà écrits restent dans la sortie."""
+    from src.pipeline import run_streaming
+
+    def batches():
+        yield pd.DataFrame([{'company_name': 'Ponts SA', 'canton': 'VD', 'ville': 'Lausanne',
+                             'site_web': 'ponts.ch', 'email': None, 'specialites': 'Génie civil'}])
+        yield pd.DataFrame([{'company_name': 'Archi Sàrl', 'canton': 'GE', 'ville': 'Genève',
+                             'site_web': None, 'email': None, 'specialites': 'Architecture'}])
+        raise KeyboardInterrupt
+
+    output = tmp_path / 'out.csv'
+
+    with pytest.raises(KeyboardInterrupt):
+        run_streaming(batches(), output, no_crawl=True, formats=['csv', 'jsonl'])
+
+    assert pd.read_csv(output)['company_name'].tolist() == ['Ponts SA', 'Archi Sàrl']
+    assert len(pd.read_json(tmp_path / 'out.jsonl', lines=True)) == 2
+
+
+def test_run_streaming_shares_enricher_across_batches(tmp_path, monkeypatch):
+    """Test streaming: un seul SiteEnricher pour tous les lots (domaines morts conservés)."""
+    from src.crawler.site_enricher import SiteEnricher
+    from src.pipeline import run_streaming
+
+    enrichers = []
+
+    def fake_enrich(self, site_web, existing_email=None):
+        enrichers.append(self)
+        self.retry_policy.dead_domains.setdefault('mort.ch', 'dns')
+        return {'email': f"info@{site_web.split('//')[1]}", 'errors': []}
+
+    monkeypatch.setattr(SiteEnricher, 'enrich_site', fake_enrich)
+    batches = [
+        pd.DataFrame([{'company_name': name, 'canton': 'VD', 'ville': 'Lausanne',
+                       'site_web': f'https://{name.split()[0].lower()}.ch', 'email': None,
+                       'specialites': 'Génie civil'}])
+        for name in ('Ponts SA', 'Tunnels Sàrl', 'Hydro Ingénieurs')
+    ]
+
+    assert run_streaming(iter(batches), tmp_path / 'out.csv') == 3
+
+    assert len(enrichers) == 3 and len(set(map(id, enrichers))) == 1
+    assert enrichers[0].retry_policy.stats()['dead_domains'] == 1
+
+
+def test_run_streaming_aligns_columns_across_batches(tmp_path, monkeypatch):
+    """Test streaming: un lot sans specialites garde les colonnes de l'en-tête."""
+    from src.crawler.site_enricher import SiteEnricher
+    from src.pipeline import run_streaming
+
+    def fake_enrich(self, site_web, existing_email=None):
+        if 'ponts' in site_web:
+            return {'email': 'info@ponts.ch', 'specialites': 'Génie civil', 'errors': []}
+        return {'errors': []}
+
+    monkeypatch.setattr(SiteEnricher, 'enrich_site', fake_enrich)
+    batches = [
+        pd.DataFrame([{'company_name': 'Ponts SA', 'canton': 'VD', 'ville': 'Lausanne',
+                       'site_web': 'https://ponts.ch', 'email': None}]),
+        pd.DataFrame([{'company_name': 'Archi Sàrl', 'canton': 'GE', 'ville': 'Genève',
+                       'site_web': 'https://archi.ch', 'email': 'formulaire'}]),
+    ]
+    output = tmp_path / 'out.csv'
+
+    assert run_streaming(iter(batches), output, formats=['csv', 'jsonl']) == 2
+
+    result = pd.read_csv(output)
+    assert result['specialites'].tolist()[0] == 'Génie civil'
+    assert pd.isna(result['specialites'][1]) and pd.isna(result['source_url'][1])
+    assert result['tag_gc'].tolist() == [1, 0]
+    assert pd.read_json(tmp_path / 'out.jsonl', lines=True)['tag_gc'].tolist() == [1, 0]
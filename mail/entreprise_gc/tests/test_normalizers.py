@@ -52,3 +52,23 @@ def test_normalize_text_empty():
     assert normalize_text("") == ""
     assert normalize_text(None) == ""
 
+
+
+def test_column_normalizers_match_scalar():
+    """Test versions colonne identiques aux fonctions scalaires."""
+    import pandas as pd
+    from src.utils.normalizers import (extract_main_words, extract_main_words_normalized,
+                                       normalize_company_names, normalize_texts, normalize_urls)
+
+    names = pd.Series(["Bureau  Müller & Fils SA", None, "Société anonyme du Léman", "Bureau  Müller & Fils SA", ""])
+    urls = pd.Series(["http://example.ch/?utm_source=x#top", None, "www.test.ch/"])
+    texts = pd.Series(["  Génie\ncivil  ", None, 41.0])
+
+    normalized = normalize_company_names(names)
+    assert normalized.tolist() == [normalize_company_name(n) if pd.notna(n) else "" for n in names]
+    assert extract_main_words_normalized(normalized).tolist() == [
+        extract_main_words(n) if pd.notna(n) else "" for n in names
+    ]
+    assert normalize_urls(urls).equals(urls.apply(normalize_url))
+    assert normalize_texts(texts).equals(texts.apply(lambda x: normalize_text(str(x)) if pd.notna(x) else None))
+    assert normalize_texts(texts)[2] == "41.0"
@@ -68,3 +68,32 @@ def test_extract_emails_empty():
     emails = extract_emails("")
     assert emails == []
 
+
+
+def test_extract_phones_formats():
+    """Test formats suisses (national, 0041, (0), séparateurs), sans suites de chiffres."""
+    text = "Tél. 021 123 45 67, fax 0041 (0)22/345.67.89, mobile +41 79 123-45-67, réf. 00210123456789"
+    assert extract_phones(text) == ['+41 21 123 45 67', '+41 22 345 67 89', '+41 79 123 45 67']
+
+
+def test_scan_contacts_offsets():
+    """Test scan unique: emails, obfuscation et offsets (octets pour un buffer bytes)."""
+    from src.utils.regex_patterns import extract_contacts, scan_contacts
+
+    text = "Café: info@Exemple.ch, bureau [AT] exemple.ch, +41 21 123 45 67, info@exemple.ch"
+    hits = list(scan_contacts(text))
+    assert [(h.kind, h.value, h.obfuscated) for h in hits] == [
+        ('email', 'info@exemple.ch', False),
+        ('email', 'bureau@exemple.ch', True),
+        ('phone', '+41 21 123 45 67', False),
+        ('email', 'info@exemple.ch', False),
+    ]
+    assert text[hits[0].start:hits[0].end] == "info@Exemple.ch"
+
+    raw = text.encode('utf-8')
+    first = next(scan_contacts(raw))
+    assert raw[first.start:first.end] == b"info@Exemple.ch"
+    assert first.start == hits[0].start + 1  # "é" = 2 octets
+
+    assert extract_contacts(text) == {'emails': ['info@exemple.ch', 'bureau@exemple.ch'],
+                                      'phones': ['+41 21 123 45 67']}
@@ -0,0 +1,111 @@
+"""
+Tests pour la politique de retry selon le type d'échec.
+"""
+import httpx
+import pytest
+from src.utils.retry_policy import (PERMANENT, TRANSIENT, DeadDomainError, RetryPolicy,
+                                    classify_failure, domain_failure, retry_after)
+
+
+def status_error(status_code: int, headers=None) -> httpx.HTTPStatusError:
+    """Construit une HTTPStatusError factice."""
+    request = httpx.Request('GET', 'https://example.ch/contact')
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError(f"{status_code}", request=request, response=response)
+
+
+def test_classify_failure():
+    """Test échecs permanents vs transitoires."""
+    assert classify_failure(status_error(404)) == PERMANENT
+    assert classify_failure(status_error(410)) == PERMANENT
+    assert classify_failure(status_error(503)) == TRANSIENT
+    assert classify_failure(httpx.ConnectTimeout("timeout")) == TRANSIENT
+    assert classify_failure(httpx.ConnectError("[Errno -2] Name or service not known")) == PERMANENT
+    assert retry_after(status_error(429, {'Retry-After': '7'})) == 7
+
+
+def test_permanent_failure_not_retried():
+    """Test 404 sans retry ni attente."""
+    policy = RetryPolicy(max_attempts=3)
+    calls = []
+
+    def fetch(url):
+        calls.append(url)
+        raise status_error(404)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        policy.call(fetch, 'https://example.ch/contact', domain='example.ch')
+    assert len(calls) == 1
+    assert not policy.is_dead('example.ch')
+
+
+def test_transient_failure_retry_after():
+    """Test 429 retenté selon Retry-After, retries gaspillés comptés."""
+    policy = RetryPolicy(max_attempts=2)
+    calls = []
+
+    def fetch(url):
+        calls.append(url)
+        raise status_error(429, {'Retry-After': '0'})
+
+    with pytest.raises(httpx.HTTPStatusError):
+        policy.call(fetch, 'https://example.ch', domain='example.ch')
+    assert len(calls) == 2
+    assert policy.stats()['wasted_retries'] == 1
+
+
+def test_dns_failure_marks_domain_dead():
+    """Test domaine mort après échec DNS: requêtes suivantes court-circuitées."""
+    policy = RetryPolicy(max_attempts=3)
+    calls = []
+
+    def fetch(url):
+        calls.append(url)
+        raise httpx.ConnectError("[Errno -2] Name or service not known")
+
+    with pytest.raises(httpx.ConnectError):
+        policy.call(fetch, 'https://dead.ch', domain='dead.ch')
+    with pytest.raises(DeadDomainError):
+        policy.call(fetch, 'https://dead.ch/contact', domain='dead.ch')
+
+    assert len(calls) == 1
+    assert policy.stats()['short_circuited'] == 1
+
+
+def test_dns_resolver_hiccup_is_transient():
+    """Test EAI_AGAIN retenté sans marquer le domaine mort, NXDOMAIN permanent."""
+    policy = RetryPolicy(max_attempts=2, min_wait=0, max_wait=0)
+    calls = []
+
+    def fetch(url):
+        calls.append(url)
+        if len(calls) == 1:
+            raise httpx.ConnectError("[Errno -3] Temporary failure in name resolution")
+        return 'ok'
+
+    assert policy.call(fetch, 'https://flaky.ch', domain='flaky.ch') == 'ok'
+    assert len(calls) == 2
+    assert not policy.is_dead('flaky.ch')
+
+    nxdomain = httpx.ConnectError("[Errno -5] No address associated with hostname")
+    assert classify_failure(nxdomain) == PERMANENT
+    assert domain_failure(nxdomain) == 'dns'
+
+
+def test_acall_awaits_lambda_coroutine():
+    """Test acall: lambda renvoyant une coroutine attendue et retentée."""
+    import asyncio
+    policy = RetryPolicy(max_attempts=2, min_wait=0, max_wait=0)
+    calls = []
+
+    async def fetch(url):
+        calls.append(url)
+        if len(calls) == 1:
+            raise status_error(503)
+        return 'ok'
+
+    result = asyncio.run(policy.acall(lambda u: fetch(u), 'https://example.ch', domain='example.ch'))
+
+    assert result == 'ok'
+    assert len(calls) == 2
+    assert policy.retries == 1
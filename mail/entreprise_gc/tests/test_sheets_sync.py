@@ -0,0 +1,119 @@
+"""
+Tests pour la synchronisation Google Sheets (faux backend local).
+"""
+import pandas as pd
+import pytest
+
+from src.config import load_sheets_config
+from src.sheets_sync import SheetSync, column_letter
+
+from .fake_gspread import FakeAPIError, FakeWorksheet
+
+
+def _companies():
+    return pd.DataFrame({
+        'company_name': ["Alpha SA", "Beta Sàrl", "Gamma AG"],
+        'canton': ["VD", "GE", "VD"],
+        'site_web': ["https://www.alpha.ch", None, "https://gamma.ch"],
+        'email': ["info@alpha.ch", None, None],
+        'tag_gc': [1, 0, 2]
+    })
+
+
+def _sync(worksheet, **options):
+    return SheetSync(worksheet, min_wait=0, max_wait=0, **options)
+
+
+def test_column_letter():
+    """Test notation A1 des colonnes."""
+    assert [column_letter(n) for n in (1, 26, 27, 52, 703)] == ['A', 'Z', 'AA', 'AZ', 'AAA']
+
+
+def test_initial_sync_writes_header_and_rows():
+    """Test feuille vide: en-tête puis toutes les lignes."""
+    worksheet = FakeWorksheet(rows=2)
+
+    stats = _sync(worksheet).sync(_companies())
+
+    values = worksheet.get_all_values()
+    assert values[0] == ['company_name', 'canton', 'site_web', 'email', 'tag_gc']
+    assert values[1] == ['Alpha SA', 'VD', 'https://www.alpha.ch', 'info@alpha.ch', '1']
+    assert values[2][2:4] == ['', '']
+    assert stats['appended'] == 3
+    assert worksheet.row_count == 4
+
+
+def test_resync_sends_only_changed_cells():
+    """Test second run: annotations conservées, seules les cellules modifiées envoyées."""
+    worksheet = FakeWorksheet(rows=10)
+    _sync(worksheet).sync(_companies())
+    # Annotation manuelle dans une colonne hors export
+    worksheet.batch_update([{'range': 'F1:F2', 'values': [['suivi'], ['appelé le 12.03']]}])
+    worksheet.updates.clear()
+    reads = worksheet.reads
+
+    df = _companies()
+    df.loc[2, 'email'] = "contact@gamma.ch"
+    df.loc[3] = ["Delta SA", "FR", "https://delta.ch", None, 1]
+    stats = _sync(worksheet).sync(df)
+
+    assert worksheet.reads == reads + 1
+    assert (stats['updated'], stats['unchanged'], stats['appended']) == (1, 2, 1)
+    ranges = [item['range'] for batch in worksheet.updates for item in batch]
+    assert ranges == ['D4:D4', 'A5:E5']
+    values = worksheet.get_all_values()
+    assert values[1][5] == 'appelé le 12.03'
+    assert values[3][3] == 'contact@gamma.ch'
+
+
+def test_key_matches_domain_and_normalized_name():
+    """Test clé: même domaine malgré un nom modifié, nom normalisé sans site."""
+    worksheet = FakeWorksheet([
+        ['company_name', 'canton', 'site_web', 'email', 'tag_gc'],
+        ['Alpha Ingénieurs SA', 'VD', 'http://alpha.ch/', 'info@alpha.ch', '1'],
+        ['BETA SARL', 'GE', '', '', '0'],
+    ])
+
+    stats = _sync(worksheet).plan(_companies()).stats()
+
+    assert (stats['updated'], stats['appended']) == (2, 1)
+
+
+def test_batches_respect_limits():
+    """Test découpage des requêtes par nombre de cellules."""
+    worksheet = FakeWorksheet(rows=1)
+    df = pd.DataFrame({'company_name': [f"Bureau {i}" for i in range(100)],
+                       'canton': ["VD"] * 100})
+
+    stats = _sync(worksheet, max_cells=50).sync(df)
+
+    assert stats['requests'] >= 5
+    assert all(sum(len(item['values']) * len(item['values'][0]) for item in batch) <= 50
+               for batch in worksheet.updates)
+    assert len(worksheet.get_all_values()) == 101
+
+
+def test_retry_on_rate_limit():
+    """Test 429 retenté, autres erreurs propagées."""
+    worksheet = FakeWorksheet(fail_statuses=[429, 429])
+    stats = _sync(worksheet).sync(_companies())
+    assert stats['retries'] == 2
+    assert len(worksheet.get_all_values()) == 4
+
+    worksheet = FakeWorksheet(fail_statuses=[403])
+    with pytest.raises(FakeAPIError):
+        _sync(worksheet).sync(_companies())
+
+
+def test_load_sheets_config(tmp_path, monkeypatch):
+    """Test configuration: fichier puis variables d'environnement."""
+    monkeypatch.delenv('GC_SPREADSHEET_ID', raising=False)
+    monkeypatch.delenv('GC_WORKSHEET', raising=False)
+    path = tmp_path / 'sheets.json'
+    assert load_sheets_config(path)['spreadsheet_id'] is None
+
+    path.write_text('{"spreadsheet_id": "abc", "worksheet": "GC"}', encoding='utf-8')
+    assert load_sheets_config(path) == {'spreadsheet_id': 'abc', 'worksheet': 'GC'}
+
+    monkeypatch.setenv('GC_SPREADSHEET_ID', 'xyz')
+    assert load_sheets_config(path)['spreadsheet_id'] == 'xyz'
@@ -0,0 +1,40 @@
+"""
+Tests pour le parseur PDF SIA Vaud (extraction parallèle et cache).
+"""
+from benchmarks.bench_pdf import make_directory_pdf
+from src.sources import sia_pdf_vaud
+from src.sources.sia_pdf_vaud import extract_page_texts, parse_sia_pdf_vaud
+
+
+def test_parallel_extraction_keeps_page_order(tmp_path, monkeypatch):
+    """Test extraction par tranches sur 2 processus: mêmes entrées, dans l'ordre des pages."""
+    pdf_path = str(make_directory_pdf(tmp_path / 'sia.pdf', n_pages=6, per_page=2))
+    monkeypatch.setattr(sia_pdf_vaud, 'PAGES_PER_SHARD', 2)
+
+    serial = parse_sia_pdf_vaud(pdf_path)
+    parallel = parse_sia_pdf_vaud(pdf_path, workers=2)
+
+    assert len(serial) > 0
+    assert parallel.astype(object).equals(serial.astype(object))
+    pages = [int(url.rsplit('=', 1)[1]) for url in parallel['source_url']]
+    assert pages == sorted(pages) and pages[-1] == 6
+
+
+def test_page_text_cache(tmp_path, monkeypatch):
+    """Test cache par empreinte: re-run sans extraction, invalidé si le PDF change."""
+    pdf_path = str(make_directory_pdf(tmp_path / 'sia.pdf', n_pages=3))
+    cache_dir = tmp_path / 'cache'
+
+    texts = extract_page_texts(pdf_path, cache_dir=cache_dir)
+    assert len(texts) == 3 and "info@" in texts[0]
+    assert len(list(cache_dir.glob('*.json'))) == 1
+
+    def no_extraction(*args):
+        raise AssertionError("extraction relancée")
+
+    monkeypatch.setattr(sia_pdf_vaud, '_extract_range', no_extraction)
+    assert extract_page_texts(pdf_path, cache_dir=cache_dir) == texts
+
+    monkeypatch.undo()
+    make_directory_pdf(tmp_path / 'sia.pdf', n_pages=4)
+    assert len(extract_page_texts(pdf_path, cache_dir=cache_dir)) == 4
@@ -0,0 +1,174 @@
+"""
+Tests pour le crawler SiteEnricher (sans réseau).
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+from src.crawler.site_enricher import SiteEnricher
+
+
+def make_response(url: str, html: str, status_code: int = 200) -> httpx.Response:
+    """Construit une réponse httpx factice."""
+    return httpx.Response(status_code, text=html, request=httpx.Request('GET', url))
+
+
+def test_enrich_site_homepage_email(monkeypatch):
+    """Test email trouvé sur la page d'accueil."""
+    enricher = SiteEnricher(rate_limit=0)
+
+    def fake_fetch(url):
+        return make_response(url, "<html><body>Contact: info@example.ch</body></html>")
+
+    monkeypatch.setattr(enricher, '_fetch_url', fake_fetch)
+
+    result = enricher.enrich_site('https://example.ch')
+    assert result['email'] == 'info@example.ch'
+    assert result['errors'] == []
+
+
+def test_enrich_site_skip_existing_email():
+    """Test pas de crawl si email déjà connu."""
+    enricher = SiteEnricher()
+    result = enricher.enrich_site('https://example.ch', 'info@example.ch')
+    assert result == {'source_url': 'https://example.ch'}
+
+
+def test_enrich_many_async_parallel_domains(monkeypatch):
+    """Test crawl parallèle de domaines différents."""
+    enricher = SiteEnricher(rate_limit=0)
+
+    async def fake_fetch(url):
+        await asyncio.sleep(0.1)
+        return make_response(url, f"<p>info@{httpx.URL(url).host}</p>")
+
+    monkeypatch.setattr(enricher, '_fetch_url_async', fake_fetch)
+
+    items = [(f"https://site{i}.ch", None) for i in range(5)]
+    start = time.time()
+    results = enricher.enrich_many(items, concurrency=5)
+    elapsed = time.time() - start
+
+    assert [r['email'] for r in results] == [f"info@site{i}.ch" for i in range(5)]
+    assert elapsed < 0.4
+
+
+def test_enrich_many_async_rate_limit_per_domain(monkeypatch):
+    """Test rate limit respecté pour un même domaine."""
+    enricher = SiteEnricher(rate_limit=0.2, use_robots=False)
+    request_times = []
+
+    async def fake_fetch(url):
+        request_times.append(time.time())
+        return make_response(url, "<p>info@example.ch</p>")
+
+    monkeypatch.setattr(enricher, '_fetch_url_async', fake_fetch)
+
+    items = [("https://example.ch", None), ("https://www.example.ch/fr", None)]
+    enricher.enrich_many(items, concurrency=2)
+
+    assert len(request_times) == 2
+    assert request_times[1] - request_times[0] >= 0.19
+
+
+def test_enrich_many_parse_workers(monkeypatch):
+    """Test parsing délégué au pool de processus."""
+    enricher = SiteEnricher(rate_limit=0, parse_workers=2, parse_queue_size=1)
+
+    async def fake_fetch(url):
+        return make_response(url, f"<p>info@{httpx.URL(url).host}</p>")
+
+    monkeypatch.setattr(enricher, '_fetch_url_async', fake_fetch)
+
+    items = [(f"https://site{i}.ch", None) for i in range(4)]
+    results = enricher.enrich_many(items, concurrency=4)
+
+    assert [r['email'] for r in results] == [f"info@site{i}.ch" for i in range(4)]
+    stats = enricher.parse_stats()
+    assert stats['pages_parsed'] == 4
+    assert 0 < stats['parse_max_ms'] <= 1000 * stats['parse_seconds']
+    assert enricher._parse_pool is None
+
+
+def test_enrich_many_parse_queue_bounded(monkeypatch):
+    """Test file de parsing bornée: pleine, les fetchs suivants attendent."""
+    from concurrent.futures import ThreadPoolExecutor
+    from src.crawler import site_enricher
+
+    def slow_extract(html, base_url):
+        time.sleep(0.02)
+        return extract_page(html, base_url)
+
+    extract_page = site_enricher.extract_page
+    # Pool de threads: extract_page remplacé visible par les workers
+    monkeypatch.setattr(site_enricher, 'ProcessPoolExecutor', ThreadPoolExecutor)
+    monkeypatch.setattr(site_enricher, 'extract_page', slow_extract)
+    enricher = SiteEnricher(rate_limit=0, parse_workers=1, parse_queue_size=2, use_robots=False)
+    queued = []
+
+    async def fake_fetch(url, kind=None):
+        queued.append(enricher._parse_queue.qsize())
+        return make_response(url, f"<p>info@{httpx.URL(url).host}</p>")
+
+    monkeypatch.setattr(enricher, '_fetch_url_async', fake_fetch)
+
+    items = [(f"https://site{i}.ch", None) for i in range(12)]
+    results = enricher.enrich_many(items, concurrency=12)
+
+    assert [r['email'] for r in results] == [f"info@site{i}.ch" for i in range(12)]
+    assert max(queued) == 2
+    assert enricher._parse_queue is None
+
+
+def test_enrich_site_follows_contact_links(monkeypatch):
+    """Test pages de contact découvertes via les liens, sans sondage à l'aveugle."""
+    enricher = SiteEnricher(rate_limit=0, use_robots=False)
+    fetched = []
+
+    def fake_fetch(url):
+        fetched.append(url)
+        if url == 'https://example.ch':
+            return make_response(url, '<a href="/fr/projets">Projets</a>'
+                                      '<a href="/fr/nous-joindre">Contact</a>')
+        return make_response(url, "<p>info@example.ch</p>")
+
+    monkeypatch.setattr(enricher, '_fetch_url', fake_fetch)
+
+    result = enricher.enrich_site('https://example.ch')
+    assert fetched == ['https://example.ch', 'https://example.ch/fr/nous-joindre']
+    assert result['source_url'] == 'https://example.ch/fr/nous-joindre'
+
+
+def test_enrich_site_probes_without_links(monkeypatch):
+    """Test repli sur les chemins usuels si aucun lien candidat."""
+    enricher = SiteEnricher(rate_limit=0, use_robots=False)
+    fetched = []
+
+    def fake_fetch(url):
+        fetched.append(url)
+        return make_response(url, "<p>Bienvenue</p>")
+
+    monkeypatch.setattr(enricher, '_fetch_url', fake_fetch)
+
+    result = enricher.enrich_site('https://example.ch')
+    assert fetched[1:] == [f"https://example.ch{path}" for path in enricher.contact_paths[:8]]
+    assert result['email'] == 'formulaire'
+
+
+def test_enrich_many_through_http_pool():
+    """Test chaîne async complète (pool HTTP, retry, robots) sur transport simulé."""
+    from src.utils.http_client import HttpClientPool
+
+    async def handler(request):
+        if request.url.path == '/':
+            return httpx.Response(200, headers={'Content-Type': 'text/html'},
+                                  text=f"<p>info@{request.url.host}</p>")
+        return httpx.Response(404)
+
+    http = HttpClientPool(async_transport=httpx.MockTransport(handler))
+    enricher = SiteEnricher(http=http, rate_limit=0)
+
+    results = enricher.enrich_many([("https://site1.ch", None), ("https://site2.ch", None)], concurrency=2)
+
+    assert [r['email'] for r in results] == ["info@site1.ch", "info@site2.ch"]
@@ -0,0 +1,60 @@
+"""
+Tests pour l'état d'enrichissement et les runs incrémentaux.
+"""
+import pandas as pd
+import pytest
+from src.crawler.site_enricher import SiteEnricher
+from src.crawler.state_store import EnrichmentStateStore, company_key
+from src.pipeline import crawl_and_enrich
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Fixture: state store temporaire."""
+    with EnrichmentStateStore(tmp_path / 'state.sqlite') as store:
+        yield store
+
+
+def test_company_key():
+    """Test clé domaine prioritaire sur le nom."""
+    assert company_key("https://www.example.ch/fr", "Example SA") == "domain:example.ch"
+    assert company_key(None, "Example SA") == "name:example"
+    assert company_key(None, None) is None
+
+
+def test_record_status(store):
+    """Test statut ok / échec."""
+    store.record("domain:ok.ch", "https://ok.ch", {'email': 'info@ok.ch', 'errors': ['/contact: 404']})
+    store.record("domain:ko.ch", "https://ko.ch", {'email': 'formulaire', 'errors': ['Homepage: timeout']})
+    store.record("domain:exc.ch", "https://exc.ch", RuntimeError("boom"))
+
+    assert store.is_fresh(store.get("domain:ok.ch"))
+    assert not store.is_fresh(store.get("domain:ko.ch"))
+    assert store.get("domain:exc.ch")['errors'] == ["boom"]
+    assert store.counts() == {'ok': 1, 'failed': 2}
+
+
+def test_incremental_crawl(store, monkeypatch):
+    """Test re-crawl limité aux entrées périmées ou en échec."""
+    crawled = []
+
+    def fake_enrich(self, site_web, existing_email=None):
+        crawled.append(site_web)
+        if 'down' in site_web:
+            return {'email': 'formulaire', 'errors': ['Homepage: timeout']}
+        return {'email': f"info@{site_web.split('//')[1]}", 'errors': []}
+
+    monkeypatch.setattr(SiteEnricher, 'enrich_site', fake_enrich)
+
+    df = pd.DataFrame([
+        {'company_name': 'A SA', 'site_web': 'https://a.ch', 'email': None},
+        {'company_name': 'Down SA', 'site_web': 'https://down.ch', 'email': None},
+    ])
+
+    crawl_and_enrich(df.copy(), state_store=store)
+    assert crawled == ['https://a.ch', 'https://down.ch']
+
+    crawled.clear()
+    result = crawl_and_enrich(df.copy(), state_store=store, incremental=True)
+    assert crawled == ['https://down.ch']
+    assert result.loc[0, 'email'] == 'info@a.ch'